@@ -62,7 +62,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'django.middleware.locale.LocaleMiddleware'
+    'django.middleware.locale.LocaleMiddleware',
+    'de.middleware.SessionLanguageMiddleware',
 ]
 
 ROOT_URLCONF = 'd.urls'
@@ -139,4 +140,63 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 SESSION_COOKIE_AGE = 1209600 
-SESSION_SAVE_EVERY_REQUEST = True
\ No newline at end of file
+SESSION_SAVE_EVERY_REQUEST = True
+
+# Chatbot
+# Load every language's chat dataset, and its BM25 index where that matcher
+# is selected, when the app starts instead of on the first chatbot request in
+# each worker.
+CHATBOT_PRELOAD = False
+# How unmatched chat messages are looked up, per language code: "difflib"
+# (character similarity over trigram candidates) or "bm25" (word-level
+# ranking, needs numpy and scipy; files backend only). "default" covers
+# unlisted languages. Batches posted to /de/api/chatbot/search/ are always
+# scored with BM25 on the files backend.
+CHATBOT_MATCHERS = {
+    'default': 'difflib',
+}
+# Answers cached per language, keyed by normalized message. The TTL is in
+# seconds; None keeps entries until they are evicted or the dataset changes.
+CHATBOT_CACHE_SIZE = 1024
+CHATBOT_CACHE_TTL = 3600
+# Where chatbot answers come from: "files" (the JSONL datasets or their
+# compiled indexes in de/data) or "database" (the CareerDataset table filled
+# by manage.py load_chat_dataset, searched through its FULLTEXT index).
+CHATBOT_BACKEND = 'files'
+# Chat messages are matched in a thread pool of CHATBOT_WORKERS threads; once
+# CHATBOT_MAX_QUEUE more are waiting, new messages get a 503.
+CHATBOT_WORKERS = 4
+CHATBOT_MAX_QUEUE = 64
+# Most messages one POST to /de/api/chatbot/search/ may score.
+CHATBOT_SEARCH_MAX_BATCH = 1000
+
+# UI string bundles
+# Seconds browsers and proxies may reuse /de/api/i18n/<lang>/<version>/. The
+# URL changes whenever a string does, so this can be long.
+I18N_BUNDLE_MAX_AGE = 31536000
+
+# Learner profiles
+# Seconds a learner's profile stays in the cache (de.profiles). save_profile
+# invalidates it; with the default per-process cache other workers may serve
+# the old profile until this expires, so use a shared CACHES backend in
+# production.
+PROFILE_CACHE_TTL = 300
+
+# Career explorer
+# Seconds a facet count for one filter combination stays cached. Saving or
+# deleting a Career drops them all (per process with the default cache).
+CAREER_FACET_CACHE_TTL = 600
+
+# Recommendations
+# The model written by manage.py build_recommender (de.recommendations). When
+# the file is missing, workers rank careers by direct skill overlap only,
+# without the career similarity term; run build_recommender to enable it.
+RECOMMENDER_MODEL_PATH = os.path.join(BASE_DIR, 'de', 'data', 'recommender.npz')
+# Seconds a learner's top careers stay cached. They are recomputed sooner when
+# the learner's skills or the model change.
+RECOMMENDATION_CACHE_TTL = 86400
+
+# Skills
+# Seconds each worker keeps its skill autocomplete index (de.skills) before
+# rebuilding it from the Skill and CareerSkill tables.
+SKILL_SUGGEST_TTL = 3600
@@ -1,6 +1,28 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class DeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'de'
+
+    def ready(self):
+        from django.core import checks
+        from django.db.models.signals import post_delete, post_save
+
+        from . import careers, chatbot
+        from .models import Career, CareerSkill
+
+        # Cached facet counts are keyed by a catalogue version; any change to
+        # the catalogue bumps it.
+        for model in (Career, CareerSkill):
+            post_save.connect(careers.invalidate, sender=model, dispatch_uid=f'careers-{model.__name__}-save')
+            post_delete.connect(careers.invalidate, sender=model, dispatch_uid=f'careers-{model.__name__}-delete')
+
+        checks.register(chatbot.check_matchers)
+
+        # Parsing the chat datasets is slow, so workers can opt into doing it
+        # at startup rather than on the first chatbot request.
+        if getattr(settings, 'CHATBOT_PRELOAD', False):
+            from .chatbot import store
+            store.preload()
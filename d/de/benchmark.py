@@ -0,0 +1,227 @@
+"""Synthetic corpora, query mixes and replays for ``manage.py bench_chatbot``."""
+import json
+import os
+import pickle
+import random
+import resource
+import time
+import traceback
+
+from django.conf import settings
+from django.db import connections
+
+from . import chat_index, chatbot
+from .chatbot import DATASET_FILES, MATCH_CUTOFF, Corpus
+
+# Consonants and dependent vowel signs per script, used to build pseudo-words
+# that exercise the same normalization and trigram paths as real text.
+SCRIPTS = {
+    "en": ("bcdfghjklmnpqrstvwxyz", "aeiou"),
+    "hi": ("".join(map(chr, range(0x0915, 0x093A))), "".join(map(chr, range(0x093E, 0x094D)))),
+    "bn": ("".join(map(chr, range(0x0995, 0x09BA))), "".join(map(chr, range(0x09BE, 0x09C5)))),
+    "gu": ("".join(map(chr, range(0x0A95, 0x0ABA))), "".join(map(chr, range(0x0ABE, 0x0AC6)))),
+    "ta": ("கஙசஞடணதநபமயரலவழளறன", "".join(map(chr, range(0x0BBE, 0x0BC3)))),
+}
+
+QUERY_KINDS = ("exact", "near", "miss")
+
+
+def vocabulary(lang, rng, size=5000):
+    consonants, vowels = SCRIPTS[lang]
+    words = set()
+    while len(words) < size:
+        syllables = rng.randint(1, 4)
+        words.add("".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables)))
+    return sorted(words)
+
+
+def sentence(words, rng, low, high):
+    # Zipf-like word choice: a few words are very common, most are rare.
+    n = len(words)
+    return " ".join(
+        words[min(int(rng.paretovariate(1.2)) - 1, n - 1)] if rng.random() < 0.5
+        else words[rng.randrange(n)]
+        for _ in range(rng.randint(low, high))
+    )
+
+
+def write_corpus(path, lang, rows, seed=0):
+    """Write ``rows`` synthetic question/answer lines in the dataset format."""
+    rng = random.Random(f"{seed}-{lang}")
+    words = vocabulary(lang, rng)
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(rows):
+            entry = {
+                "user": sentence(words, rng, 4, 12).capitalize() + "?",
+                "assistant": sentence(words, rng, 15, 40).capitalize() + ".",
+            }
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def write_corpora(directory, rows, languages=None, seed=0):
+    paths = {}
+    for lang in languages or DATASET_FILES:
+        paths[lang] = os.path.join(directory, DATASET_FILES[lang])
+        write_corpus(paths[lang], lang, rows, seed)
+    return paths
+
+
+def perturb(text, rng):
+    """Return a near-miss of ``text``: a dropped word plus a couple of typos."""
+    words = text.split()
+    if len(words) > 3:
+        del words[rng.randrange(len(words))]
+    chars = list(" ".join(words))
+    for _ in range(2):
+        if len(chars) > 1:
+            i = rng.randrange(len(chars) - 1)
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    return "".join(chars)
+
+
+def query_mix(corpus, lang, count, mix, rng):
+    """``count`` ``(kind, message)`` pairs drawn in the proportions of ``mix``.
+
+    exact: a corpus question with its case and trailing punctuation changed.
+    near: a corpus question with a word dropped and two typos.
+    miss: fresh pseudo-words that are not a corpus question.
+    """
+    words = vocabulary(lang, random.Random(f"miss-{lang}"))
+    kinds = rng.choices(QUERY_KINDS, weights=[mix[kind] for kind in QUERY_KINDS], k=count)
+    queries = []
+    for kind in kinds:
+        question = corpus.questions[rng.randrange(len(corpus))]
+        if kind == "exact":
+            message = question.upper().rstrip("?") + " ?"
+        elif kind == "near":
+            message = perturb(question, rng)
+        else:
+            message = sentence(words, rng, 4, 12)
+        queries.append((kind, message))
+    return queries
+
+
+def baseline_answer(corpus, message):
+    """What chatbot_response answered before any index: a full difflib scan."""
+    message = message.lower().strip()
+    for i, question in enumerate(corpus.questions):
+        if question == message:
+            return corpus.answers[i]
+    index, ratio = corpus.scan_match(message)
+    return corpus.answers[index] if index is not None and ratio > MATCH_CUTOFF else None
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def peak_rss_mb():
+    """Peak RSS of this process so far; ru_maxrss is in kilobytes on Linux."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def isolated(func, *args):
+    """Run ``func(*args)`` in a forked child; returns ``(result, child peak RSS MB)``.
+
+    ru_maxrss is a high-water mark for the whole process, so measured in one
+    process every configuration after the largest would just repeat its
+    peak. A child starts from this process's current resident set, so
+    compare the result with that of a child that does nothing.
+    """
+    # The child opens its own database connection if it needs one.
+    connections.close_all()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_fd)
+            with os.fdopen(write_fd, "wb") as f:
+                pickle.dump(func(*args), f)
+            status = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            os._exit(status)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        data = f.read()
+    _, status, usage = os.wait4(pid, 0)
+    if status != 0:
+        raise RuntimeError(f"benchmark child {pid} failed")
+    return pickle.loads(data), usage.ru_maxrss / 1024
+
+
+def prepare(path, lang, options):
+    """Load a corpus, draw its queries and answer some with the full scan."""
+    started = time.perf_counter()
+    corpus = Corpus.from_jsonl(path)
+    load_seconds = time.perf_counter() - started
+    if not len(corpus):
+        return {"rows": 0}
+    rng = random.Random(f"{options['seed']}-{lang}")
+    queries = query_mix(corpus, lang, options["queries"], options["mix"], rng)
+    baseline, baseline_ms = [], []
+    for _, message in queries[:options["baseline_queries"]]:
+        started = time.perf_counter()
+        baseline.append(baseline_answer(corpus, message))
+        baseline_ms.append((time.perf_counter() - started) * 1000)
+    return {
+        "rows": len(corpus), "load_seconds": load_seconds, "queries": queries,
+        "baseline": baseline, "baseline_ms": baseline_ms,
+    }
+
+
+def corpus_source(corpus):
+    if isinstance(corpus, chatbot.DatabaseCorpus):
+        return "database"
+    return "index" if isinstance(corpus.exact, chat_index.SortedLookup) else "jsonl"
+
+
+def timed_answers(queries, lang, before=None):
+    """Answer ``queries`` through ``chatbot.answer``; ``(latencies by kind, answers)``."""
+    latencies = {kind: [] for kind in QUERY_KINDS}
+    answers = []
+    for kind, message in queries:
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        response = chatbot.answer(message, lang)
+        latencies[kind].append((time.perf_counter() - started) * 1000)
+        answers.append(None if response == chatbot.FALLBACK_RESPONSE else response)
+    return latencies, answers
+
+
+def replay(directory, lang, matcher, backend, queries):
+    """Answer ``queries`` the way chatbot_response does, uncached and then cached.
+
+    Goes through ``chatbot.answer``, so the corpus comes from CorpusStore (the
+    compiled ``.idx`` when it is fresh, else the JSONL) or from the
+    CareerDataset table, and every answer passes through AnswerCache. Meant
+    to run in its own process (see ``isolated``): it changes settings.
+    """
+    chatbot.DATA_DIR = directory
+    settings.CHATBOT_BACKEND = backend
+    settings.CHATBOT_MATCHERS = {"default": matcher}
+    settings.CHATBOT_CACHE_SIZE = max(len(queries), 1)
+    settings.CHATBOT_CACHE_TTL = None
+
+    started = time.perf_counter()
+    _, corpus, _ = chatbot._corpus(lang)
+    if matcher == "bm25" and backend == "files":
+        corpus.bm25
+    load_seconds = time.perf_counter() - started
+    cache = chatbot.answer_cache.for_corpus(lang, corpus)
+
+    # Cache misses: the cache is emptied before every message.
+    miss, answers = timed_answers(queries, lang, before=cache.clear)
+    # Cache hits: every message has been answered once already.
+    timed_answers(queries, lang)
+    hit, _ = timed_answers(queries, lang)
+    return {
+        "source": corpus_source(corpus), "load_seconds": load_seconds,
+        "miss": miss, "hit": hit, "answers": answers,
+    }
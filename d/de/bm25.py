@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+from scipy import sparse
+
+
+class BM25Index:
+    """Okapi BM25 over a sparse term-document matrix.
+
+    The per-document term weights (idf and length normalization included) are
+    computed once, so scoring a query is a column slice and a row sum.
+    """
+
+    def __init__(self, documents, tokenize, k1=1.5, b=0.75):
+        self.tokenize = tokenize
+        vocabulary = {}
+        rows, cols, counts = [], [], []
+        lengths = []
+        for i, document in enumerate(documents):
+            terms = tokenize(document)
+            lengths.append(len(terms))
+            tf = {}
+            for term in terms:
+                col = vocabulary.setdefault(term, len(vocabulary))
+                tf[col] = tf.get(col, 0) + 1
+            rows.extend([i] * len(tf))
+            cols.extend(tf)
+            counts.extend(tf.values())
+
+        n_docs = len(lengths)
+        rows = np.asarray(rows, dtype=np.int32)
+        cols = np.asarray(cols, dtype=np.int32)
+        tf = np.asarray(counts, dtype=np.float32)
+        lengths = np.asarray(lengths, dtype=np.float32)
+        avg_length = float(lengths.mean()) if n_docs else 0.0
+
+        df = np.bincount(cols, minlength=len(vocabulary)).astype(np.float32)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        norm = k1 * (1 - b + b * lengths[rows] / (avg_length or 1.0))
+        weights = idf[cols] * tf * (k1 + 1) / (tf + norm)
+
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.unseen_idf = math.log1p((n_docs + 0.5) / 0.5)
+        self.matrix = sparse.csc_matrix(
+            (weights, (rows, cols)), shape=(n_docs, len(vocabulary)), dtype=np.float32
+        )
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def top_k(self, query, k=10):
+        """Return up to ``k`` (row, score) pairs for ``query``, best first."""
+        return self.top_k_batch([query], k)[0]
+
+    def top_k_batch(self, queries, k=10):
+        """Top ``k`` (row, score) pairs for each query, scored in one pass.
+
+        The queries become a sparse query-term matrix that is multiplied with
+        the term weights once, instead of scoring them one by one. Scores are
+        divided by the summed idf of each query's terms, which is what an
+        average-length document containing each term once would score. That
+        puts them roughly on a 0-1 scale so a fixed cutoff can be applied.
+        """
+        rows, cols, ideals = [], [], []
+        for i, query in enumerate(queries):
+            terms = set(self.tokenize(query))
+            known = [self.vocabulary[t] for t in terms if t in self.vocabulary]
+            rows.extend([i] * len(known))
+            cols.extend(known)
+            ideals.append(float(self.idf[known].sum()) + self.unseen_idf * (len(terms) - len(known)))
+
+        query_matrix = sparse.csr_matrix(
+            (np.ones(len(cols), dtype=np.float32), (rows, cols)),
+            shape=(len(queries), self.matrix.shape[1]),
+        )
+        scores = (query_matrix @ self.matrix.T).tocsr()
+
+        results = []
+        for i, ideal in enumerate(ideals):
+            start, end = scores.indptr[i], scores.indptr[i + 1]
+            docs = scores.indices[start:end]
+            values = scores.data[start:end] / ideal if ideal else scores.data[start:end]
+            n = min(k, len(docs))
+            if not n:
+                results.append([])
+                continue
+            top = np.argpartition(-values, n - 1)[:n]
+            top = top[np.lexsort((docs[top], -values[top]))]
+            results.append([(int(docs[j]), float(values[j])) for j in top if values[j] > 0])
+        return results
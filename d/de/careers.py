@@ -0,0 +1,140 @@
+"""Faceted search over the Career catalogue for /de/api/careers/.
+
+Results are paged by keyset: each page is ``id > cursor ORDER BY id LIMIT n``
+on an index that starts with the filtered column, so page 500 costs the same
+as page 1. Facet counts are disjunctive (each facet is counted with every
+filter except its own, so ticking "Level 4" still shows how many Level 5
+items there are) and are cached per filter combination until the catalogue
+changes.
+"""
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import Career, CareerSkill
+
+RESULT_FIELDS = (
+    'id', 'kind', 'title', 'description', 'level', 'sector', 'duration',
+    'salary', 'requirements', 'certification', 'skills', 'icon',
+)
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+# Only the most common skills are counted; there can be thousands.
+SKILL_FACET_LIMIT = 30
+
+_VERSION_KEY = 'de:careers:version'
+
+
+def no_filters():
+    return {'q': '', 'kind': [], 'level': [], 'sector': [], 'skill': []}
+
+
+def parse_filters(params):
+    """Filters from a query dict; facets may repeat (``level=4&level=5``).
+
+    Raises ValueError for a malformed level or kind.
+    """
+    kinds = set(dict(Career.KIND_CHOICES))
+    filters = {
+        'q': params.get('q', '').strip(),
+        'kind': sorted(set(params.getlist('kind'))),
+        'level': sorted({int(level) for level in params.getlist('level')}),
+        'sector': sorted(set(params.getlist('sector'))),
+        'skill': sorted(set(params.getlist('skill'))),
+    }
+    if set(filters['kind']) - kinds:
+        raise ValueError(f"kind must be one of {', '.join(sorted(kinds))}")
+    return filters
+
+
+def filtered(filters, exclude=None):
+    """Careers matching ``filters``, ignoring the ``exclude`` facet."""
+    queryset = Career.objects.all()
+    if filters['q']:
+        q = filters['q']
+        queryset = queryset.filter(
+            Q(title__icontains=q)
+            | Q(description__icontains=q)
+            | Q(id__in=CareerSkill.objects.filter(name__icontains=q).values('career_id'))
+        )
+    for facet in ('kind', 'level', 'sector'):
+        if facet != exclude and filters[facet]:
+            queryset = queryset.filter(**{f'{facet}__in': filters[facet]})
+    if exclude != 'skill' and filters['skill']:
+        queryset = queryset.filter(
+            id__in=CareerSkill.objects.filter(name__in=filters['skill']).values('career_id')
+        )
+    return queryset
+
+
+def page(filters, cursor=0, limit=DEFAULT_PAGE_SIZE):
+    """Up to ``limit`` results after id ``cursor`` and the cursor of the next page."""
+    rows = list(
+        filtered(filters).filter(id__gt=cursor).order_by('id').values(*RESULT_FIELDS)[:limit + 1]
+    )
+    next_cursor = rows[limit - 1]['id'] if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def count_facets(filters):
+    """``{'total': n, 'facets': {facet: {value: count}}}`` straight from the database."""
+    facets = {}
+    for facet in ('kind', 'level', 'sector'):
+        counts = (
+            filtered(filters, exclude=facet)
+            .values(facet).annotate(count=Count('id')).order_by(facet)
+        )
+        facets[facet] = {str(row[facet]): row['count'] for row in counts}
+    skills = (
+        CareerSkill.objects
+        .filter(career__in=filtered(filters, exclude='skill'))
+        .values('name').annotate(count=Count('id')).order_by('-count', 'name')
+        [:SKILL_FACET_LIMIT]
+    )
+    facets['skill'] = {row['name']: row['count'] for row in skills}
+    return {'total': filtered(filters).count(), 'facets': facets}
+
+
+def _new_version():
+    # Time-based, so a version key lost to eviction never comes back as a
+    # number that older cached counts were stored under.
+    return time.time_ns()
+
+
+def catalogue_version():
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        cache.add(_VERSION_KEY, _new_version(), None)
+        version = cache.get(_VERSION_KEY)
+    return version
+
+
+def invalidate(**kwargs):
+    """Drop every cached facet count; connected to Career/CareerSkill saves and deletes."""
+    try:
+        cache.incr(_VERSION_KEY)
+    except ValueError:
+        cache.add(_VERSION_KEY, _new_version(), None)
+
+
+def facet_counts(filters):
+    """``count_facets``, cached for CAREER_FACET_CACHE_TTL seconds per filter combination."""
+    digest = hashlib.sha1(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    key = f"de:careers:facets:{catalogue_version()}:{digest}"
+    counts = cache.get(key)
+    if counts is None:
+        counts = count_facets(filters)
+        cache.set(key, counts, getattr(settings, 'CAREER_FACET_CACHE_TTL', 600))
+    return counts
+
+
+def search(filters, cursor=0, limit=DEFAULT_PAGE_SIZE, with_facets=True):
+    results, next_cursor = page(filters, cursor, limit)
+    response = {'results': results, 'next_cursor': next_cursor}
+    if with_facets:
+        response.update(facet_counts(filters))
+    return response
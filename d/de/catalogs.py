@@ -0,0 +1,178 @@
+"""gettext catalogs built from the string tables in de/i18n.py.
+
+``manage.py build_i18n_catalogs`` writes a .po file (for translators and
+review) and a compiled .mo file (what Django loads) per language. Page strings
+go in with the context ``<page>.<key>``, so they can be looked up with
+``pgettext`` and two pages can translate the same English text differently.
+The ``_()`` messages in MESSAGES have no context, like any gettext call.
+
+Both files are written here rather than with makemessages/compilemessages so
+the build does not need GNU gettext installed.
+"""
+import ast
+import os
+import struct
+import tempfile
+from array import array
+from pathlib import Path
+
+from . import i18n
+
+DOMAIN = 'django'
+MO_MAGIC = 0x950412de
+# gettext joins a message's context and msgid with EOT in compiled catalogs.
+CONTEXT_SEPARATOR = '\x04'
+
+HEADER = (
+    'Content-Type: text/plain; charset=UTF-8\n'
+    'Content-Transfer-Encoding: 8bit\n'
+    'Language: {lang}\n'
+    'Plural-Forms: nplurals=2; plural=(n != 1);\n'
+)
+
+GETTEXT_FUNCTIONS = {'_', 'gettext', 'gettext_lazy', 'pgettext', 'pgettext_lazy'}
+
+
+def entries(lang):
+    """``(context, msgid, msgstr)`` for every string translated into ``lang``."""
+    found = []
+    for page, table in i18n.PAGES.items():
+        source = table[i18n.DEFAULT_LANGUAGE]
+        translated = table.get(lang, {})
+        for key, msgid in source.items():
+            if key in translated and isinstance(msgid, str):
+                found.append((f"{page}.{key}", msgid, translated[key]))
+    for msgid, msgstr in i18n.MESSAGES.get(lang, {}).items():
+        found.append((None, msgid, msgstr))
+    return found
+
+
+def source_messages(paths):
+    """msgids passed as string literals to gettext functions in ``paths``."""
+    found = set()
+    for path in paths:
+        tree = ast.parse(Path(path).read_text(encoding='utf-8'), filename=str(path))
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id in GETTEXT_FUNCTIONS
+                and node.args
+                and isinstance(node.args[-1], ast.Constant)
+                and isinstance(node.args[-1].value, str)
+            ):
+                found.add(node.args[-1].value)
+    return found
+
+
+def _po_quote(text):
+    escaped = (
+        text.replace('\\', '\\\\').replace('"', '\\"')
+        .replace('\t', '\\t').replace('\n', '\\n')
+    )
+    return f'"{escaped}"'
+
+
+def po_text(lang, catalog):
+    lines = [
+        'msgid ""',
+        'msgstr ""',
+        *(_po_quote(line + '\n') for line in HEADER.format(lang=lang).splitlines()),
+    ]
+    for context, msgid, msgstr in catalog:
+        lines.append('')
+        if context is not None:
+            lines.append(f'msgctxt {_po_quote(context)}')
+        lines.append(f'msgid {_po_quote(msgid)}')
+        lines.append(f'msgstr {_po_quote(msgstr)}')
+    return '\n'.join(lines) + '\n'
+
+
+def mo_bytes(lang, catalog):
+    """Compile ``catalog`` into the GNU .mo format (little-endian, no hash table)."""
+    messages = {'': HEADER.format(lang=lang)}
+    for context, msgid, msgstr in catalog:
+        key = msgid if context is None else f"{context}{CONTEXT_SEPARATOR}{msgid}"
+        messages[key] = msgstr
+    # Readers binary-search the originals, so they must be sorted as bytes.
+    items = sorted((k.encode('utf-8'), v.encode('utf-8')) for k, v in messages.items())
+
+    ids = strs = b''
+    offsets = []
+    for key, value in items:
+        offsets.append((len(ids), len(key), len(strs), len(value)))
+        ids += key + b'\0'
+        strs += value + b'\0'
+
+    count = len(items)
+    header_size = 7 * 4
+    ids_start = header_size + count * 16
+    strs_start = ids_start + len(ids)
+    key_table, value_table = [], []
+    for id_offset, id_length, str_offset, str_length in offsets:
+        key_table += [id_length, ids_start + id_offset]
+        value_table += [str_length, strs_start + str_offset]
+
+    header = struct.pack(
+        '<Iiiiiii', MO_MAGIC, 0, count, header_size, header_size + count * 8, 0, 0
+    )
+    table = array('i', key_table + value_table)
+    if struct.pack('=i', 1) != struct.pack('<i', 1):
+        table.byteswap()
+    return header + table.tobytes() + ids + strs
+
+
+def catalog_paths(locale_dir, lang):
+    directory = os.path.join(locale_dir, lang, 'LC_MESSAGES')
+    return os.path.join(directory, f'{DOMAIN}.po'), os.path.join(directory, f'{DOMAIN}.mo')
+
+
+def _write(path, data):
+    # Write to a temporary file and rename it so a running server never reads
+    # a half-written catalog.
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def compile_catalog(locale_dir, lang):
+    """``(number of messages, [(path, contents), ...])`` for ``lang``'s files."""
+    catalog = entries(lang)
+    contents = (po_text(lang, catalog).encode('utf-8'), mo_bytes(lang, catalog))
+    return len(catalog), list(zip(catalog_paths(locale_dir, lang), contents))
+
+
+def stale_files(locale_dir, lang):
+    """Paths whose contents differ from what ``build`` would write."""
+    _, files = compile_catalog(locale_dir, lang)
+    return [path for path, data in files if _read(path) != data]
+
+
+def build(locale_dir, lang):
+    """Write ``lang``'s .po and .mo under ``locale_dir`` if they changed.
+
+    Returns ``(number of messages, paths written)``.
+    """
+    count, files = compile_catalog(locale_dir, lang)
+    written = []
+    for path, data in files:
+        if _read(path) != data:
+            _write(path, data)
+            written.append(path)
+    return count, written
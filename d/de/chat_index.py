@@ -0,0 +1,251 @@
+"""Compiled, memory-mapped chat dataset indexes.
+
+``manage.py build_chat_index`` turns each ``<lang>_dataset.jsonl`` into a
+``<lang>_dataset.idx`` file next to it. Workers ``mmap`` that file instead of
+parsing the JSONL, so every process on a host shares one page-cache copy of
+the corpus and loading it does no parsing at all.
+
+Layout: an 8-byte magic, a little-endian uint64 header length, a JSON header
+and then 8-byte aligned sections. Each string table is a uint64 offsets
+array (n + 1 entries) over a UTF-8 blob. Arrays use native byte order.
+
+    questions      lowercased questions, one per row
+    answer_ids     uint32 per row, into the interned answer table
+    answers        distinct answers
+    exact_keys     normalized questions, sorted by their UTF-8 bytes
+    exact_rows     uint32 row for each exact key
+    trigram_keys   trigrams, sorted by their UTF-8 bytes
+    trigram_spans  uint64 offsets into trigram_rows (n + 1 entries)
+    trigram_rows   uint32 postings, concatenated
+    trigram_sizes  uint32 trigram count per row
+"""
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+from .chatbot import Corpus, TrigramIndex
+
+MAGIC = b"DECHATIX"
+# 2: exact keys keep the symbols of technical names (chatbot.normalize).
+FORMAT_VERSION = 2
+
+
+def index_path(dataset_path):
+    return os.path.splitext(dataset_path)[0] + ".idx"
+
+
+def _string_table(strings):
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for string in strings:
+        blob += string.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def write(corpus, path, source_stat):
+    """Atomically write ``corpus`` to ``path`` as a compiled index.
+
+    ``source_stat`` is the ``os.stat`` of the JSONL the corpus was parsed
+    from; readers compare it with the live file to detect a stale index. The
+    file is written under a temporary name and renamed into place, so workers
+    never see a partial index.
+    """
+    interned = {}
+    answer_ids = array("I", (interned.setdefault(a, len(interned)) for a in corpus.answers))
+
+    exact = sorted(corpus.exact.items(), key=lambda item: item[0].encode("utf-8"))
+    grams = sorted(corpus.trigrams.postings, key=lambda gram: gram.encode("utf-8"))
+    spans = array("Q", [0])
+    rows = array("I")
+    for gram in grams:
+        rows.extend(corpus.trigrams.postings[gram])
+        spans.append(len(rows))
+
+    sections = {}
+    for name, strings in (
+        ("questions", corpus.questions),
+        ("answers", interned),
+        ("exact_keys", [key for key, _ in exact]),
+        ("trigram_keys", grams),
+    ):
+        offsets, blob = _string_table(strings)
+        sections[name + "_offsets"] = offsets.tobytes()
+        sections[name + "_blob"] = blob
+    sections["answer_ids"] = answer_ids.tobytes()
+    sections["exact_rows"] = array("I", (row for _, row in exact)).tobytes()
+    sections["trigram_spans"] = spans.tobytes()
+    sections["trigram_rows"] = rows.tobytes()
+    sections["trigram_sizes"] = array("I", corpus.trigrams.sizes).tobytes()
+
+    layout = {}
+    offset = 0
+    for name, data in sections.items():
+        layout[name] = [offset, len(data)]
+        offset += len(data) + (-len(data) % 8)
+    header = json.dumps({
+        "format": FORMAT_VERSION,
+        "rows": len(corpus),
+        "source_mtime_ns": source_stat.st_mtime_ns,
+        "source_size": source_stat.st_size,
+        "sections": layout,
+    }).encode("utf-8")
+    header += b" " * (-(len(header) + 16) % 8)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC + struct.pack("<Q", len(header)) + header)
+            for data in sections.values():
+                f.write(data)
+                f.write(b"\0" * (-len(data) % 8))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class StringTable:
+    """Read-only sequence of strings backed by an offsets array and a blob."""
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.raw(i).decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def raw(self, i):
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+    def find(self, key):
+        """Position of ``key`` in a table sorted by UTF-8 bytes, or None."""
+        key = key.encode("utf-8")
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.raw(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self.raw(lo) == key:
+            return lo
+        return None
+
+
+class InternedStrings:
+    """Per-row view of a table of distinct strings."""
+
+    def __init__(self, ids, table):
+        self.ids = ids
+        self.table = table
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        return self.table[self.ids[i]]
+
+    def __iter__(self):
+        return (self.table[i] for i in self.ids)
+
+
+class SortedLookup:
+    """``dict.get``-style lookup over a sorted key table and its values."""
+
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+
+    def get(self, key, default=None):
+        position = self.keys.find(key)
+        return default if position is None else self.values[position]
+
+
+class MappedPostings:
+    """Trigram postings lists as slices of one mapped uint32 array."""
+
+    def __init__(self, keys, spans, rows):
+        self.keys = keys
+        self.spans = spans
+        self.rows = rows
+
+    def get(self, gram, default=None):
+        position = self.keys.find(gram)
+        if position is None:
+            return default
+        return self.rows[self.spans[position]:self.spans[position + 1]]
+
+
+def read(path):
+    """Map the index at ``path``; returns ``(header, Corpus)``."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if bytes(view[:8]) != MAGIC:
+        raise ValueError(f"{path} is not a chat index")
+    (header_length,) = struct.unpack("<Q", view[8:16])
+    header = json.loads(bytes(view[16:16 + header_length]))
+    if header["format"] != FORMAT_VERSION:
+        raise ValueError(f"{path} has unsupported format {header['format']}")
+    base = 16 + header_length
+
+    def section(name, typecode=None):
+        offset, length = header["sections"][name]
+        data = view[base + offset:base + offset + length]
+        return data.cast(typecode) if typecode else data
+
+    def table(name):
+        return StringTable(section(name + "_offsets", "Q"), section(name + "_blob"))
+
+    corpus = Corpus(
+        path,
+        table("questions"),
+        InternedStrings(section("answer_ids", "I"), table("answers")),
+        exact=SortedLookup(table("exact_keys"), section("exact_rows", "I")),
+        trigrams=TrigramIndex(
+            MappedPostings(
+                table("trigram_keys"),
+                section("trigram_spans", "Q"),
+                section("trigram_rows", "I"),
+            ),
+            section("trigram_sizes", "I"),
+        ),
+    )
+    return header, corpus
+
+
+def load(dataset_path):
+    """Load a dataset, from its compiled index when one is present and fresh.
+
+    An index whose recorded source mtime or size no longer matches the JSONL,
+    or that was written in an older format, is ignored and the JSONL is parsed
+    instead, until the index is rebuilt.
+    """
+    path = index_path(dataset_path)
+    if os.path.exists(path):
+        try:
+            header, corpus = read(path)
+        except ValueError:
+            return Corpus.from_jsonl(dataset_path)
+        try:
+            source = os.stat(dataset_path)
+        except FileNotFoundError:
+            return corpus
+        if (header["source_mtime_ns"], header["source_size"]) == (source.st_mtime_ns, source.st_size):
+            return corpus
+    return Corpus.from_jsonl(dataset_path)
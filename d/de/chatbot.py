@@ -0,0 +1,710 @@
+import asyncio
+import difflib
+import hashlib
+import heapq
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections, connection
+from django.db.models import Count, Max, Q
+
+from .models import CareerDataset
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, 'de', 'data')
+
+DATASET_FILES = {
+    "en": "english_dataset.jsonl",
+    "hi": "hindi_dataset.jsonl",
+    "gu": "gujarati_dataset.jsonl",
+    "ta": "tamil_dataset.jsonl",
+    "bn": "bengali_dataset.jsonl",
+}
+
+FALLBACK_RESPONSE = "⚠️ Sorry, I don’t have an answer for that yet."
+
+# A fuzzy match must be more similar than this (difflib ratio) to be answered.
+MATCH_CUTOFF = 0.5
+# How many trigram candidates are re-ranked with difflib per message.
+FUZZY_CANDIDATES = 50
+# A BM25 match must reach this share of the query's ideal score.
+BM25_CUTOFF = 0.5
+# Seconds a worker reuses its last look at a language's CareerDataset version.
+DATABASE_VERSION_TTL = 5
+# Matchers the database backend can run.
+DATABASE_MATCHERS = ("difflib",)
+
+_WHITESPACE = re.compile(r"\s+")
+# Symbols that are part of technical names rather than punctuation: "#" and
+# "+" ending a word (c#, c++), and "." before a word at its start (.net) or
+# between two word characters (node.js, 3.5).
+_TECH_SYMBOLS = re.compile(r"(?<=\w)[#+]+(?!\w)|(?<!\S)\.(?=\w)|(?<=\w)\.(?=\w)")
+
+
+def normalize(text):
+    """Canonical form of a question used for exact lookups.
+
+    NFKC-normalizes and case-folds the text, turns punctuation (including the
+    danda used in Devanagari, Bengali and Gujarati) into spaces and collapses
+    runs of whitespace. Combining vowel signs and viramas are marks, not
+    punctuation, so Indic words keep their spelling. The symbols in technical
+    names are kept, so "c#", "c++" and ".net" do not collapse into "c" and
+    "net".
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    kept = {i for match in _TECH_SYMBOLS.finditer(text) for i in range(*match.span())}
+    text = "".join(
+        " " if unicodedata.category(ch).startswith("P") and i not in kept else ch
+        for i, ch in enumerate(text)
+    )
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def tokenize(text):
+    return normalize(text).split()
+
+
+def question_hash(text):
+    """Stable digest of a question's normalized form, for database lookups."""
+    return hashlib.sha256(normalize(text).encode("utf-8")).hexdigest()
+
+
+def dataset_path(lang):
+    return os.path.join(DATA_DIR, DATASET_FILES.get(lang, DATASET_FILES["en"]))
+
+
+def matcher_for(lang):
+    """Matching mode for ``lang`` from the CHATBOT_MATCHERS setting."""
+    matchers = getattr(settings, "CHATBOT_MATCHERS", {})
+    return matchers.get(lang, matchers.get("default", "difflib"))
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def best_ratio(message, candidates):
+    """Best ``(key, difflib ratio)`` among ``(key, question)`` candidates.
+
+    Ties go to the earliest candidate, like ``max`` over the full dataset did.
+    """
+    matcher = difflib.SequenceMatcher(None, message)
+    best_key, best = None, 0.0
+    for key, question in candidates:
+        matcher.set_seq2(question)
+        if best_key is not None and (
+            matcher.real_quick_ratio() <= best
+            or matcher.quick_ratio() <= best
+        ):
+            continue
+        ratio = matcher.ratio()
+        if best_key is None or ratio > best:
+            best_key, best = key, ratio
+    return best_key, best
+
+
+def top_ratios(message, candidates, k):
+    """The ``k`` best ``(key, difflib ratio)`` pairs among ``(key, question)``."""
+    matcher = difflib.SequenceMatcher(None, message)
+    scored = []
+    for key, question in candidates:
+        matcher.set_seq2(question)
+        scored.append((key, matcher.ratio()))
+    return heapq.nsmallest(k, scored, key=lambda item: (-item[1], item[0]))
+
+
+class TrigramIndex:
+    """Inverted index from character trigrams to question row ids.
+
+    Used to pick a few dozen fuzzy-match candidates by trigram overlap so that
+    difflib only has to score those instead of the whole corpus.
+    """
+
+    def __init__(self, postings, sizes):
+        self.postings = postings
+        self.sizes = sizes
+
+    @classmethod
+    def build(cls, texts):
+        postings = {}
+        sizes = array("I")
+        for i, text in enumerate(texts):
+            grams = trigrams(text)
+            sizes.append(len(grams))
+            for gram in grams:
+                rows = postings.get(gram)
+                if rows is None:
+                    rows = postings[gram] = array("I")
+                rows.append(i)
+        return cls(postings, sizes)
+
+    def candidates(self, text, limit=FUZZY_CANDIDATES):
+        """Row ids ranked by Dice similarity of their trigram sets to ``text``."""
+        grams = trigrams(text)
+        postings = [rows for rows in map(self.postings.get, grams) if rows is not None]
+        # Trigrams found in a large share of the corpus say little about which
+        # row is closest but dominate the counting cost, so they are skipped
+        # whenever the message has rarer ones to go on.
+        common = max(1000, len(self.sizes) // 20)
+        rare = [rows for rows in postings if len(rows) <= common]
+        overlap = Counter()
+        for rows in rare or postings:
+            overlap.update(rows)
+        if not overlap:
+            return []
+        size = len(grams)
+        sizes = self.sizes
+        return heapq.nlargest(
+            limit, overlap, key=lambda i: (2 * overlap[i] / (size + sizes[i]), -i)
+        )
+
+
+class Corpus:
+    """Questions and answers of one dataset, plus the indexes to search them.
+
+    ``questions`` and ``answers`` are parallel sequences: tuples when parsed
+    from JSONL, or views over a compiled index file (see ``chat_index``).
+    """
+
+    def __init__(self, path, questions, answers, exact=None, trigrams=None):
+        self.path = path
+        self.version = None
+        self.questions = questions
+        self.answers = answers
+        if exact is None:
+            exact = {}
+            for i, question in enumerate(questions):
+                exact.setdefault(normalize(question), i)
+        self.exact = exact
+        self.trigrams = trigrams if trigrams is not None else TrigramIndex.build(questions)
+        self._bm25 = None
+        self._bm25_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.questions)
+
+    @property
+    def bm25(self):
+        # Built on first use so corpora served by difflib never pay for it,
+        # once even when several pool threads ask at the same time.
+        # CorpusStore builds it up front for languages that match with BM25.
+        if self._bm25 is None:
+            with self._bm25_lock:
+                if self._bm25 is None:
+                    from .bm25 import BM25Index
+
+                    self._bm25 = BM25Index(self.questions, tokenize)
+        return self._bm25
+
+    @classmethod
+    def from_jsonl(cls, path):
+        questions = []
+        answers = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                questions.append(entry["user"].lower().strip())
+                answers.append(entry["assistant"])
+        return cls(path, tuple(questions), tuple(answers))
+
+    def match(self, message, matcher="difflib"):
+        """Return the best answer for a chat message, or None."""
+        response = self.exact_match(message)
+        if response is None:
+            response = self.ranked_match(message, matcher)
+        return response
+
+    def exact_match(self, message):
+        index = self.exact.get(normalize(message))
+        return self.answers[index] if index is not None else None
+
+    def ranked_match(self, message, matcher="difflib"):
+        if matcher == "bm25":
+            ranked = self.bm25.top_k(message, k=1)
+            if ranked and ranked[0][1] > BM25_CUTOFF:
+                return self.answers[ranked[0][0]]
+            return None
+
+        best_index, best_ratio = self.fuzzy_match(message.lower().strip())
+        if best_index is not None and best_ratio > MATCH_CUTOFF:
+            return self.answers[best_index]
+        return None
+
+    def search(self, messages, k=5, matcher="difflib"):
+        """Top ``k`` ``(row, score, method)`` results for each message.
+
+        An exact hit comes first with a score of 1.0. A batch of more than one
+        message is always scored with BM25, in one sparse matrix product:
+        difflib compares a message with each candidate in Python and cannot
+        be batched. A single message is scored with ``matcher``.
+        """
+        if matcher == "bm25" or len(messages) > 1:
+            ranked = [
+                [(row, score, "bm25") for row, score in rows]
+                for rows in self.bm25.top_k_batch(messages, k)
+            ]
+        else:
+            ranked = []
+            for message in messages:
+                message = message.lower().strip()
+                rows = sorted(self.trigrams.candidates(message))
+                ranked.append([
+                    (row, ratio, "difflib")
+                    for row, ratio in top_ratios(message, ((i, self.questions[i]) for i in rows), k)
+                ])
+
+        results = []
+        for message, rows in zip(messages, ranked):
+            index = self.exact.get(normalize(message))
+            if index is not None:
+                rows = [(index, 1.0, "exact")] + [r for r in rows if r[0] != index][:k - 1]
+            results.append(rows)
+        return results
+
+    def fuzzy_match(self, message):
+        """Best (row, ratio) among the trigram candidates for ``message``."""
+        return self._best_ratio(message, sorted(self.trigrams.candidates(message)))
+
+    def scan_match(self, message):
+        """Best (row, ratio) over every question; the pre-index baseline."""
+        return self._best_ratio(message, range(len(self.questions)))
+
+    def _best_ratio(self, message, rows):
+        return best_ratio(message, ((i, self.questions[i]) for i in rows))
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class CorpusStore:
+    """Process-wide cache of loaded corpora, one per language.
+
+    Each corpus is loaded on first use and reloaded when the dataset file or
+    its compiled index changes, so a worker loads a dataset once instead of
+    once per request. For a language matched with BM25 the index is built
+    with it, under the same lock, so no request pays for that either once
+    the corpus is preloaded.
+    """
+
+    def __init__(self):
+        self._corpora = {}
+        self._lock = threading.Lock()
+
+    def get(self, lang):
+        from . import chat_index
+
+        path = dataset_path(lang)
+        version = (_mtime(path), _mtime(chat_index.index_path(path)))
+        corpus = self._corpora.get(path)
+        if corpus is not None and corpus.version == version:
+            return corpus
+
+        with self._lock:
+            corpus = self._corpora.get(path)
+            if corpus is None or corpus.version != version:
+                corpus = chat_index.load(path)
+                corpus.version = version
+                if matcher_for(lang) == "bm25":
+                    corpus.bm25
+                self._corpora[path] = corpus
+        return corpus
+
+    def preload(self, languages=None):
+        for lang in languages or DATASET_FILES:
+            self.get(lang)
+
+    def clear(self):
+        with self._lock:
+            self._corpora.clear()
+
+
+class LRUCache:
+    """Thread-safe LRU cache with an optional time-to-live and usage counters."""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, expires = item
+                if expires is None or expires > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class AnswerCache:
+    """Per-language caches of answers keyed by normalized message.
+
+    A language's cache is emptied whenever its corpus is reloaded, so cached
+    answers never outlive the dataset they came from.
+    """
+
+    def __init__(self):
+        self._caches = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+    def for_corpus(self, lang, corpus):
+        with self._lock:
+            cache = self._caches.get(lang)
+            if cache is None:
+                cache = self._caches[lang] = LRUCache(
+                    getattr(settings, "CHATBOT_CACHE_SIZE", 1024),
+                    getattr(settings, "CHATBOT_CACHE_TTL", None),
+                )
+            elif self._versions.get(lang) != corpus.version:
+                cache.clear()
+                self.invalidations += 1
+            self._versions[lang] = corpus.version
+        return cache
+
+    def stats(self):
+        return {
+            "invalidations": self.invalidations,
+            "languages": {lang: cache.stats() for lang, cache in self._caches.items()},
+        }
+
+
+class DatabaseCorpus:
+    """A language's chat corpus served from the CareerDataset table.
+
+    Exact hits use the (language, question_hash) index. Fuzzy candidates come
+    from the MySQL FULLTEXT index on input_text (or a few LIKE filters on
+    other databases) and are re-ranked with difflib, so only a handful of rows
+    leave the database per message. ``version`` changes whenever
+    load_chat_dataset reloads the language, which empties its answer cache.
+
+    Only the difflib matcher is supported (see DATABASE_MATCHERS): BM25 needs
+    the whole corpus in memory, which is what this backend avoids.
+    """
+
+    # lang -> (monotonic time checked, version)
+    _versions = {}
+
+    def __init__(self, lang):
+        self.lang = lang
+        self.version = self.current_version(lang)
+
+    @classmethod
+    def current_version(cls, lang):
+        """``(row count, highest id)`` of the language's rows.
+
+        A reload replaces every row and new rows get new ids, so it always
+        changes. Rechecked at most every DATABASE_VERSION_TTL seconds.
+        """
+        now = time.monotonic()
+        checked = cls._versions.get(lang)
+        if checked is None or now - checked[0] >= DATABASE_VERSION_TTL:
+            rows = CareerDataset.objects.filter(language=lang).aggregate(count=Count("id"), last=Max("id"))
+            checked = cls._versions[lang] = (now, (rows["count"], rows["last"]))
+        return checked[1]
+
+    def match(self, message, matcher="difflib"):
+        response = self.exact_match(message)
+        if response is None:
+            response = self.ranked_match(message, matcher)
+        return response
+
+    def exact_match(self, message):
+        return (
+            CareerDataset.objects.filter(language=self.lang, question_hash=question_hash(message))
+            .values_list("output_text", flat=True)
+            .first()
+        )
+
+    def ranked_match(self, message, matcher="difflib"):
+        message = message.lower().strip()
+        candidates = self.candidates(message)
+        best_id, best = best_ratio(
+            message, ((pk, question.lower()) for pk, question, _ in candidates)
+        )
+        if best_id is not None and best > MATCH_CUTOFF:
+            return next(answer for pk, _, answer in candidates if pk == best_id)
+        return None
+
+    def search(self, messages, k=5, matcher="difflib"):
+        """Top ``k`` ``(question, answer, score, method)`` results per message."""
+        results = []
+        for message in messages:
+            exact = (
+                CareerDataset.objects.filter(language=self.lang, question_hash=question_hash(message))
+                .values_list("id", "input_text", "output_text")
+                .first()
+            )
+            lowered = message.lower().strip()
+            candidates = {pk: (question, answer) for pk, question, answer in self.candidates(lowered)}
+            ranked = top_ratios(
+                lowered, ((pk, question.lower()) for pk, (question, _) in candidates.items()), k
+            )
+            rows = [(*candidates[pk], ratio, "difflib") for pk, ratio in ranked]
+            if exact is not None:
+                rows = [(exact[1], exact[2], 1.0, "exact")] + [
+                    row for (pk, _), row in zip(ranked, rows) if pk != exact[0]
+                ][:k - 1]
+            results.append(rows)
+        return results
+
+    def candidates(self, message, limit=FUZZY_CANDIDATES):
+        """``(id, question, answer)`` rows likely to be similar to ``message``."""
+        if connection.vendor == "mysql":
+            table = CareerDataset._meta.db_table
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT id, input_text, output_text FROM {table}"
+                    " WHERE language = %s AND MATCH(input_text) AGAINST (%s)"
+                    " ORDER BY MATCH(input_text) AGAINST (%s) DESC, id LIMIT %s",
+                    [self.lang, message, message, limit],
+                )
+                return cursor.fetchall()
+
+        # Without FULLTEXT relevance ordering the LIKE matches are unranked,
+        # so hand difflib a wider pool to choose from.
+        limit *= 10
+        words = sorted(set(tokenize(message)), key=len, reverse=True)[:3]
+        if not words:
+            return []
+        query = Q()
+        for word in words:
+            query |= Q(input_text__icontains=word)
+        return list(
+            CareerDataset.objects.filter(query, language=self.lang)
+            .order_by("id")
+            .values_list("id", "input_text", "output_text")[:limit]
+        )
+
+
+store = CorpusStore()
+answer_cache = AnswerCache()
+
+
+def _corpus(lang):
+    if lang not in DATASET_FILES:
+        lang = "en"
+    matcher = matcher_for(lang)
+    if getattr(settings, "CHATBOT_BACKEND", "files") == "database":
+        if matcher not in DATABASE_MATCHERS:
+            raise ImproperlyConfigured(
+                f"CHATBOT_MATCHERS selects {matcher!r} for {lang!r}, which the database backend does not support"
+            )
+        corpus = DatabaseCorpus(lang)
+    else:
+        corpus = store.get(lang)
+    return lang, corpus, matcher
+
+
+def check_matchers(app_configs=None, **kwargs):
+    """System check: every CHATBOT_MATCHERS entry works with CHATBOT_BACKEND."""
+    if getattr(settings, "CHATBOT_BACKEND", "files") != "database":
+        return []
+    return [
+        checks.Error(
+            f"CHATBOT_MATCHERS[{lang!r}] is {matcher!r}, but the database backend only supports "
+            + ", ".join(DATABASE_MATCHERS),
+            hint="Use CHATBOT_BACKEND = 'files' for BM25.",
+            id="de.E001",
+        )
+        for lang, matcher in getattr(settings, "CHATBOT_MATCHERS", {}).items()
+        if matcher not in DATABASE_MATCHERS
+    ]
+
+
+def _resolve(message, lang):
+    lang, corpus, matcher = _corpus(lang)
+    cache = answer_cache.for_corpus(lang, corpus)
+    return corpus, matcher, cache, (matcher, normalize(message))
+
+
+def quick_answer(message, lang="en"):
+    """The cached or exact-match answer for a message, or None.
+
+    This is the cheap first half of ``answer``; streaming responses send it
+    before ``ranked_answer`` has run.
+    """
+    corpus, _, cache, key = _resolve(message, lang)
+    response = cache.get(key)
+    if response is None:
+        response = corpus.exact_match(message)
+        if response is not None:
+            cache.put(key, response)
+    return response
+
+
+def ranked_answer(message, lang="en"):
+    """The fuzzy or BM25 answer for a message with no quick answer."""
+    corpus, matcher, cache, key = _resolve(message, lang)
+    response = corpus.ranked_match(message, matcher)
+    if response is None:
+        response = FALLBACK_RESPONSE
+    cache.put(key, response)
+    return response
+
+
+def search(messages, lang="en", k=5):
+    """Top ``k`` scored candidate answers for each message.
+
+    Each result is a dict with the matched question, its answer, the score,
+    the method that produced it and whether the score clears that method's
+    cutoff (what ``answer`` would require to return it).
+    """
+    _, corpus, matcher = _corpus(lang)
+    cutoffs = {"exact": 0.0, "difflib": MATCH_CUTOFF, "bm25": BM25_CUTOFF}
+    if isinstance(corpus, DatabaseCorpus):
+        batches = corpus.search(messages, k, matcher)
+    else:
+        batches = [
+            [(corpus.questions[row], corpus.answers[row], score, method)
+             for row, score, method in rows]
+            for rows in corpus.search(messages, k, matcher)
+        ]
+    return [
+        [
+            {
+                "question": question,
+                "answer": reply,
+                "score": round(score, 4),
+                "method": method,
+                "confident": score > cutoffs[method],
+            }
+            for question, reply, score, method in rows
+        ]
+        for rows in batches
+    ]
+
+
+def answer(message, lang="en"):
+    """Answer a chat message from the dataset for ``lang``."""
+    response = quick_answer(message, lang)
+    if response is None:
+        response = ranked_answer(message, lang)
+    return response
+
+
+class Busy(Exception):
+    """Raised when too many chat messages are already waiting for a worker."""
+
+
+class MatchPool:
+    """Bounded thread pool that runs chatbot matching off the event loop.
+
+    At most ``workers`` messages are matched at once and at most ``max_queue``
+    more may wait; beyond that ``answer`` raises Busy so a slow fuzzy lookup
+    backs up into quick 503s instead of stalling every other request.
+    """
+
+    def __init__(self, workers=4, max_queue=64):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _run(self, func, args):
+        try:
+            return func(*args)
+        finally:
+            # Pool threads outlive requests, so release their DB connections
+            # the way Django does at the end of a request.
+            close_old_connections()
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+
+    def _submit(self, func, args):
+        with self._lock:
+            if self.pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise Busy()
+            self.pending += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="chatbot")
+            return self._executor.submit(self._run, func, args)
+
+    async def run(self, func, *args):
+        """Await ``func(*args)`` on a pool thread; raises Busy when full."""
+        return await asyncio.wrap_future(self._submit(func, args))
+
+    def call(self, func, *args):
+        """``run`` for synchronous callers: blocks until ``func(*args)`` returns."""
+        return self._submit(func, args).result()
+
+    async def answer(self, message, lang="en"):
+        return await self.run(answer, message, lang)
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(self.pending, self.workers),
+            "queued": max(self.pending - self.workers, 0),
+            "peak_pending": self.peak_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+pool = MatchPool(
+    getattr(settings, "CHATBOT_WORKERS", 4),
+    getattr(settings, "CHATBOT_MAX_QUEUE", 64),
+)
@@ -1,10 +1,15 @@
+import argparse
+import hashlib
 import json
 import os
+import re
+import sqlite3
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import torch
 from transformers import pipeline
 
-TARGET_LANGUAGE_CODE = 'ta'
-
 DEVICE = 0 if torch.cuda.is_available() else -1
 print(f"Using device: {'GPU' if DEVICE == 0 else 'CPU'}")
 
@@ -15,56 +20,420 @@ MODELS = {
     'bn': 'Helsinki-NLP/opus-mt-en-bn'
 }
 
-MODEL_NAME = MODELS[TARGET_LANGUAGE_CODE]
+# Same file names the chatbot reads (de/chatbot.py DATASET_FILES).
+OUTPUT_NAMES = {
+    'hi': 'hindi_dataset.jsonl',
+    'gu': 'gujarati_dataset.jsonl',
+    'ta': 'tamil_dataset.jsonl',
+    'bn': 'bengali_dataset.jsonl'
+}
 
 SCRIPT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE = os.path.join(SCRIPT_DIRECTORY, 'english_dataset.jsonl')
-OUTPUT_FILE = os.path.join(SCRIPT_DIRECTORY, f'{TARGET_LANGUAGE_CODE}_dataset.jsonl')
+CHECKPOINT_FILE = os.path.join(SCRIPT_DIRECTORY, 'translation_checkpoint.json')
+MEMORY_FILE = os.path.join(SCRIPT_DIRECTORY, 'translation_memory.sqlite3')
 KEYS_TO_TRANSLATE = ['user', 'assistant']
 
-def translate_from_scratch():
-    print(f"Loading model for '{TARGET_LANGUAGE_CODE}': {MODEL_NAME}...")
+BATCH_SIZE = 32
+CHUNK_LINES = 512
+
+# Sentence ends followed by whitespace, or line breaks. The separator is
+# captured so a translated answer keeps its original spacing and paragraphs.
+SENTENCE_BOUNDARY = re.compile(r'((?<=[.!?])\s+|\n+)')
+
+
+def output_file(lang):
+    return os.path.join(SCRIPT_DIRECTORY, OUTPUT_NAMES[lang])
+
+
+def load_checkpoint(path):
+    """Committed progress per language.
+
+    Each language records the input range its shard covers (``start``), the
+    bytes consumed so far (``position``), the output size (``offset``), the
+    input's size and mtime when it was saved (``input``) and the sha256 of
+    the consumed input bytes ``[start, position)`` (``digest``).
+    """
     try:
-        translator = pipeline("translation", model=MODEL_NAME, device=DEVICE)
-        print("Model loaded successfully!")
-    except Exception as e:
-        print(f"Error loading model: {e}")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_checkpoint(path, checkpoint):
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def input_identity(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def digest_range(path, start, end):
+    """A sha256 object fed with the bytes ``[start, end)`` of ``path``."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(remaining, 1 << 20))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest
+
+
+def checkpoint_matches(state, start, identity):
+    """Whether ``state`` was written for this input and shard.
+
+    An input whose size and mtime are unchanged is trusted as is. Otherwise
+    the bytes the checkpoint consumed are hashed again: a file that only grew
+    still matches, one edited before ``position`` does not.
+    """
+    if not {'start', 'position', 'offset', 'input', 'digest'} <= state.keys() or state['start'] != start:
+        return False
+    if state['input'] == identity:
+        return True
+    if state['position'] > identity[0]:
+        return False
+    return digest_range(INPUT_FILE, start, state['position']).hexdigest() == state['digest']
+
+
+def shard_ranges(path, shards):
+    """Split ``path`` into ``shards`` byte ranges that start on line boundaries."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for k in range(1, shards):
+            position = max(size * k // shards, bounds[-1])
+            if position > 0:
+                # Land on the first line that starts at or after ``position``.
+                f.seek(position - 1)
+                f.readline()
+                position = f.tell()
+            bounds.append(min(position, size))
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+class TranslationMemory:
+    """Persistent cache of model outputs keyed by (model, source text hash).
+
+    Backed by SQLite so it survives between runs. An edited input makes its
+    checkpoint start over by itself (see ``checkpoint_matches``), and the
+    memory turns that full rerun into one where only new or changed strings
+    reach the model.
+    """
+
+    LOOKUP_BATCH = 500
+
+    def __init__(self, path):
+        # Shard workers share the file, so wait on locks instead of failing.
+        self.connection = sqlite3.connect(path, timeout=60)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " model TEXT NOT NULL,"
+            " source_hash BLOB NOT NULL,"
+            " translation TEXT NOT NULL,"
+            " PRIMARY KEY (model, source_hash)"
+            ") WITHOUT ROWID"
+        )
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(text):
+        return hashlib.sha256(text.encode('utf-8')).digest()
+
+    def lookup(self, model, texts):
+        """Return ``{text: translation}`` for the texts already translated."""
+        keys = {self.key(text): text for text in texts}
+        found = {}
+        hashes = list(keys)
+        for i in range(0, len(hashes), self.LOOKUP_BATCH):
+            batch = hashes[i:i + self.LOOKUP_BATCH]
+            rows = self.connection.execute(
+                "SELECT source_hash, translation FROM translations"
+                f" WHERE model = ? AND source_hash IN ({', '.join('?' * len(batch))})",
+                [model, *batch],
+            )
+            for source_hash, translation in rows:
+                found[keys[source_hash]] = translation
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def store(self, model, translations):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?)",
+                [(model, self.key(text), translation) for text, translation in translations.items()],
+            )
+
+    def close(self):
+        self.connection.close()
+
+
+def read_chunks(infile, end, chunk_lines, digest=None):
+    """Yield lists of ``(end_position, record)`` for the lines before ``end``.
+
+    Malformed lines give ``None`` records so their bytes still count as read.
+    Every line read is also fed to ``digest`` when one is given.
+    """
+    chunk = []
+    while infile.tell() < end:
+        position = infile.tell()
+        line = infile.readline()
+        if not line:
+            break
+        if digest is not None:
+            digest.update(line)
+        try:
+            record = json.loads(line)
+        except ValueError:
+            print(f"Warning: Skipping malformed JSON at byte {position}")
+            record = None
+        chunk.append((infile.tell(), record))
+        if len(chunk) == chunk_lines:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def split_sentences(text):
+    """Split ``text`` into ``[sentence, separator, sentence, ...]``."""
+    return SENTENCE_BOUNDARY.split(text)
+
+
+def token_lengths(translator, texts):
+    return [len(ids) for ids in translator.tokenizer(texts)['input_ids']]
+
+
+def report_token_lengths(label, lang, histogram, limit):
+    """Print sentence token-length percentiles to help tune ``--batch-size``."""
+    total = sum(histogram.values())
+    if not total:
         return
+    percentiles = {}
+    seen = 0
+    for length in sorted(histogram):
+        seen += histogram[length]
+        for p in (50, 90, 99):
+            if p not in percentiles and seen >= total * p / 100:
+                percentiles[p] = length
+    mean = sum(length * count for length, count in histogram.items()) / total
+    over = sum(count for length, count in histogram.items() if length > limit)
+    print(f"{label}'{lang}' tokens per sentence: {total} sentences, mean {mean:.1f}, "
+          f"p50 {percentiles[50]}, p90 {percentiles[90]}, p99 {percentiles[99]}, "
+          f"max {max(histogram)}, {over} over the model limit of {limit}")
+
+
+def translate_texts(translator, model, texts, batch_size, memory=None, lengths=None):
+    """Translate ``texts``, sending each distinct, unremembered string to the model once.
+
+    Pending strings are sorted by token length before batching so each batch
+    pads to a similar length. Their lengths are counted into ``lengths``.
+    """
+    unique = list(dict.fromkeys(texts))
+    translated = memory.lookup(model, unique) if memory else {}
+    pending = [text for text in unique if text not in translated]
+    if pending:
+        sizes = token_lengths(translator, pending)
+        if lengths is not None:
+            lengths.update(sizes)
+        order = sorted(range(len(pending)), key=sizes.__getitem__)
+        new = {}
+        for i in range(0, len(order), batch_size):
+            batch = [pending[j] for j in order[i:i + batch_size]]
+            for source, output in zip(batch, translator(batch, batch_size=len(batch))):
+                new[source] = output['translation_text']
+        if memory:
+            memory.store(model, new)
+        translated.update(new)
+    return [translated[text] for text in texts]
+
+
+def translate_records(translator, model, records, batch_size, memory=None, lengths=None):
+    """Translate the records sentence by sentence and reassemble each field."""
+    results = [record.copy() for record in records]
+    fields = [(result, key, split_sentences(result[key]))
+              for result in results for key in KEYS_TO_TRANSLATE if result.get(key)]
+    sentences = [part for _, _, parts in fields for part in parts[::2] if part.strip()]
+    translated = iter(translate_texts(translator, model, sentences, batch_size, memory, lengths))
+
+    for result, key, parts in fields:
+        parts[::2] = [next(translated) if part.strip() else part for part in parts[::2]]
+        result[key] = ''.join(parts)
+    return results
+
 
-    print(f"\nStarting translation from scratch for '{INPUT_FILE}'...")
-    print(f"Output will be written to '{OUTPUT_FILE}'")
-    lines_processed = 0
+def translate_range(languages, start, end, outputs, checkpoint_file, batch_size=BATCH_SIZE,
+                    chunk_lines=CHUNK_LINES, restart=False, memory_file=MEMORY_FILE, label=''):
+    """Translate the input lines starting in ``[start, end)`` into ``outputs``.
+
+    Input is read in chunks of ``chunk_lines``. After each chunk the new
+    output lines are fsynced and ``checkpoint_file`` is updated, so an
+    interrupted run resumes from the last committed chunk; anything written
+    after it is truncated away on restart. A language whose checkpoint does
+    not match the input (see ``checkpoint_matches``) starts over.
+
+    Translations are looked up in and added to the translation memory at
+    ``memory_file`` unless it is ``None``.
+    """
+    checkpoint = {} if restart else load_checkpoint(checkpoint_file)
+    memory = TranslationMemory(memory_file) if memory_file else None
+    translators = {}
+    lengths = {lang: Counter() for lang in languages}
+    for lang in languages:
+        print(f"{label}Loading model for '{lang}': {MODELS[lang]}...")
+        translators[lang] = pipeline("translation", model=MODELS[lang], device=DEVICE)
+
+    identity = input_identity(INPUT_FILE)
+    files = {}
+    for lang in languages:
+        state = checkpoint.setdefault(lang, {})
+        if state and not checkpoint_matches(state, start, identity):
+            print(f"{label}'{INPUT_FILE}' changed since the checkpoint; starting '{lang}' over"
+                  + ("" if memory else " (no translation memory, so every string is retranslated)"))
+            state.clear()
+        if not state:
+            state.update(start=start, position=start, offset=0)
+        if state['offset'] and os.path.exists(outputs[lang]):
+            files[lang] = open(outputs[lang], 'r+b')
+            files[lang].truncate(state['offset'])
+            files[lang].seek(state['offset'])
+        else:
+            state.update(position=start, offset=0)
+            files[lang] = open(outputs[lang], 'wb')
+        if state['position'] > start:
+            print(f"{label}Resuming '{lang}' at byte {state['position']}")
+
+    position = min(checkpoint[lang]['position'] for lang in languages)
+    # Hash of the input from ``start``, kept current as lines are read, so
+    # each checkpoint can record what it consumed.
+    digest = digest_range(INPUT_FILE, start, position)
     try:
-        with open(INPUT_FILE, 'r', encoding='utf-8') as infile, \
-             open(OUTPUT_FILE, 'w', encoding='utf-8') as outfile:
+        with open(INPUT_FILE, 'rb') as infile:
+            infile.seek(position)
+            for chunk in read_chunks(infile, end, chunk_lines, digest):
+                chunk_end = chunk[-1][0]
+                consumed = digest.hexdigest()
+                for lang in languages:
+                    state = checkpoint[lang]
+                    if state['position'] >= chunk_end:
+                        continue
+                    records = [r for pos, r in chunk if pos > state['position'] and r is not None]
+                    out = files[lang]
+                    translated = translate_records(translators[lang], MODELS[lang], records, batch_size,
+                                                   memory, lengths[lang])
+                    for translated_data in translated:
+                        out.write((json.dumps(translated_data, ensure_ascii=False) + '\n').encode('utf-8'))
+                    out.flush()
+                    os.fsync(out.fileno())
+                    state.update(position=chunk_end, offset=out.tell(), input=identity, digest=consumed)
+                save_checkpoint(checkpoint_file, checkpoint)
+                print(f"{label}Committed {chunk_end - start} of {end - start} bytes...")
+    finally:
+        for out in files.values():
+            out.close()
+        if memory:
+            memory.close()
+            print(f"{label}Translation memory: {memory.hits} hits, {memory.misses} strings sent to the model")
+        for lang in languages:
+            report_token_lengths(label, lang, lengths[lang], translators[lang].tokenizer.model_max_length)
 
-            for i, line in enumerate(infile, 1):
-                try:
-                    data = json.loads(line)
-                    translated_data = data.copy()
 
-                    for key in KEYS_TO_TRANSLATE:
-                        if key in data and data[key]:
-                            original_text = data[key]
-                            translated_output = translator(original_text)
-                            translated_data[key] = translated_output[0]['translation_text']
+def init_worker(threads):
+    torch.set_num_threads(threads)
 
-                    outfile.write(json.dumps(translated_data, ensure_ascii=False) + '\n')
-                    lines_processed += 1
-                    if lines_processed % 20 == 0:
-                        print(f"Processed {lines_processed} lines...")
 
-                except json.JSONDecodeError:
-                    print(f"Warning: Skipping malformed JSON on line {i}")
+def translate_shard(args):
+    return translate_range(*args)
 
-    except FileNotFoundError:
+
+def translate_dataset(languages, batch_size=BATCH_SIZE, chunk_lines=CHUNK_LINES, restart=False,
+                      memory_file=MEMORY_FILE, workers=1, threads=None):
+    """Translate the English dataset into every language in one pass.
+
+    With ``workers`` > 1 the input is split into that many byte ranges, each
+    translated by its own process (and model instances) using ``threads``
+    torch threads. Shards write and checkpoint separate files, which are
+    concatenated in input order once every shard has finished.
+    """
+    if not os.path.exists(INPUT_FILE):
         print(f"ERROR: Input file not found at '{INPUT_FILE}'")
-    except Exception as e:
-        print(f"An unexpected error occurred during file processing: {e}")
+        return
+    print(f"\nTranslating '{INPUT_FILE}' into {', '.join(languages)}...")
+
+    if workers <= 1:
+        outputs = {lang: output_file(lang) for lang in languages}
+        translate_range(languages, 0, os.path.getsize(INPUT_FILE), outputs, CHECKPOINT_FILE,
+                        batch_size, chunk_lines, restart, memory_file)
+    else:
+        threads = threads or max(1, (os.cpu_count() or 1) // workers)
+        tasks = []
+        for k, (start, end) in enumerate(shard_ranges(INPUT_FILE, workers)):
+            suffix = f".shard{k}-of-{workers}"
+            outputs = {lang: output_file(lang) + suffix for lang in languages}
+            checkpoint_file = os.path.splitext(CHECKPOINT_FILE)[0] + suffix + '.json'
+            tasks.append((languages, start, end, outputs, checkpoint_file, batch_size,
+                          chunk_lines, restart, memory_file, f"[shard {k}] "))
+
+        print(f"Running {workers} shards with {threads} torch thread(s) each")
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=init_worker,
+                                 initargs=(threads,)) as pool:
+            list(pool.map(translate_shard, tasks))
+
+        for lang in languages:
+            tmp_file = output_file(lang) + '.tmp'
+            with open(tmp_file, 'wb') as merged:
+                for task in tasks:
+                    with open(task[3][lang], 'rb') as shard:
+                        while block := shard.read(1 << 20):
+                            merged.write(block)
+                merged.flush()
+                os.fsync(merged.fileno())
+            os.replace(tmp_file, output_file(lang))
+        for task in tasks:
+            for path in task[3].values():
+                os.remove(path)
+            os.remove(task[4])
 
     print("\n--- SCRIPT FINISHED ---")
-    if lines_processed > 0:
-        print(f"\n✅ Translation for '{TARGET_LANGUAGE_CODE}' complete! {lines_processed} lines were written to {OUTPUT_FILE}")
+    for lang in languages:
+        print(f"✅ '{lang}' written to {output_file(lang)}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Translate english_dataset.jsonl into the other chatbot languages.")
+    parser.add_argument('languages', nargs='*', help=f"Target languages (default: {' '.join(MODELS)}).")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help="Sentences per model call.")
+    parser.add_argument('--chunk-lines', type=int, default=CHUNK_LINES, help="Input lines per checkpoint.")
+    parser.add_argument('--restart', action='store_true', help="Ignore the checkpoint and start over. Not needed after "
+                             "editing the input: a checkpoint that no longer matches it is discarded.")
+    parser.add_argument('--memory', default=MEMORY_FILE, help="SQLite translation memory file.")
+    parser.add_argument('--no-memory', dest='memory', action='store_const', const=None,
+                        help="Do not read or write the translation memory.")
+    parser.add_argument('--workers', type=int, default=1, help="Processes, each translating one shard of the input.")
+    parser.add_argument('--threads', type=int, help="Torch threads per worker (default: CPU count / workers).")
+    args = parser.parse_args()
+    args.languages = args.languages or list(MODELS)
+    unknown = set(args.languages) - set(MODELS)
+    if unknown:
+        parser.error(f"unknown language(s): {', '.join(sorted(unknown))}")
+    return args
+
 
 if __name__ == "__main__":
-    translate_from_scratch()
+    args = parse_args()
+    translate_dataset(args.languages, args.batch_size, args.chunk_lines, args.restart, args.memory,
+                      args.workers, args.threads)
@@ -0,0 +1,1521 @@
+"""UI strings for the auth, dashboard, career explorer, profile builder and
+recommendation viewer pages.
+
+The string tables are turned into bundles when this module is imported. Each
+page embeds only its strings in the active language (``bundle``); the other
+languages are fetched from a versioned URL that serves ``language_bundles``,
+serialized, hashed and gzip/brotli-compressed once instead of per request.
+"""
+import gzip
+import hashlib
+import json
+
+from django.urls import reverse
+from django.utils import translation
+from django.utils.safestring import mark_safe
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available.
+    brotli = None
+
+LANGUAGES = ('en', 'hi', 'ta', 'bn', 'gu')
+DEFAULT_LANGUAGE = 'en'
+
+AUTH_STRINGS = {
+    'en': {
+        "pageTitle": "Career Navigator - Login & Signup",
+        "navBrand": "Dream Engine",
+        "loginTitle": "Welcome Back",
+        "signupTitle": "Create Account",
+        "loginSubtitle": "Sign in to your account to continue",
+        "signupSubtitle": "Join us and start your career journey",
+        "email": "Email Address",
+        "password": "Password",
+        "confirmPassword": "Confirm Password",
+        "fullName": "Full Name",
+        "role": "Select Role",
+        "learner": "Learner",
+        "admin": "Admin",
+        "loginBtn": "Login",
+        "signupBtn": "Sign Up",
+        "switchToSignup": "Don't have an account? Sign up",
+        "switchToLogin": "Already have an account? Login",
+        "forgotPassword": "Forgot Password?",
+        "rememberMe": "Remember Me",
+        "loading": "Loading...",
+        "successTitle": "Success!",
+        "successMessage": "Redirecting...",
+        "passwordMismatch": "Passwords do not match",
+        "errorOccurred": "An error occurred"
+    },
+    'hi': {
+        "pageTitle": "करियर नेविगेटर - लॉगिन और साइनअप",
+        "navBrand": "ड्रीम इंजन",
+        "loginTitle": "वापस स्वागत है",
+        "signupTitle": "खाता बनाएं",
+        "loginSubtitle": "जारी रखने के लिए अपने खाते में साइन इन करें",
+        "signupSubtitle": "हमसे जुड़ें और अपनी करियर यात्रा शुरू करें",
+        "email": "ईमेल पता",
+        "password": "पासवर्ड",
+        "confirmPassword": "पासवर्ड की पुष्टि करें",
+        "fullName": "पूरा नाम",
+        "role": "भूमिका चुनें",
+        "learner": "सीखने वाला",
+        "admin": "प्रशासक",
+        "loginBtn": "लॉगिन",
+        "signupBtn": "साइन अप",
+        "switchToSignup": "खाता नहीं है? साइन अप करें",
+        "switchToLogin": "पहले से खाता है? लॉगिन करें",
+        "forgotPassword": "पासवर्ड भूल गए?",
+        "rememberMe": "मुझे याद रखें",
+        "loading": "लोड हो रहा है...",
+        "successTitle": "सफलता!",
+        "successMessage": "पुनर्निर्देशित हो रहा है...",
+        "passwordMismatch": "पासवर्ड मेल नहीं खाते",
+        "errorOccurred": "एक त्रुटि हुई"
+    },
+    'ta': {
+        "pageTitle": "தொழில் வழிகாட்டி - உள்நுழைவு மற்றும் பதிவு",
+        "navBrand": "கனவு இயந்திரம்",
+        "loginTitle": "மீண்டும் வரவேற்கிறோம்",
+        "signupTitle": "கணக்கை உருவாக்கவும்",
+        "loginSubtitle": "தொடர்ந்து உங்கள் கணக்கில் உள்நுழையவும்",
+        "signupSubtitle": "எங்களுடன் சேர்ந்து உங்கள் தொழில் பயணத்தைத் தொடங்கவும்",
+        "email": "மின்னஞ்சல் முகவரி",
+        "password": "கடவுச்சொல்",
+        "confirmPassword": "கடவுச்சொல்லை உறுதிப்படுத்தவும்",
+        "fullName": "முழு பெயர்",
+        "role": "பாத்திரத்தைத் தேர்ந்தெடுக்கவும்",
+        "learner": "கற்றவர்",
+        "admin": "நிர்வாகி",
+        "loginBtn": "உள்நுழைவு",
+        "signupBtn": "பதிவு செய்க",
+        "switchToSignup": "கணக்கு இல்லையா? பதிவு செய்க",
+        "switchToLogin": "ஏற்கனவே கணக்கு உள்ளதா? உள்நுழையவும்",
+        "forgotPassword": "கடவுச்சொல் மறந்துவிட்டதா?",
+        "rememberMe": "என்னை நினைவில் வைத்திருங்கள்",
+        "loading": "ஏற்றுகிறது...",
+        "successTitle": "வெற்றி!",
+        "successMessage": "திருப்பி அனுப்புகிறது...",
+        "passwordMismatch": "கடவுச்சொற்கள் பொருந்தவில்லை",
+        "errorOccurred": "பிழை ஏற்பட்டது"
+    },
+    'bn': {
+        "pageTitle": "ক্যারিয়ার নেভিগেটর - লগইন এবং সাইন আপ",
+        "navBrand": "স্বপ্ন ইঞ্জিন",
+        "loginTitle": "ফিরে স্বাগতম",
+        "signupTitle": "অ্যাকাউন্ট তৈরি করুন",
+        "loginSubtitle": "চালিয়ে যেতে আপনার অ্যাকাউন্টে সাইন ইন করুন",
+        "signupSubtitle": "আমাদের সাথে যোগ দিন এবং আপনার ক্যারিয়ার যাত্রা শুরু করুন",
+        "email": "ইমেইল ঠিকানা",
+        "password": "পাসওয়ার্ড",
+        "confirmPassword": "পাসওয়ার্ড নিশ্চিত করুন",
+        "fullName": "পুরো নাম",
+        "role": "ভূমিকা নির্বাচন করুন",
+        "learner": "শিক্ষার্থী",
+        "admin": "অ্যাডমিন",
+        "loginBtn": "লগইন",
+        "signupBtn": "সাইন আপ",
+        "switchToSignup": "অ্যাকাউন্ট নেই? সাইন আপ করুন",
+        "switchToLogin": "ইতিমধ্যে অ্যাকাউন্ট আছে? লগইন করুন",
+        "forgotPassword": "পাসওয়ার্ড ভুলে গেছেন?",
+        "rememberMe": "আমাকে মনে রাখুন",
+        "loading": "লোড হচ্ছে...",
+        "successTitle": "সফল!",
+        "successMessage": "পুনঃনির্দেশিত হচ্ছে...",
+        "passwordMismatch": "পাসওয়ার্ড মিলছে না",
+        "errorOccurred": "একটি ত্রুটি ঘটেছে"
+    },
+    'gu': {
+        "pageTitle": "કારિયર નેવિગેટર - લોગિન અને સાઇનઅપ",
+        "navBrand": "ડ્રીમ એન્જિન",
+        "loginTitle": "પાછા સ્વાગત છે",
+        "signupTitle": "એકાઉન્ટ બનાવો",
+        "loginSubtitle": "ચાલુ રાખવા માટે તમારા એકાઉન્ટમાં સાઇન ઇન કરો",
+        "signupSubtitle": "અમારી સાથે જોડાઓ અને તમારી કારિયર યાત્રા શરૂ કરો",
+        "email": "ઇમેઇલ સરનામું",
+        "password": "પાસવર્ડ",
+        "confirmPassword": "પાસવર્ડની પુષ્ટિ કરો",
+        "fullName": "પૂરું નામ",
+        "role": "ભૂમિકા પસંદ કરો",
+        "learner": "શીખનાર",
+        "admin": "એડમિન",
+        "loginBtn": "લોગિન",
+        "signupBtn": "સાઇન અપ",
+        "switchToSignup": "એકાઉન્ટ નથી? સાઇન અપ કરો",
+        "switchToLogin": "પહેલેથી એકાઉન્ટ છે? લોગિન કરો",
+        "forgotPassword": "પાસવર્ડ ભૂલી ગયા?",
+        "rememberMe": "મને યાદ રાખો",
+        "loading": "લોડ થઈ રહ્યું છે...",
+        "successTitle": "સફળતા!",
+        "successMessage": "રીડાયરેક્ટ થઈ રહ્યું છે...",
+        "passwordMismatch": "પાસવર્ડ મેળ ખાતા નથી",
+        "errorOccurred": "એક ભૂલ આવી"
+    }
+}
+
+
+DASHBOARD_STRINGS = {
+    'en': {
+        'pageTitle': 'Career Navigator - Learner Dashboard',
+        'pageDescription': 'Your personalized learning dashboard for career development',
+        'navBrand': 'CareerNav',
+        'selectLanguage': 'Select language',
+        'welcome': 'Welcome back',
+        'welcomeSubtitle': 'Ready to continue your learning journey?',
+        'profileCard': 'Profile Card',
+        'learningProgress': 'Learning Progress',
+        'quickActions': 'Quick Actions',
+        'motivationalQuote': 'Motivational Quote',
+        'currentLevel': 'Current Level',
+        'skillsLearned': 'Skills Learned',
+        'coursesCompleted': 'Courses Completed',
+        'hoursSpent': 'Hours Spent',
+        'achievements': 'Achievements',
+        'profileBuilder': 'Profile Builder',
+        'buildProfile': 'Build Your Profile',
+        'careerExplorer': 'Career Explorer',
+        'exploreCareers': 'Explore Careers',
+        'recommendationViewer': 'Recommendation Viewer',
+        'viewRecommendations': 'View Recommendations',
+        'logout': 'Logout',
+        'settings': 'Settings',
+        'notifications': 'Notifications',
+        'nextMilestone': 'Next Milestone',
+        'quote1': 'Success is not final, failure is not fatal: it is the courage to continue that counts.',
+        'quote2': 'The future belongs to those who believe in the beauty of their dreams.',
+        'quote3': 'Education is the most powerful weapon which you can use to change the world.',
+        'quote4': 'The only way to do great work is to love what you do.',
+        'quote5': 'Innovation distinguishes between a leader and a follower.',
+        'aiAssistant': 'AI Career Assistant',
+        'typePlaceholder': 'Type your message here...',
+        'aiWelcome': "Hello! I'm your AI Career Assistant. How can I help you today?",
+    },
+    'hi': {
+        'pageTitle': 'करियर नेविगेटर - लर्नर डैशबोर्ड',
+        'pageDescription': 'करियर विकास के लिए आपका व्यक्तिगत शिक्षण डैशबोर्ड',
+        'navBrand': 'करियरनव',
+        'selectLanguage': 'भाषा चुनें',
+        'welcome': 'वापस स्वागत है',
+        'welcomeSubtitle': 'अपनी सीखने की यात्रा जारी रखने के लिए तैयार हैं?',
+        'profileCard': 'प्रोफाइल कार्ड',
+        'learningProgress': 'सीखने की प्रगति',
+        'quickActions': 'त्वरित कार्य',
+        'motivationalQuote': 'प्रेरणादायक उद्धरण',
+        'currentLevel': 'वर्तमान स्तर',
+        'skillsLearned': 'सीखे गए कौशल',
+        'coursesCompleted': 'पूर्ण किए गए पाठ्यक्रम',
+        'hoursSpent': 'बिताए गए घंटे',
+        'achievements': 'उपलब्धियां',
+        'profileBuilder': 'प्रोफाइल बिल्डर',
+        'buildProfile': 'अपना प्रोफाइल बनाएं',
+        'careerExplorer': 'करियर एक्सप्लोरर',
+        'exploreCareers': 'करियर का अन्वेषण करें',
+        'recommendationViewer': 'सिफारिश व्यूअर',
+        'viewRecommendations': 'सिफारिशें देखें',
+        'logout': 'लॉगआउट',
+        'settings': 'सेटिंग्स',
+        'notifications': 'सूचनाएं',
+        'nextMilestone': 'अगला माइलस्टोन',
+        'quote1': 'सफलता अंतिम नहीं है, असफलता घातक नहीं है: जारी रखने का साहस ही मायने रखता है।',
+        'quote2': 'भविष्य उनका है जो अपने सपनों की सुंदरता में विश्वास करते हैं।',
+        'quote3': 'शिक्षा सबसे शक्तिशाली हथियार है जिसका उपयोग आप दुनिया को बदलने के लिए कर सकते हैं।',
+        'quote4': 'महान काम करने का एकमात्र तरीका यह है कि आप जो करते हैं उससे प्यार करें।',
+        'quote5': 'नवाचार एक नेता और अनुयायी के बीच अंतर करता है।',
+        'aiAssistant': 'एआई करियर सहायक',
+        'typePlaceholder': 'अपना संदेश यहां लिखें...',
+        'aiWelcome': 'नमस्ते! मैं आपका एआई करियर सहायक हूं। आज मैं आपकी कैसे मदद कर सकता हूं?',
+    },
+    'ta': {
+        'pageTitle': 'தொழில் வழிகாட்டி - கற்றவர் டாஷ்போர்டு',
+        'pageDescription': 'தொழில் வளர்ச்சிக்கான உங்கள் தனிப்பட்ட கற்றல் டாஷ்போர்டு',
+        'navBrand': 'தொழில்வழி',
+        'selectLanguage': 'மொழியைத் தேர்ந்தெடுக்கவும்',
+        'welcome': 'மீண்டும் வரவேற்கிறோம்',
+        'welcomeSubtitle': 'உங்கள் கற்றல் பயணத்தைத் தொடர தயாரா?',
+        'profileCard': 'சுயவிவர அட்டை',
+        'learningProgress': 'கற்றல் முன்னேற்றம்',
+        'quickActions': 'விரைவு செயல்கள்',
+        'motivationalQuote': 'உத்வேகமளிக்கும் மேற்கோள்',
+        'currentLevel': 'தற்போதைய நிலை',
+        'skillsLearned': 'கற்ற திறன்கள்',
+        'coursesCompleted': 'முடிக்கப்பட்ட படிப்புகள்',
+        'hoursSpent': 'செலவழித்த மணிநேரங்கள்',
+        'achievements': 'சாதனைகள்',
+        'profileBuilder': 'சுயவிவர கட்டுநர்',
+        'buildProfile': 'உங்கள் சுயவிவரத்தை உருவாக்குங்கள்',
+        'careerExplorer': 'தொழில் ஆராய்ச்சியாளர்',
+        'exploreCareers': 'தொழில்களை ஆராயுங்கள்',
+        'recommendationViewer': 'பரிந்துரை காட்சியாளர்',
+        'viewRecommendations': 'பரிந்துரைகளைப் பாருங்கள்',
+        'logout': 'வெளியேறு',
+        'settings': 'அமைப்புகள்',
+        'notifications': 'அறிவிப்புகள்',
+        'nextMilestone': 'அடுத்த மைல்கல்',
+        'quote1': 'வெற்றி இறுதியானது அல்ல, தோல்வி மரணமானது அல்ல: தொடர்ந்து செல்லும் தைரியம்தான் முக்கியம்.',
+        'quote2': 'எதிர்காலம் தங்கள் கனவுகளின் அழகில் நம்பிக்கை வைத்தவர்களுக்கு சொந்தமானது.',
+        'quote3': 'கல்வி என்பது உலகை மாற்ற நீங்கள் பயன்படுத்தக்கூடிய மிகவும் சக்திவாய்ந்த ஆயுதம்.',
+        'quote4': 'சிறந்த வேலை செய்ய ஒரே வழி, நீங்கள் செய்வதை நேசிப்பதுதான்.',
+        'quote5': 'புதுமை ஒரு தலைவர் மற்றும் பின்பற்றுபவருக்கு இடையே வேறுபாட்டை ஏற்படுத்துகிறது.',
+        'aiAssistant': 'AI தொழில் உதவியாளர்',
+        'typePlaceholder': 'உங்கள் செய்தியை இங்கே தட்டச்சு செய்யவும்...',
+        'aiWelcome': 'வணக்கம்! நான் உங்கள் AI தொழில் உதவியாளர். இன்று நான் உங்களுக்கு எப்படி உதவ முடியும்?',
+    },
+    'bn': {
+        'pageTitle': 'ক্যারিয়ার নেভিগেটর - লার্নার ড্যাশবোর্ড',
+        'pageDescription': 'ক্যারিয়ার উন্নয়নের জন্য আপনার ব্যক্তিগত শিক্ষার ড্যাশবোর্ড',
+        'navBrand': 'ক্যারিয়ারনেভ',
+        'selectLanguage': 'ভাষা নির্বাচন করুন',
+        'welcome': 'ফিরে স্বাগতম',
+        'welcomeSubtitle': 'আপনার শেখার যাত্রা চালিয়ে যেতে প্রস্তুত?',
+        'profileCard': 'প্রোফাইল কার্ড',
+        'learningProgress': 'শেখার অগ্রগতি',
+        'quickActions': 'দ্রুত কর্ম',
+        'motivationalQuote': 'প্রেরণাদায়ক উক্তি',
+        'currentLevel': 'বর্তমান স্তর',
+        'skillsLearned': 'শেখা দক্ষতা',
+        'coursesCompleted': 'সম্পূর্ণ কোর্স',
+        'hoursSpent': 'ব্যয়িত ঘন্টা',
+        'achievements': 'অর্জন',
+        'profileBuilder': 'প্রোফাইল বিল্ডার',
+        'buildProfile': 'আপনার প্রোফাইল তৈরি করুন',
+        'careerExplorer': 'ক্যারিয়ার এক্সপ্লোরার',
+        'exploreCareers': 'ক্যারিয়ার অন্বেষণ করুন',
+        'recommendationViewer': 'সুপারিশ দর্শক',
+        'viewRecommendations': 'সুপারিশ দেখুন',
+        'logout': 'লগআউট',
+        'settings': 'সেটিংস',
+        'notifications': 'বিজ্ঞপ্তি',
+        'nextMilestone': 'পরবর্তী মাইলফলক',
+        'quote1': 'সাফল্য চূড়ান্ত নয়, ব্যর্থতা মারাত্মক নয়: এগিয়ে যাওয়ার সাহসই গুরুত্বপূর্ণ।',
+        'quote2': 'ভবিষ্যত তাদের যারা তাদের স্বপ্নের সৌন্দর্যে বিশ্বাস করে।',
+        'quote3': 'শিক্ষা সবচেয়ে শক্তিশালী অস্ত্র যা আপনি বিশ্বকে পরিবর্তন করতে ব্যবহার করতে পারেন।',
+        'quote4': 'মহান কাজ করার একমাত্র উপায় হল আপনি যা করেন তা ভালবাসা।',
+        'quote5': 'নবাচার একজন নেতা এবং অনুসরণকারীর মধ্যে পার্থক্য করে।',
+        'aiAssistant': 'AI ক্যারিয়ার সহায়ক',
+        'typePlaceholder': 'এখানে আপনার বার্তা টাইপ করুন...',
+        'aiWelcome': 'হ্যালো! আমি আপনার AI ক্যারিয়ার সহায়ক। আজ আমি আপনাকে কীভাবে সাহায্য করতে পারি?',
+    },
+    'gu': {
+        'pageTitle': 'કારિયર નેવિગેટર - લર્નર ડેશબોર્ડ',
+        'pageDescription': 'કારિયર વિકાસ માટે તમારું વ્યક્તિગત શિક્ષણ ડેશબોર્ડ',
+        'navBrand': 'કારિયરનવ',
+        'selectLanguage': 'ભાષા પસંદ કરો',
+        'welcome': 'પાછા સ્વાગત છે',
+        'welcomeSubtitle': 'તમારી શિક્ષણ યાત્રા ચાલુ રાખવા તૈયાર છો?',
+        'profileCard': 'પ્રોફાઇલ કાર્ડ',
+        'learningProgress': 'શીખવાની પ્રગતિ',
+        'quickActions': 'ઝડપી ક્રિયાઓ',
+        'motivationalQuote': 'પ્રેરણાદાયક ઉદ્ધરણ',
+        'currentLevel': 'વર્તમાન સ્તર',
+        'skillsLearned': 'શીખેલ કૌશલ્યો',
+        'coursesCompleted': 'પૂર્ણ કરેલા અભ્યાસક્રમો',
+        'hoursSpent': 'ખર્ચાયેલા કલાકો',
+        'achievements': 'પ્રાપ્તિઓ',
+        'profileBuilder': 'પ્રોફાઇલ બિલ્ડર',
+        'buildProfile': 'તમારું પ્રોફાઇલ બનાવો',
+        'careerExplorer': 'કારિયર એક્સપ્લોરર',
+        'exploreCareers': 'કારિયરનું અન્વેષણ કરો',
+        'recommendationViewer': 'ભલામણ દર્શક',
+        'viewRecommendations': 'ભલામણો જુઓ',
+        'logout': 'લોગઆઉટ',
+        'settings': 'સેટિંગ્સ',
+        'notifications': 'સૂચનાઓ',
+        'nextMilestone': 'આગળનું માઇલસ્ટોન',
+        'quote1': 'સફળતા અંતિમ નથી, નિષ્ફળતા ઘાતક નથી: ચાલુ રાખવાની હિંમત જ મહત્વની છે।',
+        'quote2': 'ભવિષ્ય તેમનું છે જે પોતાના સપનાઓની સુંદરતામાં વિશ્વાસ રાખે છે।',
+        'quote3': 'શિક્ષણ સૌથી શક્તિશાળી શસ્ત્ર છે જેનો ઉપયોગ તમે વિશ્વને બદલવા માટે કરી શકો છો।',
+        'quote4': 'મહાન કામ કરવાનો એકમાત્ર રસ્તો એ છે કે તમે જે કરો છો તેને પ્રેમ કરો।',
+        'quote5': 'નવીનતા એક નેતા અને અનુયાયી વચ્ચે તફાવત કરે છે।',
+        'aiAssistant': 'AI કારકિર્દી સહાયક',
+        'typePlaceholder': 'તમારો સંદેશ અહીં લખો...',
+        'aiWelcome': 'નમસ્તે! હું તમારો AI કારકિર્દી સહાયક છું. આજે હું તમને કેવી રીતે મદદ કરી શકું?',
+    }
+}
+
+
+CAREER_EXPLORER_STRINGS = {
+    'en': {
+        'pageTitle': 'Career Navigator - Career Explorer',
+        'pageDescription': 'Explore NSQF courses and job roles with our interactive career explorer',
+        'navBrand': 'CareerNav',
+        'selectLanguage': 'Select language',
+        'careerExplorer': 'Career Explorer',
+        'exploreCareers': 'Explore Careers',
+        'searchPlaceholder': 'Search courses and jobs...',
+        'filterBy': 'Filter by',
+        'all': 'All',
+        'courses': 'Courses',
+        'jobs': 'Job Roles',
+        'level': 'Level',
+        'sector': 'Sector',
+        'duration': 'Duration',
+        'salary': 'Salary Range',
+        'requirements': 'Requirements',
+        'skills': 'Skills',
+        'certification': 'Certification',
+        'applyNow': 'Apply Now',
+        'learnMore': 'Learn More',
+        'viewDetails': 'View Details',
+        'noResults': 'No results found',
+        'tryDifferentSearch': 'Try a different search term',
+        'loading': 'Loading...',
+        'loadMore': 'Load more',
+        'course1': 'Software Development',
+        'course2': 'Data Analytics',
+        'course3': 'Digital Marketing',
+        'course4': 'Cybersecurity',
+        'course5': 'Cloud Computing',
+        'course6': 'AI & Machine Learning',
+        'job1': 'Software Engineer',
+        'job2': 'Data Scientist',
+        'job3': 'Digital Marketer',
+        'job4': 'Cybersecurity Analyst',
+        'job5': 'Cloud Architect',
+        'job6': 'AI Engineer',
+        'level1': 'Level 1',
+        'level2': 'Level 2',
+        'level3': 'Level 3',
+        'level4': 'Level 4',
+        'level5': 'Level 5',
+        'level6': 'Level 6',
+        'level7': 'Level 7',
+        'level8': 'Level 8',
+        'level9': 'Level 9',
+        'level10': 'Level 10',
+        'sector1': 'Information Technology',
+        'sector2': 'Healthcare',
+        'sector3': 'Finance',
+        'sector4': 'Manufacturing',
+        'sector5': 'Education',
+        'sector6': 'Retail',
+        'duration1': '3 months',
+        'duration2': '6 months',
+        'duration3': '1 year',
+        'duration4': '2 years',
+        'salary1': '₹3-5 LPA',
+        'salary2': '₹5-8 LPA',
+        'salary3': '₹8-12 LPA',
+        'salary4': '₹12-20 LPA',
+        'salary5': '₹20+ LPA',
+        'requirements1': 'Basic computer knowledge',
+        'requirements2': 'High school diploma',
+        'requirements3': 'Bachelor degree',
+        'requirements4': 'Master degree',
+        'requirements5': 'Professional experience',
+        'skills1': 'Programming',
+        'skills2': 'Data Analysis',
+        'skills3': 'Marketing',
+        'skills4': 'Security',
+        'skills5': 'Cloud Computing',
+        'skills6': 'Machine Learning',
+        'certification1': 'NSQF Level 4',
+        'certification2': 'NSQF Level 5',
+        'certification3': 'NSQF Level 6',
+        'certification4': 'NSQF Level 7',
+        'certification5': 'NSQF Level 8',
+        'certification6': 'NSQF Level 9',
+    },
+    'hi': {
+        'pageTitle': 'करियर नेविगेटर - करियर एक्सप्लोरर',
+        'pageDescription': 'हमारे इंटरैक्टिव करियर एक्सप्लोरर के साथ NSQF पाठ्यक्रम और नौकरी भूमिकाओं का अन्वेषण करें',
+        'navBrand': 'करियरनव',
+        'selectLanguage': 'भाषा चुनें',
+        'careerExplorer': 'करियर एक्सप्लोरर',
+        'exploreCareers': 'करियर का अन्वेषण करें',
+        'searchPlaceholder': 'पाठ्यक्रम और नौकरियों की खोज करें...',
+        'filterBy': 'फिल्टर करें',
+        'all': 'सभी',
+        'courses': 'पाठ्यक्रम',
+        'jobs': 'नौकरी भूमिकाएं',
+        'level': 'स्तर',
+        'sector': 'क्षेत्र',
+        'duration': 'अवधि',
+        'salary': 'वेतन सीमा',
+        'requirements': 'आवश्यकताएं',
+        'skills': 'कौशल',
+        'certification': 'प्रमाणन',
+        'applyNow': 'अभी आवेदन करें',
+        'learnMore': 'और जानें',
+        'viewDetails': 'विवरण देखें',
+        'noResults': 'कोई परिणाम नहीं मिला',
+        'tryDifferentSearch': 'एक अलग खोज शब्द आज़माएं',
+        'loading': 'लोड हो रहा है...',
+        'loadMore': 'और लोड करें',
+        'course1': 'सॉफ्टवेयर विकास',
+        'course2': 'डेटा विश्लेषण',
+        'course3': 'डिजिटल मार्केटिंग',
+        'course4': 'साइबर सुरक्षा',
+        'course5': 'क्लाउड कंप्यूटिंग',
+        'course6': 'AI और मशीन लर्निंग',
+        'job1': 'सॉफ्टवेयर इंजीनियर',
+        'job2': 'डेटा वैज्ञानिक',
+        'job3': 'डिजिटल मार्केटर',
+        'job4': 'साइबर सुरक्षा विश्लेषक',
+        'job5': 'क्लाउड आर्किटेक्ट',
+        'job6': 'AI इंजीनियर',
+        'level1': 'स्तर 1',
+        'level2': 'स्तर 2',
+        'level3': 'स्तर 3',
+        'level4': 'स्तर 4',
+        'level5': 'स्तर 5',
+        'level6': 'स्तर 6',
+        'level7': 'स्तर 7',
+        'level8': 'स्तर 8',
+        'level9': 'स्तर 9',
+        'level10': 'स्तर 10',
+        'sector1': 'सूचना प्रौद्योगिकी',
+        'sector2': 'स्वास्थ्य सेवा',
+        'sector3': 'वित्त',
+        'sector4': 'विनिर्माण',
+        'sector5': 'शिक्षा',
+        'sector6': 'खुदरा',
+        'duration1': '3 महीने',
+        'duration2': '6 महीने',
+        'duration3': '1 वर्ष',
+        'duration4': '2 वर्ष',
+        'salary1': '₹3-5 लाख प्रति वर्ष',
+        'salary2': '₹5-8 लाख प्रति वर्ष',
+        'salary3': '₹8-12 लाख प्रति वर्ष',
+        'salary4': '₹12-20 लाख प्रति वर्ष',
+        'salary5': '₹20+ लाख प्रति वर्ष',
+        'requirements1': 'बुनियादी कंप्यूटर ज्ञान',
+        'requirements2': 'हाई स्कूल डिप्लोमा',
+        'requirements3': 'स्नातक डिग्री',
+        'requirements4': 'स्नातकोत्तर डिग्री',
+        'requirements5': 'पेशेवर अनुभव',
+        'skills1': 'प्रोग्रामिंग',
+        'skills2': 'डेटा विश्लेषण',
+        'skills3': 'मार्केटिंग',
+        'skills4': 'सुरक्षा',
+        'skills5': 'क्लाउड कंप्यूटिंग',
+        'skills6': 'मशीन लर्निंग',
+        'certification1': 'NSQF स्तर 4',
+        'certification2': 'NSQF स्तर 5',
+        'certification3': 'NSQF स्तर 6',
+        'certification4': 'NSQF स्तर 7',
+        'certification5': 'NSQF स्तर 8',
+        'certification6': 'NSQF स्तर 9',
+    },
+    'ta': {
+        'pageTitle': 'தொழில் வழிகாட்டி - தொழில் ஆராய்ச்சியாளர்',
+        'pageDescription': 'எங்கள் இடைவினை தொழில் ஆராய்ச்சியாளருடன் NSQF படிப்புகள் மற்றும் வேலை பாத்திரங்களை ஆராயுங்கள்',
+        'navBrand': 'தொழில்வழி',
+        'selectLanguage': 'மொழியைத் தேர்ந்தெடுக்கவும்',
+        'careerExplorer': 'தொழில் ஆராய்ச்சியாளர்',
+        'exploreCareers': 'தொழில்களை ஆராயுங்கள்',
+        'searchPlaceholder': 'படிப்புகள் மற்றும் வேலைகளைத் தேடுங்கள்...',
+        'filterBy': 'வடிகட்டு',
+        'all': 'அனைத்தும்',
+        'courses': 'படிப்புகள்',
+        'jobs': 'வேலை பாத்திரங்கள்',
+        'level': 'நிலை',
+        'sector': 'துறை',
+        'duration': 'காலம்',
+        'salary': 'சம்பள வரம்பு',
+        'requirements': 'தேவைகள்',
+        'skills': 'திறன்கள்',
+        'certification': 'சான்றிதழ்',
+        'applyNow': 'இப்போது விண்ணப்பிக்கவும்',
+        'learnMore': 'மேலும் அறிக',
+        'viewDetails': 'விவரங்களைப் பாருங்கள்',
+        'noResults': 'முடிவுகள் எதுவும் கிடைக்கவில்லை',
+        'tryDifferentSearch': 'வேறு தேடல் சொல்லை முயற்சிக்கவும்',
+        'loading': 'ஏற்றப்படுகிறது...',
+        'loadMore': 'மேலும் ஏற்று',
+        'course1': 'மென்பொருள் மேம்பாடு',
+        'course2': 'தரவு பகுப்பாய்வு',
+        'course3': 'டிஜிட்டல் மார்க்கெட்டிங்',
+        'course4': 'சைபர் பாதுகாப்பு',
+        'course5': 'கிளவுட் கம்ப்யூட்டிங்',
+        'course6': 'AI மற்றும் மெஷின் லர்னிங்',
+        'job1': 'மென்பொருள் பொறியாளர்',
+        'job2': 'தரவு விஞ்ஞானி',
+        'job3': 'டிஜிட்டல் மார்க்கெட்டர்',
+        'job4': 'சைபர் பாதுகாப்பு பகுப்பாய்வாளர்',
+        'job5': 'கிளவுட் கட்டிடக் கலைஞர்',
+        'job6': 'AI பொறியாளர்',
+        'level1': 'நிலை 1',
+        'level2': 'நிலை 2',
+        'level3': 'நிலை 3',
+        'level4': 'நிலை 4',
+        'level5': 'நிலை 5',
+        'level6': 'நிலை 6',
+        'level7': 'நிலை 7',
+        'level8': 'நிலை 8',
+        'level9': 'நிலை 9',
+        'level10': 'நிலை 10',
+        'sector1': 'தகவல் தொழில்நுட்பம்',
+        'sector2': 'சுகாதாரம்',
+        'sector3': 'நிதி',
+        'sector4': 'உற்பத்தி',
+        'sector5': 'கல்வி',
+        'sector6': 'சில்லறை',
+        'duration1': '3 மாதங்கள்',
+        'duration2': '6 மாதங்கள்',
+        'duration3': '1 வருடம்',
+        'duration4': '2 வருடங்கள்',
+        'salary1': '₹3-5 லட்சம் ஆண்டுக்கு',
+        'salary2': '₹5-8 லட்சம் ஆண்டுக்கு',
+        'salary3': '₹8-12 லட்சம் ஆண்டுக்கு',
+        'salary4': '₹12-20 லட்சம் ஆண்டுக்கு',
+        'salary5': '₹20+ லட்சம் ஆண்டுக்கு',
+        'requirements1': 'அடிப்படை கணினி அறிவு',
+        'requirements2': 'உயர்நிலை பள்ளி டிப்ளமோ',
+        'requirements3': 'இளங்கலை பட்டம்',
+        'requirements4': 'முதுகலை பட்டம்',
+        'requirements5': 'தொழில்முறை அனுபவம்',
+        'skills1': 'நிரலாக்கம்',
+        'skills2': 'தரவு பகுப்பாய்வு',
+        'skills3': 'மார்க்கெட்டிங்',
+        'skills4': 'பாதுகாப்பு',
+        'skills5': 'கிளவுட் கம்ப்யூட்டிங்',
+        'skills6': 'மெஷின் லர்னிங்',
+        'certification1': 'NSQF நிலை 4',
+        'certification2': 'NSQF நிலை 5',
+        'certification3': 'NSQF நிலை 6',
+        'certification4': 'NSQF நிலை 7',
+        'certification5': 'NSQF நிலை 8',
+        'certification6': 'NSQF நிலை 9',
+    },
+    'bn': {
+        'pageTitle': 'ক্যারিয়ার নেভিগেটর - ক্যারিয়ার এক্সপ্লোরার',
+        'pageDescription': 'আমাদের ইন্টারঅ্যাক্টিভ ক্যারিয়ার এক্সপ্লোরারের সাথে NSQF কোর্স এবং চাকরির ভূমিকা অন্বেষণ করুন',
+        'navBrand': 'ক্যারিয়ারনেভ',
+        'selectLanguage': 'ভাষা নির্বাচন করুন',
+        'careerExplorer': 'ক্যারিয়ার এক্সপ্লোরার',
+        'exploreCareers': 'ক্যারিয়ার অন্বেষণ করুন',
+        'searchPlaceholder': 'কোর্স এবং চাকরি খুঁজুন...',
+        'filterBy': 'ফিল্টার করুন',
+        'all': 'সব',
+        'courses': 'কোর্স',
+        'jobs': 'চাকরির ভূমিকা',
+        'level': 'স্তর',
+        'sector': 'খাত',
+        'duration': 'সময়কাল',
+        'salary': 'বেতনের পরিসর',
+        'requirements': 'প্রয়োজনীয়তা',
+        'skills': 'দক্ষতা',
+        'certification': 'সার্টিফিকেশন',
+        'applyNow': 'এখনই আবেদন করুন',
+        'learnMore': 'আরও জানুন',
+        'viewDetails': 'বিস্তারিত দেখুন',
+        'noResults': 'কোন ফলাফল পাওয়া যায়নি',
+        'tryDifferentSearch': 'একটি ভিন্ন অনুসন্ধান শব্দ চেষ্টা করুন',
+        'loading': 'লোড হচ্ছে...',
+        'loadMore': 'আরও লোড করুন',
+        'course1': 'সফ্টওয়্যার ডেভেলপমেন্ট',
+        'course2': 'ডেটা অ্যানালিটিক্স',
+        'course3': 'ডিজিটাল মার্কেটিং',
+        'course4': 'সাইবার সিকিউরিটি',
+        'course5': 'ক্লাউড কম্পিউটিং',
+        'course6': 'AI এবং মেশিন লার্নিং',
+        'job1': 'সফ্টওয়্যার ইঞ্জিনিয়ার',
+        'job2': 'ডেটা সায়েন্টিস্ট',
+        'job3': 'ডিজিটাল মার্কেটার',
+        'job4': 'সাইবার সিকিউরিটি অ্যানালিস্ট',
+        'job5': 'ক্লাউড আর্কিটেক্ট',
+        'job6': 'AI ইঞ্জিনিয়ার',
+        'level1': 'স্তর 1',
+        'level2': 'স্তর 2',
+        'level3': 'স্তর 3',
+        'level4': 'স্তর 4',
+        'level5': 'স্তর 5',
+        'level6': 'স্তর 6',
+        'level7': 'স্তর 7',
+        'level8': 'স্তর 8',
+        'level9': 'স্তর 9',
+        'level10': 'স্তর 10',
+        'sector1': 'তথ্য প্রযুক্তি',
+        'sector2': 'স্বাস্থ্যসেবা',
+        'sector3': 'অর্থসংস্থান',
+        'sector4': 'উৎপাদন',
+        'sector5': 'শিক্ষা',
+        'sector6': 'খুচরা',
+        'duration1': '3 মাস',
+        'duration2': '6 মাস',
+        'duration3': '1 বছর',
+        'duration4': '2 বছর',
+        'salary1': '₹3-5 লাখ প্রতি বছর',
+        'salary2': '₹5-8 লাখ প্রতি বছর',
+        'salary3': '₹8-12 লাখ প্রতি বছর',
+        'salary4': '₹12-20 লাখ প্রতি বছর',
+        'salary5': '₹20+ লাখ প্রতি বছর',
+        'requirements1': 'বেসিক কম্পিউটার জ্ঞান',
+        'requirements2': 'হাই স্কুল ডিপ্লোমা',
+        'requirements3': 'স্নাতক ডিগ্রি',
+        'requirements4': 'স্নাতকোত্তর ডিগ্রি',
+        'requirements5': 'পেশাদার অভিজ্ঞতা',
+        'skills1': 'প্রোগ্রামিং',
+        'skills2': 'ডেটা অ্যানালিসিস',
+        'skills3': 'মার্কেটিং',
+        'skills4': 'নিরাপত্তা',
+        'skills5': 'ক্লাউড কম্পিউটিং',
+        'skills6': 'মেশিন লার্নিং',
+        'certification1': 'NSQF স্তর 4',
+        'certification2': 'NSQF স্তর 5',
+        'certification3': 'NSQF স্তর 6',
+        'certification4': 'NSQF স্তর 7',
+        'certification5': 'NSQF স্তর 8',
+        'certification6': 'NSQF স্তর 9',
+    },
+    'gu': {
+        'pageTitle': 'કારિયર નેવિગેટર - કારિયર એક્સપ્લોરર',
+        'pageDescription': 'અમારા ઇન્ટરએક્ટિવ કારિયર એક્સપ્લોરર સાથે NSQF અભ્યાસક્રમો અને નોકરીની ભૂમિકાઓનું અન્વેષણ કરો',
+        'navBrand': 'કારિયરનવ',
+        'selectLanguage': 'ભાષા પસંદ કરો',
+        'careerExplorer': 'કારિયર એક્સપ્લોરર',
+        'exploreCareers': 'કારિયરનું અન્વેષણ કરો',
+        'searchPlaceholder': 'અભ્યાસક્રમો અને નોકરીઓ શોધો...',
+        'filterBy': 'ફિલ્ટર કરો',
+        'all': 'બધા',
+        'courses': 'અભ્યાસક્રમો',
+        'jobs': 'નોકરીની ભૂમિકાઓ',
+        'level': 'સ્તર',
+        'sector': 'ક્ષેત્ર',
+        'duration': 'અવધિ',
+        'salary': 'શેરીની રેન્જ',
+        'requirements': 'જરૂરિયાતો',
+        'skills': 'કૌશલ્યો',
+        'certification': 'પ્રમાણપત્ર',
+        'applyNow': 'હવે અરજી કરો',
+        'learnMore': 'વધુ જાણો',
+        'viewDetails': 'વિગતો જુઓ',
+        'noResults': 'કોઈ પરિણામ મળ્યું નથી',
+        'tryDifferentSearch': 'વિવિધ શોધ શબ્દ અજમાવો',
+        'loading': 'લોડ થઈ રહ્યું છે...',
+        'loadMore': 'વધુ લોડ કરો',
+        'course1': 'સોફ્ટવેર ડેવલપમેન્ટ',
+        'course2': 'ડેટા એનાલિટિક્સ',
+        'course3': 'ડિજિટલ માર્કેટિંગ',
+        'course4': 'સાઇબર સુરક્ષા',
+        'course5': 'ક્લાઉડ કમ્પ્યુટિંગ',
+        'course6': 'AI અને મશીન લર્નિંગ',
+        'job1': 'સોફ્ટવેર એન્જિનિયર',
+        'job2': 'ડેટા સાયન્ટિસ્ટ',
+        'job3': 'ડિજિટલ માર્કેટર',
+        'job4': 'સાઇબર સુરક્ષા એનાલિસ્ટ',
+        'job5': 'ક્લાઉડ આર્કિટેક્ટ',
+        'job6': 'AI એન્જિનિયર',
+        'level1': 'સ્તર 1',
+        'level2': 'સ્તર 2',
+        'level3': 'સ્તર 3',
+        'level4': 'સ્તર 4',
+        'level5': 'સ્તર 5',
+        'level6': 'સ્તર 6',
+        'level7': 'સ્તર 7',
+        'level8': 'સ્તર 8',
+        'level9': 'સ્તર 9',
+        'level10': 'સ્તર 10',
+        'sector1': 'માહિતી ટેક્નોલોજી',
+        'sector2': 'આરોગ્યસેવા',
+        'sector3': 'નાણાકીય',
+        'sector4': 'ઉત્પાદન',
+        'sector5': 'શિક્ષણ',
+        'sector6': 'રિટેલ',
+        'duration1': '3 મહિના',
+        'duration2': '6 મહિના',
+        'duration3': '1 વર્ષ',
+        'duration4': '2 વર્ષ',
+        'salary1': '₹3-5 લાખ વાર્ષિક',
+        'salary2': '₹5-8 લાખ વાર્ષિક',
+        'salary3': '₹8-12 લાખ વાર્ષિક',
+        'salary4': '₹12-20 લાખ વાર્ષિક',
+        'salary5': '₹20+ લાખ વાર્ષિક',
+        'requirements1': 'મૂળભૂત કમ્પ્યુટર જ્ઞાન',
+        'requirements2': 'હાઇ સ્કૂલ ડિપ્લોમા',
+        'requirements3': 'સ્નાતક ડિગ્રી',
+        'requirements4': 'સ્નાતકોત્તર ડિગ્રી',
+        'requirements5': 'વ્યાવસાયિક અનુભવ',
+        'skills1': 'પ્રોગ્રામિંગ',
+        'skills2': 'ડેટા એનાલિસિસ',
+        'skills3': 'માર્કેટિંગ',
+        'skills4': 'સુરક્ષા',
+        'skills5': 'ક્લાઉડ કમ્પ્યુટિંગ',
+        'skills6': 'મશીન લર્નિંગ',
+        'certification1': 'NSQF સ્તર 4',
+        'certification2': 'NSQF સ્તર 5',
+        'certification3': 'NSQF સ્તર 6',
+        'certification4': 'NSQF સ્તર 7',
+        'certification5': 'NSQF સ્તર 8',
+        'certification6': 'NSQF સ્તર 9',
+    },
+}
+
+
+PROFILE_BUILDER_STRINGS = {
+    'en': {
+        'pageTitle': 'Career Navigator - Profile Builder',
+        'pageDescription': 'Build your professional profile with our AI-powered career navigator',
+        'navBrand': 'CareerNav',
+        'selectLanguage': 'Select language',
+        'profileBuilder': 'Profile Builder',
+        'buildProfile': 'Build Your Profile',
+        'step1': 'Personal Information',
+        'step2': 'Education & Skills',
+        'step3': 'Experience',
+        'step4': 'Preferences',
+        'step5': 'Review & Save',
+        'firstName': 'First Name',
+        'lastName': 'Last Name',
+        'email': 'Email Address',
+        'phone': 'Phone Number',
+        'location': 'Location',
+        'education': 'Education Level',
+        'skills': 'Skills',
+        'experience': 'Work Experience',
+        'preferences': 'Career Preferences',
+        'next': 'Next',
+        'previous': 'Previous',
+        'save': 'Save Profile',
+        'autoSave': 'Auto-saving...',
+        'saved': 'Profile Saved!',
+        'firstNameRequired': 'First name is required',
+        'lastNameRequired': 'Last name is required',
+        'emailRequired': 'Email is required',
+        'phoneRequired': 'Phone number is required',
+        'locationRequired': 'Location is required',
+        'educationRequired': 'Education level is required',
+        'skillsRequired': 'Please add at least one skill',
+        'experienceRequired': 'Work experience is required',
+        'preferencesRequired': 'Career preferences are required',
+        'invalidEmail': 'Please enter a valid email address',
+        'invalidPhone': 'Please enter a valid phone number',
+        'addSkill': 'Add Skill',
+        'removeSkill': 'Remove',
+        'skillPlaceholder': 'Enter a skill',
+        'experiencePlaceholder': 'Describe your work experience',
+        'preferencesPlaceholder': 'Describe your career preferences',
+        'profileComplete': 'Profile Complete!',
+        'profileSaved': 'Your profile has been saved successfully!',
+        'continueLearning': 'Continue Learning',
+    },
+    'hi': {
+        'pageTitle': 'करियर नेविगेटर - प्रोफाइल बिल्डर',
+        'pageDescription': 'हमारे AI-संचालित करियर नेविगेटर के साथ अपना पेशेवर प्रोफाइल बनाएं',
+        'navBrand': 'करियरनव',
+        'selectLanguage': 'भाषा चुनें',
+        'profileBuilder': 'प्रोफाइल बिल्डर',
+        'buildProfile': 'अपना प्रोफाइल बनाएं',
+        'step1': 'व्यक्तिगत जानकारी',
+        'step2': 'शिक्षा और कौशल',
+        'step3': 'अनुभव',
+        'step4': 'प्राथमिकताएं',
+        'step5': 'समीक्षा और सहेजें',
+        'firstName': 'पहला नाम',
+        'lastName': 'अंतिम नाम',
+        'email': 'ईमेल पता',
+        'phone': 'फोन नंबर',
+        'location': 'स्थान',
+        'education': 'शिक्षा स्तर',
+        'skills': 'कौशल',
+        'experience': 'काम का अनुभव',
+        'preferences': 'करियर प्राथमिकताएं',
+        'next': 'अगला',
+        'previous': 'पिछला',
+        'save': 'प्रोफाइल सहेजें',
+        'autoSave': 'स्वचालित सहेजा जा रहा है...',
+        'saved': 'प्रोफाइल सहेजा गया!',
+        'firstNameRequired': 'पहला नाम आवश्यक है',
+        'lastNameRequired': 'अंतिम नाम आवश्यक है',
+        'emailRequired': 'ईमेल आवश्यक है',
+        'phoneRequired': 'फोन नंबर आवश्यक है',
+        'locationRequired': 'स्थान आवश्यक है',
+        'educationRequired': 'शिक्षा स्तर आवश्यक है',
+        'skillsRequired': 'कृपया कम से कम एक कौशल जोड़ें',
+        'experienceRequired': 'काम का अनुभव आवश्यक है',
+        'preferencesRequired': 'करियर प्राथमिकताएं आवश्यक हैं',
+        'invalidEmail': 'कृपया एक वैध ईमेल पता दर्ज करें',
+        'invalidPhone': 'कृपया एक वैध फोन नंबर दर्ज करें',
+        'addSkill': 'कौशल जोड़ें',
+        'removeSkill': 'हटाएं',
+        'skillPlaceholder': 'एक कौशल दर्ज करें',
+        'experiencePlaceholder': 'अपने काम के अनुभव का वर्णन करें',
+        'preferencesPlaceholder': 'अपनी करियर प्राथमिकताओं का वर्णन करें',
+        'profileComplete': 'प्रोफाइल पूर्ण!',
+        'profileSaved': 'आपका प्रोफाइल सफलतापूर्वक सहेजा गया है!',
+        'continueLearning': 'सीखना जारी रखें',
+    },
+    'ta': {
+        'pageTitle': 'தொழில் வழிகாட்டி - சுயவிவர கட்டுநர்',
+        'pageDescription': 'எங்கள் AI-இயக்கப்பட்ட தொழில் வழிகாட்டியுடன் உங்கள் தொழில்முறை சுயவிவரத்தை உருவாக்குங்கள்',
+        'navBrand': 'தொழில்வழி',
+        'selectLanguage': 'மொழியைத் தேர்ந்தெடுக்கவும்',
+        'profileBuilder': 'சுயவிவர கட்டுநர்',
+        'buildProfile': 'உங்கள் சுயவிவரத்தை உருவாக்குங்கள்',
+        'step1': 'தனிப்பட்ட தகவல்',
+        'step2': 'கல்வி மற்றும் திறன்கள்',
+        'step3': 'அனுபவம்',
+        'step4': 'விருப்பங்கள்',
+        'step5': 'மறுஆய்வு மற்றும் சேமிப்பு',
+        'firstName': 'முதல் பெயர்',
+        'lastName': 'கடைசி பெயர்',
+        'email': 'மின்னஞ்சல் முகவரி',
+        'phone': 'தொலைபேசி எண்',
+        'location': 'இடம்',
+        'education': 'கல்வி நிலை',
+        'skills': 'திறன்கள்',
+        'experience': 'வேலை அனுபவம்',
+        'preferences': 'தொழில் விருப்பங்கள்',
+        'next': 'அடுத்து',
+        'previous': 'முந்தைய',
+        'save': 'சுயவிவரத்தை சேமிக்கவும்',
+        'autoSave': 'தானாக சேமிக்கப்படுகிறது...',
+        'saved': 'சுயவிவரம் சேமிக்கப்பட்டது!',
+        'firstNameRequired': 'முதல் பெயர் தேவை',
+        'lastNameRequired': 'கடைசி பெயர் தேவை',
+        'emailRequired': 'மின்னஞ்சல் தேவை',
+        'phoneRequired': 'தொலைபேசி எண் தேவை',
+        'locationRequired': 'இடம் தேவை',
+        'educationRequired': 'கல்வி நிலை தேவை',
+        'skillsRequired': 'தயவுசெய்து குறைந்தது ஒரு திறனைச் சேர்க்கவும்',
+        'experienceRequired': 'வேலை அனுபவம் தேவை',
+        'preferencesRequired': 'தொழில் விருப்பங்கள் தேவை',
+        'invalidEmail': 'தயவுசெய்து சரியான மின்னஞ்சல் முகவரியை உள்ளிடவும்',
+        'invalidPhone': 'தயவுசெய்து சரியான தொலைபேசி எண்ணை உள்ளிடவும்',
+        'addSkill': 'திறனைச் சேர்க்கவும்',
+        'removeSkill': 'அகற்று',
+        'skillPlaceholder': 'ஒரு திறனை உள்ளிடவும்',
+        'experiencePlaceholder': 'உங்கள் வேலை அனுபவத்தை விவரிக்கவும்',
+        'preferencesPlaceholder': 'உங்கள் தொழில் விருப்பங்களை விவரிக்கவும்',
+        'profileComplete': 'சுயவிவரம் முழுமையானது!',
+        'profileSaved': 'உங்கள் சுயவிவரம் வெற்றிகரமாக சேமிக்கப்பட்டது!',
+        'continueLearning': 'கற்றலைத் தொடரவும்',
+    },
+    'bn': {
+        'pageTitle': 'ক্যারিয়ার নেভিগেটর - প্রোফাইল বিল্ডার',
+        'pageDescription': 'আমাদের AI-চালিত ক্যারিয়ার নেভিগেটরের সাথে আপনার পেশাদার প্রোফাইল তৈরি করুন',
+        'navBrand': 'ক্যারিয়ারনেভ',
+        'selectLanguage': 'ভাষা নির্বাচন করুন',
+        'profileBuilder': 'প্রোফাইল বিল্ডার',
+        'buildProfile': 'আপনার প্রোফাইল তৈরি করুন',
+        'step1': 'ব্যক্তিগত তথ্য',
+        'step2': 'শিক্ষা এবং দক্ষতা',
+        'step3': 'অভিজ্ঞতা',
+        'step4': 'পছন্দ',
+        'step5': 'পর্যালোচনা এবং সংরক্ষণ',
+        'firstName': 'নামের প্রথম অংশ',
+        'lastName': 'নামের শেষ অংশ',
+        'email': 'ইমেইল ঠিকানা',
+        'phone': 'ফোন নম্বর',
+        'location': 'অবস্থান',
+        'education': 'শিক্ষার স্তর',
+        'skills': 'দক্ষতা',
+        'experience': 'কাজের অভিজ্ঞতা',
+        'preferences': 'ক্যারিয়ার পছন্দ',
+        'next': 'পরবর্তী',
+        'previous': 'পূর্ববর্তী',
+        'save': 'প্রোফাইল সংরক্ষণ',
+        'autoSave': 'স্বয়ংক্রিয়ভাবে সংরক্ষণ হচ্ছে...',
+        'saved': 'প্রোফাইল সংরক্ষিত!',
+        'firstNameRequired': 'নামের প্রথম অংশ প্রয়োজন',
+        'lastNameRequired': 'নামের শেষ অংশ প্রয়োজন',
+        'emailRequired': 'ইমেইল প্রয়োজন',
+        'phoneRequired': 'ফোন নম্বর প্রয়োজন',
+        'locationRequired': 'অবস্থান প্রয়োজন',
+        'educationRequired': 'শিক্ষার স্তর প্রয়োজন',
+        'skillsRequired': 'অনুগ্রহ করে কমপক্ষে একটি দক্ষতা যোগ করুন',
+        'experienceRequired': 'কাজের অভিজ্ঞতা প্রয়োজন',
+        'preferencesRequired': 'ক্যারিয়ার পছন্দ প্রয়োজন',
+        'invalidEmail': 'অনুগ্রহ করে একটি বৈধ ইমেইল ঠিকানা লিখুন',
+        'invalidPhone': 'অনুগ্রহ করে একটি বৈধ ফোন নম্বর লিখুন',
+        'addSkill': 'দক্ষতা যোগ করুন',
+        'removeSkill': 'অপসারণ',
+        'skillPlaceholder': 'একটি দক্ষতা লিখুন',
+        'experiencePlaceholder': 'আপনার কাজের অভিজ্ঞতা বর্ণনা করুন',
+        'preferencesPlaceholder': 'আপনার ক্যারিয়ার পছন্দ বর্ণনা করুন',
+        'profileComplete': 'প্রোফাইল সম্পূর্ণ!',
+        'profileSaved': 'আপনার প্রোফাইল সফলভাবে সংরক্ষিত হয়েছে!',
+        'continueLearning': 'শেখা চালিয়ে যান',
+    },
+    'gu': {
+        'pageTitle': 'કારિયર નેવિગેટર - પ્રોફાઇલ બિલ્ડર',
+        'pageDescription': 'અમારા AI-ચાલિત કારિયર નેવિગેટર સાથે તમારું વ્યાવસાયિક પ્રોફાઇલ બનાવો',
+        'navBrand': 'કારિયરનવ',
+        'selectLanguage': 'ભાષા પસંદ કરો',
+        'profileBuilder': 'પ્રોફાઇલ બિલ્ડર',
+        'buildProfile': 'તમારું પ્રોફાઇલ બનાવો',
+        'step1': 'વ્યક્તિગત માહિતી',
+        'step2': 'શિક્ષણ અને કૌશલ્યો',
+        'step3': 'અનુભવ',
+        'step4': 'પસંદગીઓ',
+        'step5': 'સમીક્ષા અને સેવ',
+        'firstName': 'પ્રથમ નામ',
+        'lastName': 'છેલ્લું નામ',
+        'email': 'ઇમેઇલ સરનામું',
+        'phone': 'ફોન નંબર',
+        'location': 'સ્થાન',
+        'education': 'શિક્ષણ સ્તર',
+        'skills': 'કૌશલ્યો',
+        'experience': 'કામનો અનુભવ',
+        'preferences': 'કારિયર પસંદગીઓ',
+        'next': 'આગળ',
+        'previous': 'પાછળ',
+        'save': 'પ્રોફાઇલ સેવ કરો',
+        'autoSave': 'સ્વચાલિત સેવ થઈ રહ્યું છે...',
+        'saved': 'પ્રોફાઇલ સેવ થઈ ગયું!',
+        'firstNameRequired': 'પ્રથમ નામ જરૂરી છે',
+        'lastNameRequired': 'છેલ્લું નામ જરૂરી છે',
+        'emailRequired': 'ઇમેઇલ જરૂરી છે',
+        'phoneRequired': 'ફોન નંબર જરૂરી છે',
+        'locationRequired': 'સ્થાન જરૂરી છે',
+        'educationRequired': 'શિક્ષણ સ્તર જરૂરી છે',
+        'skillsRequired': 'કૃપા કરીને ઓછામાં ઓછું એક કૌશલ્ય ઉમેરો',
+        'experienceRequired': 'કામનો અનુભવ જરૂરી છે',
+        'preferencesRequired': 'કારિયર પસંદગીઓ જરૂરી છે',
+        'invalidEmail': 'કૃપા કરીને માન્ય ઇમેઇલ સરનામું દાખલ કરો',
+        'invalidPhone': 'કૃપા કરીને માન્ય ફોન નંબર દાખલ કરો',
+        'addSkill': 'કૌશલ્ય ઉમેરો',
+        'removeSkill': 'દૂર કરો',
+        'skillPlaceholder': 'એક કૌશલ્ય દાખલ કરો',
+        'experiencePlaceholder': 'તમારા કામના અનુભવનું વર્ણન કરો',
+        'preferencesPlaceholder': 'તમારી કારિયર પસંદગીઓનું વર્ણન કરો',
+        'profileComplete': 'પ્રોફાઇલ પૂર્ણ!',
+        'profileSaved': 'તમારું પ્રોફાઇલ સફળતાપૂર્વક સેવ થઈ ગયું છે!',
+        'continueLearning': 'શીખવાનું ચાલુ રાખો',
+    },
+}
+
+
+RECOMMENDATION_STRINGS = {
+    'en': {
+        'pageTitle': 'Career Navigator - Recommendation Viewer',
+        'pageDescription': 'View your personalized career pathway and skill recommendations',
+        'navBrand': 'CareerNav',
+        'selectLanguage': 'Select language',
+        'recommendationViewer': 'Recommendation Viewer',
+        'viewRecommendations': 'View Recommendations',
+        'yourPathway': 'Your Career Pathway',
+        'recommendedSkills': 'Recommended Skills',
+        'milestones': 'Milestones',
+        'achievements': 'Achievements',
+        'nextSteps': 'Next Steps',
+        'skillLevel': 'Skill Level',
+        'progress': 'Progress',
+        'estimatedTime': 'Estimated Time',
+        'prerequisites': 'Prerequisites',
+        'resources': 'Resources',
+        'startLearning': 'Start Learning',
+        'markComplete': 'Mark Complete',
+        'viewDetails': 'View Details',
+        'congratulations': 'Congratulations!',
+        'milestoneUnlocked': 'Milestone Unlocked',
+        'skillMastered': 'Skill Mastered',
+        'pathwayComplete': 'Pathway Complete',
+        'continueJourney': 'Continue Journey',
+        'skill1': 'Programming Fundamentals',
+        'skill2': 'Data Structures & Algorithms',
+        'skill3': 'Web Development',
+        'skill4': 'Database Management',
+        'skill5': 'API Development',
+        'skill6': 'Cloud Computing',
+        'skill7': 'DevOps',
+        'skill8': 'Machine Learning',
+        'milestone1': 'Complete Basic Programming',
+        'milestone2': 'Build First Web App',
+        'milestone3': 'Deploy to Cloud',
+        'milestone4': 'Master Full Stack',
+        'milestone5': 'Become Senior Developer',
+        'achievement1': 'Code Warrior',
+        'achievement2': 'Web Wizard',
+        'achievement3': 'Cloud Master',
+        'achievement4': 'Full Stack Hero',
+        'achievement5': 'Tech Leader',
+        'level1': 'Beginner',
+        'level2': 'Intermediate',
+        'level3': 'Advanced',
+        'level4': 'Expert',
+        'time1': '2 weeks',
+        'time2': '1 month',
+        'time3': '2 months',
+        'time4': '3 months',
+        'time5': '6 months',
+        'prereq1': 'Basic computer knowledge',
+        'prereq2': 'Programming fundamentals',
+        'prereq3': 'Web development basics',
+        'prereq4': 'Database concepts',
+        'prereq5': 'API understanding',
+        'prereq6': 'Cloud basics',
+        'prereq7': 'System administration',
+        'prereq8': 'Statistics knowledge',
+        'resource1': 'Online tutorials',
+        'resource2': 'Coding bootcamp',
+        'resource3': 'Project practice',
+        'resource4': 'Database courses',
+        'resource5': 'API documentation',
+        'resource6': 'Cloud platforms',
+        'resource7': 'DevOps tools',
+        'resource8': 'ML frameworks',
+    },
+    'hi': {
+        'pageTitle': 'करियर नेविगेटर - सिफारिश व्यूअर',
+        'pageDescription': 'अपने व्यक्तिगत करियर पथ और कौशल सिफारिशों को देखें',
+        'navBrand': 'करियरनव',
+        'selectLanguage': 'भाषा चुनें',
+        'recommendationViewer': 'सिफारिश व्यूअर',
+        'viewRecommendations': 'सिफारिशें देखें',
+        'yourPathway': 'आपका करियर पथ',
+        'recommendedSkills': 'अनुशंसित कौशल',
+        'milestones': 'माइलस्टोन',
+        'achievements': 'उपलब्धियां',
+        'nextSteps': 'अगले कदम',
+        'skillLevel': 'कौशल स्तर',
+        'progress': 'प्रगति',
+        'estimatedTime': 'अनुमानित समय',
+        'prerequisites': 'पूर्वापेक्षाएं',
+        'resources': 'संसाधन',
+        'startLearning': 'सीखना शुरू करें',
+        'markComplete': 'पूर्ण चिह्नित करें',
+        'viewDetails': 'विवरण देखें',
+        'congratulations': 'बधाई हो!',
+        'milestoneUnlocked': 'माइलस्टोन अनलॉक',
+        'skillMastered': 'कौशल में निपुण',
+        'pathwayComplete': 'पथ पूर्ण',
+        'continueJourney': 'यात्रा जारी रखें',
+        'skill1': 'प्रोग्रामिंग मूल बातें',
+        'skill2': 'डेटा संरचना और एल्गोरिदम',
+        'skill3': 'वेब विकास',
+        'skill4': 'डेटाबेस प्रबंधन',
+        'skill5': 'API विकास',
+        'skill6': 'क्लाउड कंप्यूटिंग',
+        'skill7': 'DevOps',
+        'skill8': 'मशीन लर्निंग',
+        'milestone1': 'बुनियादी प्रोग्रामिंग पूर्ण करें',
+        'milestone2': 'पहला वेब ऐप बनाएं',
+        'milestone3': 'क्लाउड पर तैनात करें',
+        'milestone4': 'फुल स्टैक में निपुण बनें',
+        'milestone5': 'सीनियर डेवलपर बनें',
+        'achievement1': 'कोड योद्धा',
+        'achievement2': 'वेब जादूगर',
+        'achievement3': 'क्लाउड मास्टर',
+        'achievement4': 'फुल स्टैक हीरो',
+        'achievement5': 'टेक लीडर',
+        'level1': 'शुरुआती',
+        'level2': 'मध्यम',
+        'level3': 'उन्नत',
+        'level4': 'विशेषज्ञ',
+        'time1': '2 सप्ताह',
+        'time2': '1 महीना',
+        'time3': '2 महीने',
+        'time4': '3 महीने',
+        'time5': '6 महीने',
+        'prereq1': 'बुनियादी कंप्यूटर ज्ञान',
+        'prereq2': 'प्रोग्रामिंग मूल बातें',
+        'prereq3': 'वेब विकास मूल बातें',
+        'prereq4': 'डेटाबेस अवधारणाएं',
+        'prereq5': 'API समझ',
+        'prereq6': 'क्लाउड मूल बातें',
+        'prereq7': 'सिस्टम प्रशासन',
+        'prereq8': 'सांख्यिकी ज्ञान',
+        'resource1': 'ऑनलाइन ट्यूटोरियल',
+        'resource2': 'कोडिंग बूटकैंप',
+        'resource3': 'प्रोजेक्ट अभ्यास',
+        'resource4': 'डेटाबेस कोर्स',
+        'resource5': 'API दस्तावेज',
+        'resource6': 'क्लाउड प्लेटफॉर्म',
+        'resource7': 'DevOps उपकरण',
+        'resource8': 'ML फ्रेमवर्क',
+    },
+    'ta': {
+        'pageTitle': 'தொழில் வழிகாட்டி - பரிந்துரை காட்சியாளர்',
+        'pageDescription': 'உங்கள் தனிப்பட்ட தொழில் பாதை மற்றும் திறன் பரிந்துரைகளைப் பாருங்கள்',
+        'navBrand': 'தொழில்வழி',
+        'selectLanguage': 'மொழியைத் தேர்ந்தெடுக்கவும்',
+        'recommendationViewer': 'பரிந்துரை காட்சியாளர்',
+        'viewRecommendations': 'பரிந்துரைகளைப் பாருங்கள்',
+        'yourPathway': 'உங்கள் தொழில் பாதை',
+        'recommendedSkills': 'பரிந்துரைக்கப்பட்ட திறன்கள்',
+        'milestones': 'மைல்கற்கள்',
+        'achievements': 'சாதனைகள்',
+        'nextSteps': 'அடுத்த படிகள்',
+        'skillLevel': 'திறன் நிலை',
+        'progress': 'முன்னேற்றம்',
+        'estimatedTime': 'மதிப்பிடப்பட்ட நேரம்',
+        'prerequisites': 'முன்நிபந்தனைகள்',
+        'resources': 'வளங்கள்',
+        'startLearning': 'கற்றல் தொடங்க',
+        'markComplete': 'முடிந்ததாகக் குறிக்கவும்',
+        'viewDetails': 'விவரங்களைப் பாருங்கள்',
+        'congratulations': 'வாழ்த்துக்கள்!',
+        'milestoneUnlocked': 'மைல்கல் திறக்கப்பட்டது',
+        'skillMastered': 'திறன் மாஸ்டர்',
+        'pathwayComplete': 'பாதை முழுமையானது',
+        'continueJourney': 'பயணத்தைத் தொடரவும்',
+        'skill1': 'நிரலாக்க அடிப்படைகள்',
+        'skill2': 'தரவு கட்டமைப்புகள் மற்றும் வழிமுறைகள்',
+        'skill3': 'வெப் மேம்பாடு',
+        'skill4': 'தரவுத்தள மேலாண்மை',
+        'skill5': 'API மேம்பாடு',
+        'skill6': 'கிளவுட் கம்ப்யூட்டிங்',
+        'skill7': 'DevOps',
+        'skill8': 'மெஷின் லர்னிங்',
+        'milestone1': 'அடிப்படை நிரலாக்கத்தை முடிக்கவும்',
+        'milestone2': 'முதல் வெப் ஆப் உருவாக்கவும்',
+        'milestone3': 'கிளவுடில் வெளியிடவும்',
+        'milestone4': 'ஃபுல் ஸ்டாக் மாஸ்டர்',
+        'milestone5': 'சீனியர் டெவலப்பர் ஆகவும்',
+        'achievement1': 'கோட் வாரியர்',
+        'achievement2': 'வெப் விசார்ட்',
+        'achievement3': 'கிளவுட் மாஸ்டர்',
+        'achievement4': 'ஃபுல் ஸ்டாக் ஹீரோ',
+        'achievement5': 'டெக் லீடர்',
+        'level1': 'ஆரம்ப',
+        'level2': 'இடைநிலை',
+        'level3': 'மேம்பட்ட',
+        'level4': 'நிபுணர்',
+        'time1': '2 வாரங்கள்',
+        'time2': '1 மாதம்',
+        'time3': '2 மாதங்கள்',
+        'time4': '3 மாதங்கள்',
+        'time5': '6 மாதங்கள்',
+        'prereq1': 'அடிப்படை கணினி அறிவு',
+        'prereq2': 'நிரலாக்க அடிப்படைகள்',
+        'prereq3': 'வெப் மேம்பாட்டு அடிப்படைகள்',
+        'prereq4': 'தரவுத்தள கருத்துகள்',
+        'prereq5': 'API புரிதல்',
+        'prereq6': 'கிளவுட் அடிப்படைகள்',
+        'prereq7': 'கணினி நிர்வாகம்',
+        'prereq8': 'புள்ளியியல் அறிவு',
+        'resource1': 'ஆன்லைன் டுடோரியல்கள்',
+        'resource2': 'கோடிங் பூட்கேம்ப்',
+        'resource3': 'திட்ட நடைமுறை',
+        'resource4': 'தரவுத்தள படிப்புகள்',
+        'resource5': 'API ஆவணங்கள்',
+        'resource6': 'கிளவுட் தளங்கள்',
+        'resource7': 'DevOps கருவிகள்',
+        'resource8': 'ML கட்டமைப்புகள்',
+    },
+    'bn': {
+        'pageTitle': 'ক্যারিয়ার নেভিগেটর - সুপারিশ দর্শক',
+        'pageDescription': 'আপনার ব্যক্তিগত ক্যারিয়ার পথ এবং দক্ষতার সুপারিশ দেখুন',
+        'navBrand': 'ক্যারিয়ারনেভ',
+        'selectLanguage': 'ভাষা নির্বাচন করুন',
+        'recommendationViewer': 'সুপারিশ দর্শক',
+        'viewRecommendations': 'সুপারিশ দেখুন',
+        'yourPathway': 'আপনার ক্যারিয়ার পথ',
+        'recommendedSkills': 'সুপারিশকৃত দক্ষতা',
+        'milestones': 'মাইলফলক',
+        'achievements': 'অর্জন',
+        'nextSteps': 'পরবর্তী পদক্ষেপ',
+        'skillLevel': 'দক্ষতার স্তর',
+        'progress': 'অগ্রগতি',
+        'estimatedTime': 'আনুমানিক সময়',
+        'prerequisites': 'পূর্বশর্ত',
+        'resources': 'সম্পদ',
+        'startLearning': 'শেখা শুরু করুন',
+        'markComplete': 'সম্পূর্ণ চিহ্নিত করুন',
+        'viewDetails': 'বিস্তারিত দেখুন',
+        'congratulations': 'অভিনন্দন!',
+        'milestoneUnlocked': 'মাইলফলক আনলক',
+        'skillMastered': 'দক্ষতা আয়ত্ত',
+        'pathwayComplete': 'পথ সম্পূর্ণ',
+        'continueJourney': 'যাত্রা চালিয়ে যান',
+        'skill1': 'প্রোগ্রামিং মৌলিক',
+        'skill2': 'ডেটা স্ট্রাকচার এবং অ্যালগরিদম',
+        'skill3': 'ওয়েব ডেভেলপমেন্ট',
+        'skill4': 'ডেটাবেস ম্যানেজমেন্ট',
+        'skill5': 'API ডেভেলপমেন্ট',
+        'skill6': 'ক্লাউড কম্পিউটিং',
+        'skill7': 'DevOps',
+        'skill8': 'মেশিন লার্নিং',
+        'milestone1': 'বেসিক প্রোগ্রামিং সম্পূর্ণ করুন',
+        'milestone2': 'প্রথম ওয়েব অ্যাপ তৈরি করুন',
+        'milestone3': 'ক্লাউডে ডেপ্লয় করুন',
+        'milestone4': 'ফুল স্ট্যাক মাস্টার',
+        'milestone5': 'সিনিয়র ডেভেলপার হন',
+        'achievement1': 'কোড ওয়ারিয়র',
+        'achievement2': 'ওয়েব উইজার্ড',
+        'achievement3': 'ক্লাউড মাস্টার',
+        'achievement4': 'ফুল স্ট্যাক হিরো',
+        'achievement5': 'টেক লিডার',
+        'level1': 'শুরু',
+        'level2': 'মধ্যম',
+        'level3': 'উন্নত',
+        'level4': 'বিশেষজ্ঞ',
+        'time1': '2 সপ্তাহ',
+        'time2': '1 মাস',
+        'time3': '2 মাস',
+        'time4': '3 মাস',
+        'time5': '6 মাস',
+        'prereq1': 'বেসিক কম্পিউটার জ্ঞান',
+        'prereq2': 'প্রোগ্রামিং মৌলিক',
+        'prereq3': 'ওয়েব ডেভেলপমেন্ট মৌলিক',
+        'prereq4': 'ডেটাবেস ধারণা',
+        'prereq5': 'API বোঝাপড়া',
+        'prereq6': 'ক্লাউড মৌলিক',
+        'prereq7': 'সিস্টেম অ্যাডমিনিস্ট্রেশন',
+        'prereq8': 'পরিসংখ্যান জ্ঞান',
+        'resource1': 'অনলাইন টিউটোরিয়াল',
+        'resource2': 'কোডিং বুটক্যাম্প',
+        'resource3': 'প্রজেক্ট অনুশীলন',
+        'resource4': 'ডেটাবেস কোর্স',
+        'resource5': 'API ডকুমেন্টেশন',
+        'resource6': 'ক্লাউড প্ল্যাটফর্ম',
+        'resource7': 'DevOps টুলস',
+        'resource8': 'ML ফ্রেমওয়ার্ক',
+    },
+    'gu': {
+        'pageTitle': 'કારિયર નેવિગેટર - ભલામણ દર્શક',
+        'pageDescription': 'તમારા વ્યક્તિગત કારિયર પથ અને કૌશલ્ય ભલામણો જુઓ',
+        'navBrand': 'કારિયરનવ',
+        'selectLanguage': 'ભાષા પસંદ કરો',
+        'recommendationViewer': 'ભલામણ દર્શક',
+        'viewRecommendations': 'ભલામણો જુઓ',
+        'yourPathway': 'તમારો કારિયર પથ',
+        'recommendedSkills': 'ભલામણ કરેલ કૌશલ્યો',
+        'milestones': 'માઇલસ્ટોન',
+        'achievements': 'પ્રાપ્તિઓ',
+        'nextSteps': 'આગળના પગલાં',
+        'skillLevel': 'કૌશલ્ય સ્તર',
+        'progress': 'પ્રગતિ',
+        'estimatedTime': 'અંદાજિત સમય',
+        'prerequisites': 'પૂર્વશરતો',
+        'resources': 'સંસાધનો',
+        'startLearning': 'શીખવાનું શરૂ કરો',
+        'markComplete': 'પૂર્ણ ચિહ્નિત કરો',
+        'viewDetails': 'વિગતો જુઓ',
+        'congratulations': 'અભિનંદન!',
+        'milestoneUnlocked': 'માઇલસ્ટોન અનલૉક',
+        'skillMastered': 'કૌશલ્ય માસ્ટર',
+        'pathwayComplete': 'પથ પૂર્ણ',
+        'continueJourney': 'યાત્રા ચાલુ રાખો',
+        'skill1': 'પ્રોગ્રામિંગ મૂળભૂત',
+        'skill2': 'ડેટા સ્ટ્રક્ચર અને એલ્ગોરિધમ્સ',
+        'skill3': 'વેબ ડેવલપમેન્ટ',
+        'skill4': 'ડેટાબેસ મેનેજમેન્ટ',
+        'skill5': 'API ડેવલપમેન્ટ',
+        'skill6': 'ક્લાઉડ કમ્પ્યુટિંગ',
+        'skill7': 'DevOps',
+        'skill8': 'મશીન લર્નિંગ',
+        'milestone1': 'મૂળભૂત પ્રોગ્રામિંગ પૂર્ણ કરો',
+        'milestone2': 'પહેલું વેબ એપ બનાવો',
+        'milestone3': 'ક્લાઉડ પર ડેપ્લોય કરો',
+        'milestone4': 'ફુલ સ્ટેક માસ્ટર',
+        'milestone5': 'સિનિયર ડેવલપર બનો',
+        'achievement1': 'કોડ વોરિયર',
+        'achievement2': 'વેબ વિઝાર્ડ',
+        'achievement3': 'ક્લાઉડ માસ્ટર',
+        'achievement4': 'ફુલ સ્ટેક હીરો',
+        'achievement5': 'ટેક લીડર',
+        'level1': 'શરૂઆત',
+        'level2': 'મધ્યમ',
+        'level3': 'અદ્યતન',
+        'level4': 'નિષ્ણાત',
+        'time1': '2 અઠવાડિયા',
+        'time2': '1 મહિના',
+        'time3': '2 મહિના',
+        'time4': '3 મહિના',
+        'time5': '6 મહિના',
+        'prereq1': 'મૂળભૂત કમ્પ્યુટર જ્ઞાન',
+        'prereq2': 'પ્રોગ્રામિંગ મૂળભૂત',
+        'prereq3': 'વેબ ડેવલપમેન્ટ મૂળભૂત',
+        'prereq4': 'ડેટાબેસ ખ્યાલો',
+        'prereq5': 'API સમજ',
+        'prereq6': 'ક્લાઉડ મૂળભૂત',
+        'prereq7': 'સિસ્ટમ એડમિનિસ્ટ્રેશન',
+        'prereq8': 'આંકડાશાસ્ત્ર જ્ઞાન',
+        'resource1': 'ઓનલાઇન ટ્યુટોરિયલ',
+        'resource2': 'કોડિંગ બૂટકેમ્પ',
+        'resource3': 'પ્રોજેક્ટ પ્રેક્ટિસ',
+        'resource4': 'ડેટાબેસ કોર્સ',
+        'resource5': 'API ડોક્યુમેન્ટેશન',
+        'resource6': 'ક્લાઉડ પ્લેટફોર્મ',
+        'resource7': 'DevOps ટૂલ્સ',
+        'resource8': 'ML ફ્રેમવર્ક',
+    },
+}
+
+
+# Translations of the gettext messages (``_()``) used by the views, keyed by
+# the English msgid. build_i18n_catalogs compiles these, together with the page
+# tables above, into locale/<lang>/LC_MESSAGES/django.mo.
+MESSAGES = {
+    'hi': {
+        'Not logged in': 'लॉग इन नहीं है',
+        'User not found': 'उपयोगकर्ता नहीं मिला',
+        'Invalid data format': 'अमान्य डेटा प्रारूप',
+        'An error occurred while saving profile': 'प्रोफ़ाइल सहेजते समय एक त्रुटि हुई',
+        'Profile saved successfully': 'प्रोफ़ाइल सफलतापूर्वक सहेजी गई',
+        'Invalid request method': 'अमान्य अनुरोध विधि',
+        'An error occurred while loading profile': 'प्रोफ़ाइल लोड करते समय एक त्रुटि हुई',
+        'Language updated successfully': 'भाषा सफलतापूर्वक अपडेट की गई',
+        'Profile not created yet': 'प्रोफ़ाइल अभी तक नहीं बनाई गई',
+    },
+    'ta': {
+        'Not logged in': 'உள்நுழையவில்லை',
+        'User not found': 'பயனர் கிடைக்கவில்லை',
+        'Invalid data format': 'தவறான தரவு வடிவம்',
+        'An error occurred while saving profile': 'சுயவிவரத்தைச் சேமிக்கும்போது பிழை ஏற்பட்டது',
+        'Profile saved successfully': 'சுயவிவரம் வெற்றிகரமாகச் சேமிக்கப்பட்டது',
+        'Invalid request method': 'தவறான கோரிக்கை முறை',
+        'An error occurred while loading profile': 'சுயவிவரத்தை ஏற்றும்போது பிழை ஏற்பட்டது',
+        'Language updated successfully': 'மொழி வெற்றிகரமாகப் புதுப்பிக்கப்பட்டது',
+        'Profile not created yet': 'சுயவிவரம் இன்னும் உருவாக்கப்படவில்லை',
+    },
+    'bn': {
+        'Not logged in': 'লগ ইন করা নেই',
+        'User not found': 'ব্যবহারকারী পাওয়া যায়নি',
+        'Invalid data format': 'অবৈধ ডেটা ফরম্যাট',
+        'An error occurred while saving profile': 'প্রোফাইল সংরক্ষণ করার সময় একটি ত্রুটি ঘটেছে',
+        'Profile saved successfully': 'প্রোফাইল সফলভাবে সংরক্ষিত হয়েছে',
+        'Invalid request method': 'অবৈধ অনুরোধ পদ্ধতি',
+        'An error occurred while loading profile': 'প্রোফাইল লোড করার সময় একটি ত্রুটি ঘটেছে',
+        'Language updated successfully': 'ভাষা সফলভাবে আপডেট হয়েছে',
+        'Profile not created yet': 'প্রোফাইল এখনও তৈরি করা হয়নি',
+    },
+    'gu': {
+        'Not logged in': 'લૉગ ઇન થયેલ નથી',
+        'User not found': 'વપરાશકર્તા મળ્યો નથી',
+        'Invalid data format': 'અમાન્ય ડેટા ફોર્મેટ',
+        'An error occurred while saving profile': 'પ્રોફાઇલ સાચવતી વખતે ભૂલ આવી',
+        'Profile saved successfully': 'પ્રોફાઇલ સફળતાપૂર્વક સાચવવામાં આવી',
+        'Invalid request method': 'અમાન્ય વિનંતી પદ્ધતિ',
+        'An error occurred while loading profile': 'પ્રોફાઇલ લોડ કરતી વખતે ભૂલ આવી',
+        'Language updated successfully': 'ભાષા સફળતાપૂર્વક અપડેટ થઈ',
+        'Profile not created yet': 'પ્રોફાઇલ હજુ સુધી બનાવવામાં આવી નથી',
+    },
+}
+
+PAGES = {
+    'auth': AUTH_STRINGS,
+    'dashboard': DASHBOARD_STRINGS,
+    'career_explorer': CAREER_EXPLORER_STRINGS,
+    'profile_builder': PROFILE_BUILDER_STRINGS,
+    'recommendation_viewer': RECOMMENDATION_STRINGS,
+}
+
+# Escapes that keep the JSON inert inside a <script> element, as json_script does.
+_SCRIPT_ESCAPES = {ord('>'): '\\u003E', ord('<'): '\\u003C', ord('&'): '\\u0026'}
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+class Bundle:
+    """One page's strings in one language, ready to embed in that page."""
+
+    def __init__(self, page, lang, strings):
+        self.page = page
+        self.lang = lang
+        self.strings = strings
+        self.script = mark_safe(_dumps(strings).translate(_SCRIPT_ESCAPES))
+
+    @property
+    def version(self):
+        return VERSION
+
+    def __repr__(self):
+        return f"<Bundle {self.page}/{self.lang}>"
+
+
+class LanguageBundle:
+    """Every page's strings in one language, serialized and compressed once.
+
+    This is what /de/api/i18n/<lang>/<version>/ serves. Each encoding is a
+    different representation, so each gets its own strong ETag.
+    """
+
+    def __init__(self, lang, strings):
+        self.lang = lang
+        self.strings = strings
+        self.json = _dumps(strings).encode('utf-8')
+        self.etag = hashlib.sha256(self.json).hexdigest()[:20]
+        self.encoded = {'gzip': gzip.compress(self.json, 9, mtime=0)}
+        if brotli is not None:
+            self.encoded['br'] = brotli.compress(self.json)
+
+    def negotiate(self, accept_encoding):
+        """Return ``(encoding, body, etag)`` for an Accept-Encoding header.
+
+        The smallest encoding the client accepts wins; ``encoding`` is None
+        when the identity representation is sent.
+        """
+        accepted = accepted_encodings(accept_encoding)
+        options = [(len(body), coding) for coding, body in self.encoded.items() if coding in accepted]
+        if not options:
+            return None, self.json, f'"{self.etag}"'
+        _, coding = min(options)
+        return coding, self.encoded[coding], f'"{self.etag}-{coding}"'
+
+    def __repr__(self):
+        return f"<LanguageBundle {self.lang} {self.etag}>"
+
+
+def accepted_encodings(header):
+    """Content codings an Accept-Encoding header allows (q=0 excluded)."""
+    accepted = set()
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding == '*':
+            accepted.update(('gzip', 'br'))
+        elif coding:
+            accepted.add(coding)
+    return accepted
+
+
+def build_bundles():
+    return {
+        (page, lang): Bundle(page, lang, table[lang])
+        for page, table in PAGES.items()
+        for lang in LANGUAGES
+        if lang in table
+    }
+
+
+def build_language_bundles():
+    return {
+        lang: LanguageBundle(lang, {
+            page: table[lang] for page, table in PAGES.items() if lang in table
+        })
+        for lang in LANGUAGES
+    }
+
+
+bundles = build_bundles()
+language_bundles = build_language_bundles()
+# Changes whenever any string changes, so a versioned bundle URL can be cached
+# forever: new strings get a new URL.
+VERSION = hashlib.sha256(
+    ''.join(language_bundles[lang].etag for lang in LANGUAGES).encode()
+).hexdigest()[:12]
+
+
+def bundle(page, lang):
+    """The bundle for ``page`` in ``lang``, falling back to English.
+
+    Raises KeyError for an unknown page.
+    """
+    if page not in PAGES:
+        raise KeyError(page)
+    return bundles.get((page, lang)) or bundles[(page, DEFAULT_LANGUAGE)]
+
+
+def strings(page, lang):
+    return bundle(page, lang).strings
+
+
+def bundle_url(lang):
+    return reverse('i18n_bundle', args=[lang, VERSION])
+
+
+def activate(lang):
+    """Make ``lang`` this thread's active language and return it.
+
+    Unsupported codes fall back to English. SessionLanguageMiddleware calls
+    this once per request; views only need it when a request changes the
+    language.
+    """
+    if lang not in LANGUAGES:
+        lang = DEFAULT_LANGUAGE
+    translation.activate(lang)
+    return lang
@@ -0,0 +1,181 @@
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from de import benchmark, chat_index
+from de.chatbot import DATASET_FILES, Corpus, dataset_path
+
+
+def parse_mix(value):
+    mix = {kind: 0.0 for kind in benchmark.QUERY_KINDS}
+    for part in value.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in mix:
+            raise CommandError(f"Unknown query kind {kind!r} in --mix")
+        mix[kind] = float(weight)
+    if not sum(mix.values()):
+        raise CommandError("--mix needs at least one positive weight")
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark chatbot answers through the request path (corpus store or "
+        "database, answer cache, matcher): latency percentiles with and "
+        "without cache hits, peak RSS and answer agreement with the original "
+        "full difflib scan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'languages', nargs='*',
+            help="Language codes to benchmark (default: en, or all with --synthetic).",
+        )
+        parser.add_argument(
+            '--synthetic', type=int, metavar='ROWS',
+            help="Generate ROWS-row corpora instead of using de/data.",
+        )
+        parser.add_argument(
+            '--synthetic-dir',
+            help="Keep the generated corpora here (default: a temporary directory).",
+        )
+        parser.add_argument('--queries', type=int, default=500)
+        parser.add_argument(
+            '--mix', type=parse_mix, default=parse_mix("exact=0.3,near=0.5,miss=0.2"),
+            help="Query kind weights, e.g. exact=0.3,near=0.5,miss=0.2.",
+        )
+        parser.add_argument('--matchers', nargs='+', default=['difflib'], choices=['difflib', 'bm25'])
+        parser.add_argument(
+            '--backend', choices=['files', 'database'], default='files',
+            help="Where answers come from, as CHATBOT_BACKEND. With database, "
+                 "load the same datasets with load_chat_dataset first.",
+        )
+        parser.add_argument(
+            '--index', action='store_true',
+            help="Compile each dataset's .idx first (as build_chat_index does), "
+                 "so the files backend serves it memory-mapped.",
+        )
+        parser.add_argument(
+            '--baseline-queries', type=int, default=50,
+            help="Queries also answered by the full scan to measure agreement "
+                 "(it is O(rows) per query, so keep this small on big corpora).",
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--min-agreement', type=float,
+            help="Fail if agreement with the baseline drops below this fraction.",
+        )
+        parser.add_argument(
+            '--max-p95-ms', type=float,
+            help="Fail if any matcher's overall uncached p95 latency exceeds this.",
+        )
+
+    def handle(self, *args, **options):
+        if options['queries'] < 1:
+            raise CommandError("--queries must be at least 1")
+        languages = options['languages'] or (
+            list(DATASET_FILES) if options['synthetic'] else ['en']
+        )
+        unknown = set(languages) - set(DATASET_FILES)
+        if unknown:
+            raise CommandError(f"Unknown language(s): {', '.join(sorted(unknown))}")
+
+        if options['synthetic']:
+            directory = options['synthetic_dir']
+            with tempfile.TemporaryDirectory() as tmp:
+                started = time.perf_counter()
+                paths = benchmark.write_corpora(
+                    directory or tmp, options['synthetic'], languages, options['seed']
+                )
+                self.stdout.write(
+                    f"Generated {options['synthetic']} rows x {len(languages)} languages "
+                    f"in {time.perf_counter() - started:.1f}s"
+                )
+                failures = self.run(paths, options)
+        else:
+            failures = self.run({lang: dataset_path(lang) for lang in languages}, options)
+
+        if failures:
+            raise CommandError("Benchmark gate failed:\n  " + "\n  ".join(failures))
+
+    def compile_index(self, lang, path):
+        started = time.perf_counter()
+        source_stat = os.stat(path)
+        chat_index.write(Corpus.from_jsonl(path), chat_index.index_path(path), source_stat)
+        self.stdout.write(f"  compiled {chat_index.index_path(path)} in {time.perf_counter() - started:.1f}s")
+
+    def write_latencies(self, label, latencies):
+        overall = [ms for values in latencies.values() for ms in values]
+        self.stdout.write(f"    {label}:")
+        for kind, values in [*latencies.items(), ("all", overall)]:
+            if values:
+                self.stdout.write(
+                    f"      {kind:>5}  n={len(values):<5} "
+                    f"p50={benchmark.percentile(values, 50):8.2f}ms "
+                    f"p95={benchmark.percentile(values, 95):8.2f}ms "
+                    f"p99={benchmark.percentile(values, 99):8.2f}ms"
+                )
+        return overall
+
+    def run(self, paths, options):
+        # Each language and matcher runs in its own forked process, so its
+        # peak RSS is its own rather than the largest one seen so far.
+        _, base_rss = benchmark.isolated(int)
+        self.stdout.write(f"Peak RSS of a process that loads no corpus: {base_rss:.0f} MB")
+        failures = []
+        for lang, path in paths.items():
+            prepared, rss = benchmark.isolated(benchmark.prepare, path, lang, options)
+            if not prepared['rows']:
+                raise CommandError(f"{path} is empty")
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"\n[{lang}] {prepared['rows']} rows, parsed and indexed in "
+                f"{prepared['load_seconds']:.1f}s, peak RSS {rss:.0f} MB"
+            ))
+            if options['index']:
+                self.compile_index(lang, path)
+
+            queries = prepared['queries']
+            baseline, baseline_ms = prepared['baseline'], prepared['baseline_ms']
+            baseline_count = len(baseline)
+            if baseline_ms:
+                self.stdout.write(
+                    f"  baseline full scan: p50={benchmark.percentile(baseline_ms, 50):.2f}ms "
+                    f"p95={benchmark.percentile(baseline_ms, 95):.2f}ms over {baseline_count} queries"
+                )
+
+            for matcher in options['matchers']:
+                replayed, rss = benchmark.isolated(
+                    benchmark.replay, os.path.dirname(path), lang, matcher, options['backend'], queries
+                )
+                self.stdout.write(
+                    f"  {matcher} ({options['backend']} backend, corpus from {replayed['source']}, "
+                    f"ready in {replayed['load_seconds']:.2f}s):"
+                )
+                overall = self.write_latencies("cache miss", replayed['miss'])
+                self.write_latencies("cache hit", replayed['hit'])
+
+                answers = replayed['answers']
+                p95 = benchmark.percentile(overall, 95)
+                agreement = (
+                    sum(a == b for a, b in zip(answers, baseline)) / baseline_count
+                    if baseline_count else 1.0
+                )
+                by_kind = {}
+                for (kind, _), a, b in zip(queries, answers, baseline):
+                    by_kind.setdefault(kind, []).append(a == b)
+                detail = ", ".join(
+                    f"{kind} {sum(same) / len(same):.0%}" for kind, same in by_kind.items()
+                )
+                self.stdout.write(
+                    f"    agreement with the full difflib scan: {agreement:.1%} "
+                    f"of {baseline_count} queries ({detail}); "
+                    f"peak RSS {rss:.0f} MB (corpus + {matcher} + cache, own process)"
+                )
+
+                if options['min_agreement'] is not None and agreement < options['min_agreement']:
+                    failures.append(f"{lang}/{matcher}: agreement {agreement:.1%} < {options['min_agreement']:.1%}")
+                if options['max_p95_ms'] is not None and p95 > options['max_p95_ms']:
+                    failures.append(f"{lang}/{matcher}: uncached p95 {p95:.2f}ms > {options['max_p95_ms']}ms")
+        return failures
@@ -0,0 +1,38 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from de import chat_index
+from de.chatbot import DATASET_FILES, Corpus, dataset_path
+
+
+class Command(BaseCommand):
+    help = "Compile the chatbot JSONL datasets into memory-mapped .idx files."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'languages', nargs='*',
+            help="Language codes to compile (default: all of them).",
+        )
+
+    def handle(self, *args, **options):
+        languages = options['languages'] or list(DATASET_FILES)
+        unknown = set(languages) - set(DATASET_FILES)
+        if unknown:
+            raise CommandError(f"Unknown language(s): {', '.join(sorted(unknown))}")
+
+        for lang in languages:
+            source = dataset_path(lang)
+            target = chat_index.index_path(source)
+            started = time.perf_counter()
+            # Stat before parsing: if the JSONL changes mid-build the recorded
+            # mtime is already stale and workers keep using the JSONL.
+            source_stat = os.stat(source)
+            corpus = Corpus.from_jsonl(source)
+            chat_index.write(corpus, target, source_stat)
+            self.stdout.write(self.style.SUCCESS(
+                f"{lang}: {len(corpus)} rows -> {target} "
+                f"({os.path.getsize(target) / 1e6:.1f} MB, "
+                f"{time.perf_counter() - started:.1f}s)"
+            ))
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from de import catalogs, i18n
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile the string tables in de/i18n.py into gettext catalogs "
+        "(locale/<lang>/LC_MESSAGES/django.po and .mo)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'languages', nargs='*',
+            help="Language codes to build (default: every non-English language).",
+        )
+        parser.add_argument(
+            '--locale-dir',
+            help="Where to write the catalogs (default: the first LOCALE_PATHS entry).",
+        )
+        parser.add_argument(
+            '--check', action='store_true',
+            help="Write nothing; fail if any catalog is missing or out of date.",
+        )
+
+    def handle(self, *args, **options):
+        languages = options['languages'] or [
+            lang for lang in i18n.LANGUAGES if lang != i18n.DEFAULT_LANGUAGE
+        ]
+        unknown = set(languages) - set(i18n.LANGUAGES)
+        if unknown:
+            raise CommandError(f"Unknown language(s): {', '.join(sorted(unknown))}")
+        locale_dir = options['locale_dir'] or (settings.LOCALE_PATHS or [None])[0]
+        if not locale_dir:
+            raise CommandError("Set LOCALE_PATHS or pass --locale-dir")
+
+        app_dir = Path(__file__).resolve().parents[2]
+        used = catalogs.source_messages(sorted(app_dir.glob('*.py')))
+        for lang in languages:
+            missing = sorted(used - set(i18n.MESSAGES.get(lang, {})))
+            if missing:
+                self.stderr.write(self.style.WARNING(
+                    f"{lang}: no translation in i18n.MESSAGES for {', '.join(map(repr, missing))}"
+                ))
+
+        if options['check']:
+            stale = [path for lang in languages for path in catalogs.stale_files(locale_dir, lang)]
+            if stale:
+                raise CommandError(
+                    "Catalogs are out of date, run manage.py build_i18n_catalogs:\n  "
+                    + "\n  ".join(stale)
+                )
+            self.stdout.write("Catalogs are up to date.")
+            return
+
+        for lang in languages:
+            count, written = catalogs.build(locale_dir, lang)
+            status = "written" if written else "unchanged"
+            self.stdout.write(self.style.SUCCESS(f"{lang}: {count} messages, {status}"))
@@ -0,0 +1,33 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from de import recommendations
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute the career recommendation model (skill matrix and career "
+        "similarity) from the Career tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            help="Where to write the model (default: RECOMMENDER_MODEL_PATH).",
+        )
+
+    def handle(self, *args, **options):
+        path = options['output'] or recommendations.model_path()
+        started = time.perf_counter()
+        model = recommendations.Model.from_database()
+        if not len(model):
+            raise CommandError("No career has any skills; load careers first.")
+        model.save(path)
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(model)} careers x {len(model.skills)} skills, "
+            f"{model.similarity.nnz} similar pairs -> {path} "
+            f"({os.path.getsize(path) / 1e6:.1f} MB, "
+            f"{time.perf_counter() - started:.1f}s, version {model.version})"
+        ))
@@ -0,0 +1,118 @@
+import json
+import time
+from collections import defaultdict, deque
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+
+from de import careers
+from de.models import Career, CareerSkill, Recommendation
+
+FIELDS = (
+    'kind', 'title', 'description', 'level', 'sector', 'duration', 'salary',
+    'requirements', 'certification', 'skills', 'icon',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Load careers and courses from a JSONL file (one object per line with "
+        "kind, title, level, sector and optionally description, duration, "
+        "salary, requirements, certification, skills and icon)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument(
+            '--replace', action='store_true',
+            help="Delete the existing catalogue first.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            # One transaction, so readers keep the old catalogue until the
+            # new one commits and a failed load changes nothing.
+            with transaction.atomic():
+                if options['replace']:
+                    self.delete_catalogue()
+                loaded = self.load(options['path'], options['batch_size'])
+        except OSError as e:
+            raise CommandError(str(e))
+        careers.invalidate()
+        self.stdout.write(self.style.SUCCESS(
+            f"Loaded {loaded} careers in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def delete_catalogue(self):
+        # QuerySet.delete() would load every row to send the post_delete
+        # signals that bump the facet cache, once per row; the rows that
+        # point at careers go first, then one DELETE per table, and handle()
+        # bumps the cache once.
+        for model in (CareerSkill, Recommendation, Career):
+            queryset = model.objects.all()
+            queryset._raw_delete(queryset.db)
+
+    def load(self, path, batch_size):
+        kinds = set(dict(Career.KIND_CHOICES))
+        loaded = 0
+        batch = []
+        with open(path, "r", encoding="utf-8") as f:
+            for i, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    career = Career(**{field: entry[field] for field in FIELDS if field in entry})
+                    career.level = int(career.level)
+                    if career.kind not in kinds or not career.title or not career.sector:
+                        raise ValueError
+                except (json.JSONDecodeError, TypeError, ValueError):
+                    self.stderr.write(f"Skipping malformed line {i}")
+                    continue
+                if isinstance(career.skills, str):
+                    career.skills = [s.strip() for s in career.skills.split(',') if s.strip()]
+                batch.append(career)
+                if len(batch) >= batch_size:
+                    loaded += self.flush(batch)
+        if batch:
+            loaded += self.flush(batch)
+        return loaded
+
+    def flush(self, batch):
+        with transaction.atomic():
+            last_id = None
+            if not connection.features.can_return_rows_from_bulk_insert:
+                last_id = Career.objects.aggregate(last=Max('id'))['last'] or 0
+            created = Career.objects.bulk_create(batch)
+            if last_id is not None:
+                self.assign_ids(created, last_id)
+            CareerSkill.objects.bulk_create(
+                (
+                    CareerSkill(career_id=career.pk, name=name[:100])
+                    for career in created
+                    if career.pk is not None
+                    for name in dict.fromkeys(career.skills)
+                ),
+                ignore_conflicts=True,
+            )
+        count = len(batch)
+        batch.clear()
+        return count
+
+    def assign_ids(self, created, last_id):
+        """Set the pks of ``created`` on backends whose bulk insert does not return them (MySQL)."""
+        ids = defaultdict(deque)
+        rows = (
+            Career.objects.filter(id__gt=last_id).order_by('id')
+            .values_list('id', 'kind', 'title', 'level', 'sector')
+        )
+        for career_id, *key in rows:
+            ids[tuple(key)].append(career_id)
+        for career in created:
+            found = ids[(career.kind, career.title, career.level, career.sector)]
+            if found:
+                career.pk = found.popleft()
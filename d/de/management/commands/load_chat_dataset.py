@@ -0,0 +1,78 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from de.chatbot import DATASET_FILES, dataset_path, question_hash
+from de.models import CareerDataset
+
+
+class Command(BaseCommand):
+    help = "Load the chatbot JSONL datasets into the CareerDataset table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'languages', nargs='*',
+            help="Language codes to load (default: all of them).",
+        )
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument(
+            '--append', action='store_true',
+            help="Keep the rows already loaded for each language.",
+        )
+
+    def handle(self, *args, **options):
+        languages = options['languages'] or list(DATASET_FILES)
+        unknown = set(languages) - set(DATASET_FILES)
+        if unknown:
+            raise CommandError(f"Unknown language(s): {', '.join(sorted(unknown))}")
+
+        for lang in languages:
+            started = time.perf_counter()
+            if options['append']:
+                loaded = self.load(lang, dataset_path(lang), options['batch_size'])
+            else:
+                # Replace the rows in one transaction, so a running server
+                # keeps answering from the old rows until the new ones commit
+                # instead of seeing the language empty or half loaded.
+                with transaction.atomic():
+                    CareerDataset.objects.filter(language=lang).delete()
+                    loaded = self.load(lang, dataset_path(lang), options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f"{lang}: loaded {loaded} rows in {time.perf_counter() - started:.1f}s"
+            ))
+
+    def load(self, lang, path, batch_size):
+        """Stream ``path`` into the table, one bulk_create per ``batch_size`` rows."""
+        loaded = 0
+        batch = []
+        with open(path, "r", encoding="utf-8") as f:
+            for i, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    question, answer = entry["user"], entry["assistant"]
+                except (json.JSONDecodeError, KeyError):
+                    self.stderr.write(f"{lang}: skipping malformed line {i}")
+                    continue
+                batch.append(CareerDataset(
+                    language=lang,
+                    input_text=question,
+                    output_text=answer,
+                    question_hash=question_hash(question),
+                ))
+                if len(batch) >= batch_size:
+                    loaded += self.flush(batch)
+        if batch:
+            loaded += self.flush(batch)
+        return loaded
+
+    def flush(self, batch):
+        with transaction.atomic():
+            CareerDataset.objects.bulk_create(batch)
+        count = len(batch)
+        batch.clear()
+        return count
@@ -0,0 +1,160 @@
+import multiprocessing
+import os
+import sys
+import time
+from datetime import timedelta
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from de import recommendations
+from de.models import Career, LearnerProfile, Recommendation, RecommendationRun, Skill
+
+
+def fork_available():
+    # Windows has no fork, and forking a process that has loaded system
+    # frameworks is unsafe on macOS.
+    return 'fork' in multiprocessing.get_all_start_methods() and sys.platform != 'darwin'
+
+
+def init_worker(model):
+    # Anything a worker queries goes over a connection of its own.
+    connections.close_all()
+    recommendations.init_worker(model)
+
+
+class Command(BaseCommand):
+    help = (
+        "Score learner profiles against the career catalogue and store their "
+        "top careers in the Recommendation table. Only profiles changed since "
+        "the last run finished (less --overlap) are rescored, unless the model "
+        "changed or --full is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help="Profiles read, scored and written per batch.",
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help="Scoring processes (1 scores in this process).",
+        )
+        parser.add_argument('--full', action='store_true', help="Rescore every profile.")
+        parser.add_argument(
+            '--overlap', type=int, default=300, metavar='SECONDS',
+            help="Also rescore profiles saved this long before the last run finished.",
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1 or options['workers'] < 1:
+            raise CommandError("--chunk-size and --workers must be at least 1")
+        if options['overlap'] < 0:
+            raise CommandError("--overlap cannot be negative")
+        workers = options['workers']
+        if workers > 1 and not fork_available():
+            self.stdout.write("Forked workers are not available on this platform; scoring in this process")
+            workers = 1
+        started = time.perf_counter()
+        model = recommendations.models.get()
+        run = RecommendationRun.objects.create(started_at=timezone.now(), model_version=model.version)
+
+        queryset = LearnerProfile.objects.order_by('pk')
+        last = (
+            RecommendationRun.objects
+            .filter(finished_at__isnull=False).exclude(pk=run.pk)
+            .order_by('-started_at').first()
+        )
+        if options['full'] or last is None or last.model_version != model.version:
+            self.stdout.write(f"Scoring every profile against model {model.version}")
+        else:
+            # The overlap covers saves stamped before the last run finished
+            # but committed after it, and clock skew between hosts. A profile
+            # saved earlier during that run, after its chunk was read, may
+            # keep stale rows; they are never served, because ranked() checks
+            # them against the current skills digest, and the save's refresh()
+            # already cached a fresh list.
+            since = last.finished_at - timedelta(seconds=options['overlap'])
+            queryset = queryset.filter(updated_at__gte=since)
+            self.stdout.write(f"Scoring profiles changed since {since:%Y-%m-%d %H:%M:%S}")
+
+        # A model file can be older than the catalogue; never write a
+        # recommendation for a career that has been deleted since.
+        self.career_ids = set(Career.objects.values_list('id', flat=True))
+        chunks = self.chunks(queryset, options['chunk_size'])
+        if workers == 1:
+            recommendations.init_worker(model)
+            scored = sum(self.write(recommendations.score_chunk(chunk), model) for chunk in chunks)
+        else:
+            scored = self.score_in_pool(chunks, model, workers)
+
+        run.finished_at = timezone.now()
+        run.profiles = scored
+        run.save(update_fields=['finished_at', 'profiles'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Scored {scored} profiles in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def chunks(self, queryset, chunk_size):
+        """``[(user_id, skill set), ...]`` lists of ``chunk_size`` profiles.
+
+        Skills come from the LearnerSkill links, one joined query per chunk,
+        already normalized; the skills JSON is never read.
+        """
+        queryset = queryset.only('user_id').prefetch_related(
+            Prefetch('canonical_skills', queryset=Skill.objects.only('normalized'))
+        )
+        chunk = []
+        for profile in queryset.iterator(chunk_size=chunk_size):
+            skills = sorted(skill.normalized for skill in profile.canonical_skills.all())
+            chunk.append((profile.user_id, skills))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def score_in_pool(self, chunks, model, workers):
+        # Forked workers inherit the loaded model and the configured Django
+        # instead of unpickling or rebuilding them. No connection may be open
+        # when they fork, or parent and children would share its socket:
+        # ``chunks`` is lazy and only queries once iterated, so close the
+        # connections and fork every worker (the pool forks them all on the
+        # first submit) before the first chunk is read.
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        scored = 0
+        pending = set()
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=init_worker,
+                                 initargs=(model,)) as pool:
+            pool.submit(os.getpid).result()
+            for chunk in chunks:
+                pending.add(pool.submit(recommendations.score_chunk, chunk))
+                # Keep a bounded number of chunks in flight so memory does not
+                # grow with the number of profiles.
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    scored += sum(self.write(future.result(), model) for future in done)
+            for future in pending:
+                scored += self.write(future.result(), model)
+        return scored
+
+    def write(self, results, model):
+        """Replace the Recommendation rows of every learner in ``results``."""
+        rows = [
+            Recommendation(
+                user_id=user_id, career_id=career_id, rank=rank, score=score,
+                model_version=model.version, skills_digest=digest,
+            )
+            for user_id, digest, ranked in results
+            for rank, (career_id, score) in enumerate(
+                (item for item in ranked if item[0] in self.career_ids), 1
+            )
+        ]
+        with transaction.atomic():
+            Recommendation.objects.filter(user_id__in=[user_id for user_id, _, _ in results]).delete()
+            Recommendation.objects.bulk_create(rows, batch_size=5000)
+        return len(results)
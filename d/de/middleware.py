@@ -0,0 +1,17 @@
+from django.utils.deprecation import MiddlewareMixin
+
+from . import i18n
+
+
+class SessionLanguageMiddleware(MiddlewareMixin):
+    """Activate the language chosen in the session, once per request.
+
+    Runs after LocaleMiddleware so a language the user picked wins over
+    Accept-Language, and views can call gettext without activating anything
+    themselves.
+    """
+
+    def process_request(self, request):
+        lang = request.session.get('language')
+        if lang:
+            request.LANGUAGE_CODE = i18n.activate(lang)
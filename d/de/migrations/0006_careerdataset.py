@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:32
+
+from django.db import migrations, models
+
+
+def add_fulltext_index(apps, schema_editor):
+    # Only MySQL has FULLTEXT; elsewhere the chatbot falls back to LIKE filters.
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(
+            'ALTER TABLE de_careerdataset ADD FULLTEXT INDEX de_dataset_input_ft (input_text)'
+        )
+
+
+def remove_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute('ALTER TABLE de_careerdataset DROP INDEX de_dataset_input_ft')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('de', '0005_alter_learnerprofile_skills_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CareerDataset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(choices=[('en', 'English'), ('hi', 'Hindi'), ('gu', 'Gujarati'), ('ta', 'Tamil'), ('bn', 'Bengali')], default='en', max_length=5)),
+                ('input_text', models.TextField()),
+                ('output_text', models.TextField()),
+                ('question_hash', models.CharField(max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['language', 'question_hash'], name='de_dataset_lang_hash_idx')],
+            },
+        ),
+        migrations.RunPython(add_fulltext_index, remove_fulltext_index),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def remove_duplicate_profiles(apps, schema_editor):
+    # Keep each user's newest profile: it holds what they saved last.
+    LearnerProfile = apps.get_model('de', 'LearnerProfile')
+    duplicates = (
+        LearnerProfile.objects.values('user_id')
+        .annotate(keep=models.Max('id'), rows=models.Count('id'))
+        .filter(rows__gt=1)
+    )
+    for row in duplicates.iterator():
+        LearnerProfile.objects.filter(user_id=row['user_id']).exclude(id=row['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('de', '0006_careerdataset'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_profiles, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='learnerprofile',
+            name='user',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profile', to='de.user'),
+        ),
+    ]
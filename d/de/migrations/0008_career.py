@@ -0,0 +1,85 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:49
+
+import django.db.models.deletion
+from django.core.management.color import no_style
+from django.db import migrations, models
+
+
+# The catalogue the career explorer used to hard-code in its script.
+SEED_CAREERS = [
+    {'id': 1, 'kind': 'course', 'title': 'Software Development', 'description': 'Learn modern software development practices', 'level': 4, 'sector': 'IT', 'duration': '6 months', 'skills': ['Programming', 'Web Development', 'Database'], 'certification': 'NSQF Level 4', 'icon': '💻'},
+    {'id': 2, 'kind': 'job', 'title': 'Software Engineer', 'description': 'Develop and maintain software applications', 'level': 5, 'sector': 'IT', 'salary': '₹5-8 LPA', 'requirements': 'Bachelor degree', 'skills': ['Programming', 'Problem Solving', 'Teamwork'], 'icon': '👨‍💻'},
+    {'id': 3, 'kind': 'course', 'title': 'Data Analytics', 'description': 'Master data analysis and visualization', 'level': 5, 'sector': 'IT', 'duration': '1 year', 'skills': ['Data Analysis', 'Statistics', 'Visualization'], 'certification': 'NSQF Level 5', 'icon': '📊'},
+    {'id': 4, 'kind': 'job', 'title': 'Data Scientist', 'description': 'Analyze complex data to drive business decisions', 'level': 6, 'sector': 'IT', 'salary': '₹8-12 LPA', 'requirements': 'Master degree', 'skills': ['Machine Learning', 'Statistics', 'Python'], 'icon': '🔬'},
+    {'id': 5, 'kind': 'course', 'title': 'Digital Marketing', 'description': 'Learn digital marketing strategies and tools', 'level': 3, 'sector': 'IT', 'duration': '3 months', 'skills': ['SEO', 'Social Media', 'Content Marketing'], 'certification': 'NSQF Level 3', 'icon': '📱'},
+    {'id': 6, 'kind': 'job', 'title': 'Digital Marketer', 'description': 'Create and execute digital marketing campaigns', 'level': 4, 'sector': 'IT', 'salary': '₹3-5 LPA', 'requirements': 'High school diploma', 'skills': ['Marketing', 'Analytics', 'Creativity'], 'icon': '📈'},
+    {'id': 7, 'kind': 'course', 'title': 'Cybersecurity', 'description': 'Protect systems and networks from cyber threats', 'level': 6, 'sector': 'IT', 'duration': '1 year', 'skills': ['Security', 'Networking', 'Ethical Hacking'], 'certification': 'NSQF Level 6', 'icon': '🔒'},
+    {'id': 8, 'kind': 'job', 'title': 'Cybersecurity Analyst', 'description': 'Monitor and protect against security threats', 'level': 7, 'sector': 'IT', 'salary': '₹12-20 LPA', 'requirements': 'Professional experience', 'skills': ['Security Analysis', 'Risk Assessment', 'Incident Response'], 'icon': '🛡️'},
+    {'id': 9, 'kind': 'course', 'title': 'Cloud Computing', 'description': 'Master cloud platforms and services', 'level': 5, 'sector': 'IT', 'duration': '6 months', 'skills': ['AWS', 'Azure', 'DevOps'], 'certification': 'NSQF Level 5', 'icon': '☁️'},
+    {'id': 10, 'kind': 'job', 'title': 'Cloud Architect', 'description': 'Design and implement cloud solutions', 'level': 8, 'sector': 'IT', 'salary': '₹20+ LPA', 'requirements': 'Master degree', 'skills': ['Cloud Architecture', 'System Design', 'Leadership'], 'icon': '🏗️'},
+    {'id': 11, 'kind': 'course', 'title': 'AI & Machine Learning', 'description': 'Build intelligent systems and algorithms', 'level': 7, 'sector': 'IT', 'duration': '2 years', 'skills': ['Machine Learning', 'Deep Learning', 'Python'], 'certification': 'NSQF Level 7', 'icon': '🤖'},
+    {'id': 12, 'kind': 'job', 'title': 'AI Engineer', 'description': 'Develop AI solutions and machine learning models', 'level': 9, 'sector': 'IT', 'salary': '₹20+ LPA', 'requirements': 'PhD preferred', 'skills': ['AI Research', 'Model Development', 'Algorithm Design'], 'icon': '🧠'},
+]
+
+
+def seed_careers(apps, schema_editor):
+    Career = apps.get_model('de', 'Career')
+    CareerSkill = apps.get_model('de', 'CareerSkill')
+    if Career.objects.exists():
+        return
+    careers = Career.objects.bulk_create(Career(**entry) for entry in SEED_CAREERS)
+    CareerSkill.objects.bulk_create(
+        CareerSkill(career=career, name=name) for career in careers for name in career.skills
+    )
+    # The ids are explicit (the explorer's translated titles are keyed by
+    # them), so move PostgreSQL's sequence past them.
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), [Career]):
+            cursor.execute(sql)
+
+
+def unseed_careers(apps, schema_editor):
+    apps.get_model('de', 'Career').objects.filter(id__in=[entry['id'] for entry in SEED_CAREERS]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('de', '0007_learnerprofile_one_per_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Career',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('course', 'Course'), ('job', 'Job Role')], max_length=10)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('level', models.PositiveSmallIntegerField()),
+                ('sector', models.CharField(max_length=100)),
+                ('duration', models.CharField(blank=True, max_length=50)),
+                ('salary', models.CharField(blank=True, max_length=50)),
+                ('requirements', models.CharField(blank=True, max_length=200)),
+                ('certification', models.CharField(blank=True, max_length=100)),
+                ('skills', models.JSONField(blank=True, default=list)),
+                ('icon', models.CharField(blank=True, max_length=16)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'id'], name='de_career_kind_idx'), models.Index(fields=['level', 'id'], name='de_career_level_idx'), models.Index(fields=['sector', 'id'], name='de_career_sector_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CareerSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='de.career')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('name', 'career'), name='de_careerskill_name_career_uniq')],
+            },
+        ),
+        migrations.RunPython(seed_careers, unseed_careers),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('de', '0008_career'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('model_version', models.CharField(max_length=12)),
+                ('profiles', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='learnerprofile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.CreateModel(
+            name='Recommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('model_version', models.CharField(max_length=12)),
+                ('skills_digest', models.CharField(max_length=40)),
+                ('computed_at', models.DateTimeField(auto_now_add=True)),
+                ('career', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='de.career')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='de.user')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'rank'), name='de_recommendation_user_rank_uniq')],
+            },
+        ),
+    ]
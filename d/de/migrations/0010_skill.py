@@ -0,0 +1,108 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:31
+
+import django.db.models.deletion
+import json
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def skill_list(skills):
+    # Same rules as de.profiles.normalize_skills: older rows hold a JSON
+    # string or comma-separated text.
+    if isinstance(skills, str):
+        try:
+            skills = json.loads(skills)
+        except json.JSONDecodeError:
+            skills = [s.strip() for s in skills.split(',') if s.strip()]
+    return skills if isinstance(skills, list) else []
+
+
+def link_profile_skills(apps, schema_editor):
+    LearnerProfile = apps.get_model('de', 'LearnerProfile')
+    Skill = apps.get_model('de', 'Skill')
+    LearnerSkill = apps.get_model('de', 'LearnerSkill')
+    skill_ids = {}
+    batch = []
+
+    def flush():
+        # Store legacy string values as lists so nothing has to re-parse them.
+        LearnerProfile.objects.bulk_update(
+            [profile for profile, rewritten, _ in batch if rewritten], ['skills']
+        )
+        names = {}
+        for _, _, found in batch:
+            for key, name in found.items():
+                if key not in skill_ids:
+                    names.setdefault(key, name)
+        Skill.objects.bulk_create(
+            [Skill(name=name, normalized=key) for key, name in names.items()],
+            ignore_conflicts=True,
+        )
+        skill_ids.update(Skill.objects.filter(normalized__in=names).values_list('normalized', 'id'))
+        # A case- or accent-insensitive collation can treat two keys as one
+        # row; map the dropped key to the row the database matched instead.
+        for key in names.keys() - skill_ids.keys():
+            skill_ids[key] = Skill.objects.filter(normalized=key).values_list('id', flat=True).first()
+        LearnerSkill.objects.bulk_create(
+            [
+                LearnerSkill(profile_id=profile.id, skill_id=skill_ids[key])
+                for profile, _, found in batch
+                for key in found
+                if skill_ids[key] is not None
+            ],
+            ignore_conflicts=True,
+        )
+        batch.clear()
+
+    for profile in LearnerProfile.objects.only('id', 'skills').order_by('id').iterator(chunk_size=BATCH_SIZE):
+        skills = skill_list(profile.skills)
+        rewritten = skills != profile.skills
+        profile.skills = skills
+        found = {}
+        for name in skills:
+            if isinstance(name, str) and name.strip():
+                name = ' '.join(name.split())[:100]
+                found.setdefault(name.casefold()[:100], name)
+        batch.append((profile, rewritten, found))
+        if len(batch) >= BATCH_SIZE:
+            flush()
+    if batch:
+        flush()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('de', '0009_recommendation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('normalized', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LearnerSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='de.learnerprofile')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='learner_links', to='de.skill')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='learnerprofile',
+            name='canonical_skills',
+            field=models.ManyToManyField(blank=True, related_name='profiles', through='de.LearnerSkill', to='de.skill'),
+        ),
+        migrations.AddConstraint(
+            model_name='learnerskill',
+            constraint=models.UniqueConstraint(fields=('skill', 'profile'), name='de_learnerskill_skill_profile_uniq'),
+        ),
+        migrations.RunPython(link_profile_skills, migrations.RunPython.noop),
+    ]
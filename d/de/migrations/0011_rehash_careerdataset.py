@@ -0,0 +1,53 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:05
+
+import hashlib
+import re
+import unicodedata
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+# Same rules as de.chatbot.normalize at the time of this migration; later
+# changes there need a migration of their own.
+WHITESPACE = re.compile(r"\s+")
+TECH_SYMBOLS = re.compile(r"(?<=\w)[#+]+(?!\w)|(?<!\S)\.(?=\w)|(?<=\w)\.(?=\w)")
+
+
+def question_hash(text):
+    text = unicodedata.normalize("NFKC", text).casefold()
+    kept = {i for match in TECH_SYMBOLS.finditer(text) for i in range(*match.span())}
+    text = "".join(
+        " " if unicodedata.category(ch).startswith("P") and i not in kept else ch
+        for i, ch in enumerate(text)
+    )
+    text = WHITESPACE.sub(" ", text).strip()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def rehash_questions(apps, schema_editor):
+    # chatbot.normalize now keeps "c#", "c++" and ".net" intact, so hashes
+    # stored before that no longer match the ones computed for lookups.
+    CareerDataset = apps.get_model('de', 'CareerDataset')
+    batch = []
+    for row in CareerDataset.objects.only('id', 'input_text', 'question_hash').order_by('id').iterator(chunk_size=BATCH_SIZE):
+        digest = question_hash(row.input_text)
+        if digest != row.question_hash:
+            row.question_hash = digest
+            batch.append(row)
+            if len(batch) >= BATCH_SIZE:
+                CareerDataset.objects.bulk_update(batch, ['question_hash'])
+                batch.clear()
+    if batch:
+        CareerDataset.objects.bulk_update(batch, ['question_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('de', '0010_skill'),
+    ]
+
+    operations = [
+        migrations.RunPython(rehash_questions, migrations.RunPython.noop),
+    ]
@@ -15,14 +15,150 @@ class User(models.Model):
         return self.email
 
 class LearnerProfile(models.Model):
-    user = models.ForeignKey("User", on_delete=models.CASCADE, related_name="profile")
+    user = models.OneToOneField("User", on_delete=models.CASCADE, related_name="profile")
     phone = models.CharField(max_length=15, blank=True)
     location = models.CharField(max_length=200, blank=True)
     education = models.TextField(blank=True)
     skills = models.JSONField(default=list,blank=True)  
     experience = models.TextField(blank=True)
     preferences = models.TextField(blank=True)
+    # Indexed for precompute_recommendations, which only rescores profiles
+    # changed since its last run.
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # skills above is the display copy, as the learner typed it; queries go
+    # through these links (see de.skills).
+    canonical_skills = models.ManyToManyField(
+        'Skill', through='LearnerSkill', related_name='profiles', blank=True
+    )
 
     def __str__(self):
         return f"{self.user.name} ({self.user.email})"
 
+
+class Skill(models.Model):
+    """One distinct skill across all learner profiles."""
+    name = models.CharField(max_length=100)
+    # de.skills.normalize(name); two spellings of one skill share a row.
+    normalized = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class LearnerSkill(models.Model):
+    profile = models.ForeignKey(LearnerProfile, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='learner_links')
+
+    class Meta:
+        # Skill first, so "learners with skill X" and per-skill counts are
+        # index range scans; profile_id has its own foreign key index.
+        constraints = [
+            models.UniqueConstraint(fields=['skill', 'profile'], name='de_learnerskill_skill_profile_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.profile_id}: {self.skill_id}"
+
+
+class CareerDataset(models.Model):
+    """One question/answer pair of the chatbot corpus, loaded by load_chat_dataset."""
+    LANGUAGE_CHOICES = [
+        ('en', 'English'),
+        ('hi', 'Hindi'),
+        ('gu', 'Gujarati'),
+        ('ta', 'Tamil'),
+        ('bn', 'Bengali'),
+    ]
+    language = models.CharField(max_length=5, choices=LANGUAGE_CHOICES, default='en')
+    input_text = models.TextField()
+    output_text = models.TextField()
+    # sha256 of the normalized question (de.chatbot.question_hash) for exact hits.
+    question_hash = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['language', 'question_hash'], name='de_dataset_lang_hash_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.language}] {self.input_text[:50]}"
+
+
+class Career(models.Model):
+    """A course or job role shown in the career explorer."""
+    KIND_CHOICES = [
+        ('course', 'Course'),
+        ('job', 'Job Role'),
+    ]
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    title = models.CharField(max_length=200)
+    description = models.TextField(blank=True)
+    # NSQF level, 1-10.
+    level = models.PositiveSmallIntegerField()
+    sector = models.CharField(max_length=100)
+    duration = models.CharField(max_length=50, blank=True)
+    salary = models.CharField(max_length=50, blank=True)
+    requirements = models.CharField(max_length=200, blank=True)
+    certification = models.CharField(max_length=100, blank=True)
+    # Display copy of the skill names; filtering goes through CareerSkill.
+    skills = models.JSONField(default=list, blank=True)
+    icon = models.CharField(max_length=16, blank=True)
+
+    class Meta:
+        # Every filter column is indexed together with id, the keyset
+        # pagination order, so a filtered page is an index range scan.
+        indexes = [
+            models.Index(fields=['kind', 'id'], name='de_career_kind_idx'),
+            models.Index(fields=['level', 'id'], name='de_career_level_idx'),
+            models.Index(fields=['sector', 'id'], name='de_career_sector_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.get_kind_display()}, level {self.level})"
+
+
+class CareerSkill(models.Model):
+    """One skill of a Career, as a row so skill filters and counts use an index."""
+    career = models.ForeignKey(Career, on_delete=models.CASCADE, related_name='skill_links')
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'career'], name='de_careerskill_name_career_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.career_id}: {self.name}"
+
+
+class Recommendation(models.Model):
+    """One of a learner's top careers, written by precompute_recommendations."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='recommendations')
+    career = models.ForeignKey(Career, on_delete=models.CASCADE, related_name='+')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+    # What the list was computed from (de.recommendations); rows for another
+    # model or skill set are stale and ignored.
+    model_version = models.CharField(max_length=12)
+    skills_digest = models.CharField(max_length=40)
+    computed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'rank'], name='de_recommendation_user_rank_uniq'),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.career_id} for {self.user_id}"
+
+
+class RecommendationRun(models.Model):
+    """A precompute_recommendations run; the next one starts from finished_at."""
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    model_version = models.CharField(max_length=12)
+    profiles = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.started_at:%Y-%m-%d %H:%M} ({self.profiles} profiles)"
@@ -0,0 +1,107 @@
+"""Reading and writing learner profiles.
+
+The dashboard and load_profile both need the same few profile columns plus
+the user's name and email. ``get`` fetches them in one joined query and keeps
+the result in Django's cache, keyed by user id; ``save`` writes a profile in
+one upsert and invalidates that entry once the write commits. With the
+default per-process cache a stale entry in another worker lives at most
+PROFILE_CACHE_TTL seconds; configure a shared CACHES backend to make
+invalidation immediate everywhere.
+"""
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, router, transaction
+
+from .models import LearnerProfile
+from .skills import link as link_skills
+
+PROFILE_FIELDS = (
+    'phone', 'location', 'education', 'skills', 'experience', 'preferences',
+    'user__name', 'user__email',
+)
+
+# Cached for users with no profile row, so they do not query on every visit.
+_NO_PROFILE = 'none'
+_MISSING = object()
+
+
+def cache_key(user_id):
+    return f"de:profile:{user_id}"
+
+
+def normalize_skills(skills):
+    """Skills as a list; older rows stored a JSON string or comma-separated text."""
+    if isinstance(skills, str):
+        try:
+            skills = json.loads(skills)
+        except json.JSONDecodeError:
+            skills = [s.strip() for s in skills.split(',') if s.strip()]
+    return skills if isinstance(skills, list) else []
+
+
+def fetch(user_id):
+    """Read one user's profile from the database, or None if there is none."""
+    profile = (
+        LearnerProfile.objects
+        .select_related('user')
+        .only(*PROFILE_FIELDS)
+        .filter(user_id=user_id)
+        .order_by('pk')
+        .first()
+    )
+    if profile is None:
+        return None
+    return {
+        "name": profile.user.name or "",
+        "email": profile.user.email,
+        "phone": profile.phone or "",
+        "location": profile.location or "",
+        "education": profile.education or "",
+        "skills": normalize_skills(profile.skills),
+        "experience": profile.experience or "",
+        "preferences": profile.preferences or "",
+    }
+
+
+def get(user_id):
+    """The profile dict for ``user_id`` (see ``fetch``), served from the cache."""
+    key = cache_key(user_id)
+    data = cache.get(key, _MISSING)
+    if data is _MISSING:
+        data = fetch(user_id)
+        cache.set(
+            key, _NO_PROFILE if data is None else data,
+            getattr(settings, 'PROFILE_CACHE_TTL', 300),
+        )
+    return None if data == _NO_PROFILE else data
+
+
+def invalidate(user_id):
+    cache.delete(cache_key(user_id))
+
+
+def save(user, values):
+    """Create or update ``user``'s profile from ``values`` in one statement.
+
+    This is an INSERT ... ON CONFLICT/ON DUPLICATE KEY UPDATE on the unique
+    user column, so concurrent saves cannot create a second row and there is
+    no SELECT before the write. When ``values`` has skills, the profile's
+    LearnerSkill links are replaced to match them.
+    """
+    connection = connections[router.db_for_write(LearnerProfile)]
+    # MySQL picks the conflicting unique key itself and rejects an explicit target.
+    target = {'unique_fields': ['user']} if connection.features.supports_update_conflicts_with_target else {}
+    [profile] = LearnerProfile.objects.bulk_create(
+        [LearnerProfile(user=user, **values)],
+        update_conflicts=True,
+        # updated_at is auto_now; list it so an update also bumps it.
+        update_fields=[*values, 'updated_at'],
+        **target,
+    )
+    if 'skills' in values:
+        # Only some backends return the id of an upserted row.
+        profile_id = profile.pk or LearnerProfile.objects.values_list('pk', flat=True).get(user=user)
+        link_skills(profile_id, normalize_skills(values['skills']))
+    transaction.on_commit(lambda: invalidate(user.id), using=connection.alias)
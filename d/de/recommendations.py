@@ -0,0 +1,428 @@
+"""Skill-based career recommendations.
+
+Careers and learners are vectors over the skill vocabulary (CareerSkill
+names, case-folded). ``Model`` holds the L2-normalized career x skill matrix
+and a career x career cosine similarity matrix, pruned to each career's
+SIMILAR_CAREERS nearest neighbours. A learner's scores are
+
+    direct = careers @ learner           cosine with the learner's skills
+    score  = direct + NEIGHBOUR_WEIGHT * similarity @ direct
+
+so a career that shares no skill with the learner can still rank when it is
+close to careers that do. Because the learner vector is binary, ``careers @
+learner`` is just the sum of the learner's skill columns: scoring touches only
+the careers that have one of those skills, plus one sparse mat-vec.
+
+``manage.py build_recommender`` computes the model offline and writes it to
+RECOMMENDER_MODEL_PATH; workers load that file once and reload it when it
+changes. The similarity matrix is never computed in a request: without the
+file, workers build only the career x skill matrix from the database (linear
+in the catalogue, rebuilt when its rows change) and rank by the direct term
+alone.
+
+Top-N lists are cached per learner with the model version and skill set they
+were computed for, so a profile save that does not touch the skills keeps the
+cached list and one that does recomputes it (see ``refresh``). On a cache
+miss the Recommendation rows written by ``manage.py
+precompute_recommendations`` are used when they match, so most requests
+never score at all.
+"""
+import hashlib
+import math
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from scipy import sparse
+
+from .skills import normalize as normalize_skill
+from .models import Career, CareerSkill, Recommendation
+
+DEFAULT_LIMIT = 10
+SIMILAR_CAREERS = 10
+# Careers per block of the career x career product in nearest_neighbours.
+SIMILARITY_BLOCK = 1024
+NEIGHBOUR_WEIGHT = 0.25
+# Seconds a worker without the model file reuses its last look at the catalogue.
+CATALOGUE_CHECK_INTERVAL = 30
+RECOMMENDATION_FIELDS = (
+    'id', 'kind', 'title', 'description', 'level', 'sector', 'duration',
+    'salary', 'certification', 'skills', 'icon',
+)
+
+
+def model_path():
+    return getattr(
+        settings, 'RECOMMENDER_MODEL_PATH',
+        os.path.join(os.path.dirname(__file__), 'data', 'recommender.npz'),
+    )
+
+
+def skill_set(skills):
+    """The distinct normalized names in a profile's skills list."""
+    return sorted({normalize_skill(s) for s in skills if isinstance(s, str) and s.strip()})
+
+
+def _csr_arrays(prefix, matrix):
+    return {
+        f'{prefix}_data': matrix.data, f'{prefix}_indices': matrix.indices,
+        f'{prefix}_indptr': matrix.indptr, f'{prefix}_shape': np.asarray(matrix.shape),
+    }
+
+
+def _csr(arrays, prefix, cls):
+    return cls(
+        (arrays[f'{prefix}_data'], arrays[f'{prefix}_indices'], arrays[f'{prefix}_indptr']),
+        shape=tuple(arrays[f'{prefix}_shape']),
+    )
+
+
+class Model:
+    def __init__(self, career_ids, skills, careers_by_skill, similarity, version):
+        self.career_ids = career_ids
+        self.skills = skills
+        self.columns = {skill: i for i, skill in enumerate(skills)}
+        # CSC so a learner's skill columns can be sliced out directly.
+        self.careers_by_skill = careers_by_skill
+        self.similarity = similarity
+        self.version = version
+
+    def __len__(self):
+        return len(self.career_ids)
+
+    @classmethod
+    def build(cls, pairs, neighbours=True):
+        """Build from ``(career_id, skill name)`` pairs.
+
+        With ``neighbours=False`` the similarity matrix is left empty, so
+        careers are ranked by their direct overlap with the learner only.
+        """
+        career_index, columns = {}, {}
+        rows, cols = [], []
+        for career_id, name in pairs:
+            skill = normalize_skill(name)
+            if skill:
+                rows.append(career_index.setdefault(career_id, len(career_index)))
+                cols.append(columns.setdefault(skill, len(columns)))
+
+        shape = (len(career_index), len(columns))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=shape
+        )
+        matrix.sum_duplicates()
+        matrix.data[:] = 1
+        norms = np.sqrt(np.asarray(matrix.sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        matrix = sparse.csr_matrix(sparse.diags(1 / norms) @ matrix, dtype=np.float32)
+
+        career_ids = np.fromiter(career_index, dtype=np.int64, count=len(career_index))
+        skills = np.asarray(list(columns), dtype=str)
+        digest = hashlib.sha1(career_ids.tobytes())
+        digest.update('\n'.join(skills).encode('utf-8'))
+        digest.update(matrix.indptr.tobytes() + matrix.indices.tobytes())
+        if neighbours:
+            similarity = cls.nearest_neighbours(matrix)
+        else:
+            digest.update(b'direct only')
+            similarity = sparse.csr_matrix((len(career_ids), len(career_ids)), dtype=np.float32)
+        return cls(career_ids, skills, matrix.tocsc(), similarity, digest.hexdigest()[:12])
+
+    @staticmethod
+    def nearest_neighbours(matrix, k=SIMILAR_CAREERS, block=SIMILARITY_BLOCK):
+        """Career x career cosine similarity, keeping each row's top ``k``.
+
+        The product is computed ``block`` rows at a time and pruned before the
+        next block, so memory stays at one block of it rather than growing
+        with the square of the catalogue when many careers share a skill.
+        """
+        shape = (matrix.shape[0], matrix.shape[0])
+        transposed = matrix.T.tocsr()
+        rows, cols, values = [], [], []
+        for start in range(0, matrix.shape[0], block):
+            product = (matrix[start:start + block] @ transposed).tocsr()
+            for offset in range(product.shape[0]):
+                row = start + offset
+                begin, end = product.indptr[offset], product.indptr[offset + 1]
+                indices, data = product.indices[begin:end], product.data[begin:end]
+                others = (indices != row) & (data != 0)
+                indices, data = indices[others], data[others]
+                if len(data) > k:
+                    keep = np.argpartition(-data, k)[:k]
+                    indices, data = indices[keep], data[keep]
+                rows.append(np.full(len(data), row))
+                cols.append(indices)
+                values.append(data)
+        if not rows:
+            return sparse.csr_matrix(shape, dtype=np.float32)
+        return sparse.csr_matrix(
+            (np.concatenate(values).astype(np.float32), (np.concatenate(rows), np.concatenate(cols))),
+            shape=shape,
+        )
+
+    @classmethod
+    def from_database(cls, neighbours=True):
+        pairs = CareerSkill.objects.order_by('career_id', 'id').values_list('career_id', 'name')
+        return cls.build(pairs.iterator(chunk_size=2000), neighbours)
+
+    def save(self, path):
+        """Write the model as an .npz, atomically."""
+        tmp = f'{path}.tmp.npz'
+        np.savez(
+            tmp, career_ids=self.career_ids, skills=self.skills,
+            version=np.asarray(self.version),
+            **_csr_arrays('careers', self.careers_by_skill.tocsr()),
+            **_csr_arrays('similarity', self.similarity),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as arrays:
+            return cls(
+                arrays['career_ids'], arrays['skills'],
+                _csr(arrays, 'careers', sparse.csr_matrix).tocsc(),
+                _csr(arrays, 'similarity', sparse.csr_matrix),
+                str(arrays['version']),
+            )
+
+    def _learner_columns(self, skills):
+        return [self.columns[s] for s in skills if s in self.columns]
+
+    def scores(self, skills):
+        """Score every career for a learner with ``skills`` (normalized names)."""
+        columns = self._learner_columns(skills)
+        if not columns:
+            return np.zeros(len(self), dtype=np.float32)
+        direct = np.asarray(self.careers_by_skill[:, columns].sum(axis=1)).ravel()
+        direct /= math.sqrt(len(skills))
+        return direct + NEIGHBOUR_WEIGHT * (self.similarity @ direct)
+
+    def scores_many(self, skill_sets):
+        """``scores`` for many learners at once, as a sparse learner x career matrix."""
+        rows, cols, values = [], [], []
+        for row, skills in enumerate(skill_sets):
+            columns = self._learner_columns(skills)
+            if not columns:
+                continue
+            rows.extend([row] * len(columns))
+            cols.extend(columns)
+            values.extend([1 / math.sqrt(len(skills))] * len(columns))
+        learners = sparse.csr_matrix(
+            (np.asarray(values, dtype=np.float32), (rows, cols)),
+            shape=(len(skill_sets), len(self.skills)),
+        )
+        direct = (learners @ self.careers_by_skill.T).tocsr()
+        return (direct + NEIGHBOUR_WEIGHT * (direct @ self.similarity.T)).tocsr()
+
+    def _rank(self, candidates, scores, limit):
+        keep = scores > 0
+        candidates, scores = candidates[keep], scores[keep]
+        if len(candidates) > limit:
+            best = np.argpartition(-scores, limit)[:limit]
+            candidates, scores = candidates[best], scores[best]
+        order = np.lexsort((self.career_ids[candidates], -scores))
+        return [
+            (int(self.career_ids[i]), round(float(score), 4))
+            for i, score in zip(candidates[order], scores[order])
+        ]
+
+    def top(self, skills, limit=DEFAULT_LIMIT):
+        """``[(career_id, score), ...]`` for the best ``limit`` careers with a positive score."""
+        scores = self.scores(skills)
+        return self._rank(np.arange(len(self)), scores, limit)
+
+    def top_many(self, skill_sets, limit=DEFAULT_LIMIT):
+        """``top`` for each of ``skill_sets``, scored with one matrix product."""
+        scores = self.scores_many(skill_sets)
+        return [
+            self._rank(
+                scores.indices[start:end], scores.data[start:end], limit
+            )
+            for start, end in zip(scores.indptr[:-1], scores.indptr[1:])
+        ]
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def catalogue_signature():
+    """Row counts and highest ids of Career and CareerSkill.
+
+    Read from the database, so loads and admin edits made by other processes
+    change it; careers.catalogue_version lives in the cache, which is per
+    process unless CACHES is shared. Renaming a skill in place keeps it.
+    """
+    signature = []
+    for model in (Career, CareerSkill):
+        rows = model.objects.aggregate(count=Count('id'), last=Max('id'))
+        signature += [rows['count'], rows['last']]
+    return tuple(signature)
+
+
+class ModelStore:
+    """The process's model, reloaded when the file or the catalogue changes.
+
+    Only ever loads the file written by build_recommender; without it, a
+    direct-overlap model (no similarity matrix) is built from the database
+    and rebuilt when ``catalogue_signature`` changes, which is checked at
+    most every CATALOGUE_CHECK_INTERVAL seconds.
+    """
+
+    def __init__(self):
+        self._model = None
+        self._source = None
+        self._catalogue = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _database_source(self):
+        now = time.monotonic()
+        if self._catalogue is None or now - self._checked_at >= CATALOGUE_CHECK_INTERVAL:
+            self._catalogue = ('db', catalogue_signature())
+            self._checked_at = now
+        return self._catalogue
+
+    def get(self):
+        path = model_path()
+        mtime = _mtime(path)
+        source = ('file', mtime) if mtime is not None else self._database_source()
+        if self._model is not None and self._source == source:
+            return self._model
+        with self._lock:
+            if self._model is None or self._source != source:
+                if mtime is not None:
+                    self._model = Model.load(path)
+                else:
+                    self._model = Model.from_database(neighbours=False)
+                self._source = source
+        return self._model
+
+    def clear(self):
+        with self._lock:
+            self._model = self._source = self._catalogue = None
+
+
+models = ModelStore()
+
+
+def cache_key(user_id):
+    return f"de:recommendations:{user_id}"
+
+
+def skills_digest(skills):
+    """Identifies a normalized skill set (see ``skill_set``)."""
+    return hashlib.sha1('\n'.join(skills).encode('utf-8')).hexdigest()
+
+
+def _cache_entry(user_id, ranked, version, digest, limit):
+    entry = {'model': version, 'skills': digest, 'limit': limit, 'ranked': ranked}
+    cache.set(cache_key(user_id), entry, getattr(settings, 'RECOMMENDATION_CACHE_TTL', 86400))
+    return ranked
+
+
+def _cached(user_id, version, digest, limit):
+    entry = cache.get(cache_key(user_id))
+    if (
+        entry is not None
+        and entry['model'] == version
+        and entry['skills'] == digest
+        and entry['limit'] >= limit
+    ):
+        return entry['ranked'][:limit]
+    return None
+
+
+def stored(user_id, version, digest):
+    """The learner's rows written by precompute_recommendations, if still current."""
+    rows = list(
+        Recommendation.objects.filter(user_id=user_id).order_by('rank')
+        .values_list('career_id', 'score', 'model_version', 'skills_digest')
+    )
+    if rows and all(row[2] == version and row[3] == digest for row in rows):
+        return [(career_id, score) for career_id, score, _, _ in rows]
+    return None
+
+
+def compute(user_id, skills, limit=DEFAULT_LIMIT):
+    """Score ``skills`` and cache the result for ``user_id``."""
+    model = models.get()
+    skills = skill_set(skills)
+    return _cache_entry(
+        user_id, model.top(skills, limit), model.version, skills_digest(skills), limit
+    )
+
+
+def ranked(user_id, skills, limit=DEFAULT_LIMIT):
+    """``[(career_id, score), ...]`` for the learner.
+
+    Served from the cache, then from the precomputed Recommendation rows, and
+    only scored here when neither matches the current model and skills.
+    """
+    version = models.get().version
+    digest = skills_digest(skill_set(skills))
+    found = _cached(user_id, version, digest, limit)
+    if found is None and limit <= DEFAULT_LIMIT:
+        found = stored(user_id, version, digest)
+        if found is not None:
+            _cache_entry(user_id, found, version, digest, DEFAULT_LIMIT)
+            found = found[:limit]
+    if found is None:
+        found = compute(user_id, skills, max(limit, DEFAULT_LIMIT))[:limit]
+    return found
+
+
+def refresh(user_id, skills):
+    """Recompute the learner's cached list if their skills changed since it was computed."""
+    version = models.get().version
+    if _cached(user_id, version, skills_digest(skill_set(skills)), DEFAULT_LIMIT) is None:
+        compute(user_id, skills)
+
+
+# precompute_recommendations scores chunks of learners in a process pool; each
+# worker is forked with the model already loaded.
+_worker_model = None
+
+
+def init_worker(model):
+    global _worker_model
+    _worker_model = model
+
+
+def score_chunk(chunk, limit=DEFAULT_LIMIT):
+    """``[(user_id, skills), ...]`` to ``[(user_id, skills_digest, ranked), ...]``.
+
+    ``skills`` are normalized skill sets (see ``skill_set``).
+    """
+    model = _worker_model or models.get()
+    ranked = model.top_many([skills for _, skills in chunk], limit)
+    return [
+        (user_id, skills_digest(skills), top)
+        for (user_id, skills), top in zip(chunk, ranked)
+    ]
+
+
+def recommend(user_id, skills, limit=DEFAULT_LIMIT):
+    """Top careers for the learner with the score and the matched and missing skills."""
+    top = ranked(user_id, skills, limit)
+    rows = Career.objects.only(*RECOMMENDATION_FIELDS).in_bulk([career_id for career_id, _ in top])
+    learner = set(skill_set(skills))
+    results = []
+    for career_id, score in top:
+        career = rows.get(career_id)
+        # The model may be older than the catalogue; skip careers deleted since.
+        if career is None:
+            continue
+        item = {field: getattr(career, field) for field in RECOMMENDATION_FIELDS}
+        item['score'] = score
+        item['matched_skills'] = [s for s in career.skills if normalize_skill(s) in learner]
+        item['missing_skills'] = [s for s in career.skills if normalize_skill(s) not in learner]
+        results.append(item)
+    return results
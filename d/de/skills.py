@@ -0,0 +1,238 @@
+"""The canonical skill list and the profile <-> skill links.
+
+``LearnerProfile.skills`` keeps the skills as the learner typed them, for
+display. Each distinct skill (compared by ``normalize``) is also one Skill
+row, linked to the profiles that list it through LearnerSkill, so questions
+like "which learners know SQL" or "what are the most common skills" are
+index lookups and one GROUP BY instead of decoding every profile's JSON.
+
+``suggest`` answers the profile builder's autocomplete from ``SkillIndex``, a
+prefix trie over every known skill name and its aliases, built once per
+process (see ``SuggestionStore``).
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Count
+
+from . import i18n
+from .models import CareerSkill, LearnerProfile, LearnerSkill, Skill
+
+NAME_MAX_LENGTH = Skill._meta.get_field('name').max_length
+
+
+def normalize(name):
+    """The comparison form of a skill name: single-spaced and case-folded."""
+    return ' '.join(name.split()).casefold()[:NAME_MAX_LENGTH]
+
+
+def canonical(names):
+    """``{normalized: display name}`` for ``names``, first spelling wins."""
+    found = {}
+    for name in names:
+        if isinstance(name, str) and name.strip():
+            found.setdefault(normalize(name), ' '.join(name.split())[:NAME_MAX_LENGTH])
+    return found
+
+
+def ensure(names):
+    """Skill ids for ``names``, creating the skills that do not exist yet."""
+    found = canonical(names)
+    if not found:
+        return {}
+    Skill.objects.bulk_create(
+        [Skill(name=name, normalized=key) for key, name in found.items()],
+        ignore_conflicts=True,
+    )
+    ids = dict(Skill.objects.filter(normalized__in=found).values_list('normalized', 'id'))
+    # Under a case- or accent-insensitive collation (MySQL's default) two of
+    # our keys, e.g. "resume" and "résumé", can be one row to the database;
+    # the second insert was dropped, so ask the database which row it matched.
+    for key in found.keys() - ids.keys():
+        skill_id = Skill.objects.filter(normalized=key).values_list('id', flat=True).first()
+        if skill_id is not None:
+            ids[key] = skill_id
+    return ids
+
+
+def link(profile_id, names):
+    """Make ``names`` exactly the skills linked to the profile."""
+    skill_ids = set(ensure(names).values())
+    LearnerSkill.objects.filter(profile_id=profile_id).exclude(skill_id__in=skill_ids).delete()
+    LearnerSkill.objects.bulk_create(
+        [LearnerSkill(profile_id=profile_id, skill_id=skill_id) for skill_id in skill_ids],
+        ignore_conflicts=True,
+    )
+
+
+def learners_with(name):
+    """Profiles listing the skill ``name`` (any spelling)."""
+    return LearnerProfile.objects.filter(skill_links__skill__normalized=normalize(name))
+
+
+def popularity(limit=10):
+    """``[{'name': ..., 'learners': n}, ...]`` for the most common skills."""
+    return list(
+        Skill.objects
+        .annotate(learners=Count('learner_links'))
+        .filter(learners__gt=0)
+        .order_by('-learners', 'name')
+        .values('name', 'learners')[:limit]
+    )
+
+
+MAX_SUGGESTIONS = 10
+
+# Other spellings people type for a skill, mapped to its canonical name.
+ALIASES = {
+    'js': 'JavaScript',
+    'ml': 'Machine Learning',
+    'ai': 'Artificial Intelligence',
+    'dsa': 'Data Structures & Algorithms',
+    'db': 'Database Management',
+    'devops': 'DevOps',
+    'excel': 'Microsoft Excel',
+}
+
+# UI strings whose English text is a skill name; their translations are
+# aliases of that skill, so a learner can type it in their own language.
+TRANSLATED_SKILL_KEYS = {
+    'career_explorer': ['skills1', 'skills2', 'skills3', 'skills4', 'skills5', 'skills6'],
+    'recommendation_viewer': [f'skill{n}' for n in range(1, 9)],
+}
+
+
+def translated_names():
+    """``{canonical name: {lang: translated name}}`` from the UI string tables."""
+    found = {}
+    for page, keys in TRANSLATED_SKILL_KEYS.items():
+        table = i18n.PAGES[page]
+        for key in keys:
+            name = table[i18n.DEFAULT_LANGUAGE][key]
+            for lang in i18n.LANGUAGES:
+                if lang != i18n.DEFAULT_LANGUAGE and key in table.get(lang, {}):
+                    found.setdefault(name, {})[lang] = table[lang][key]
+    return found
+
+
+class _Node:
+    __slots__ = ('children', 'top')
+
+    def __init__(self):
+        self.children = {}
+        self.top = []
+
+
+class SkillIndex:
+    """Prefix trie over skill names and aliases.
+
+    Every node keeps the ids of the MAX_SUGGESTIONS most popular skills below
+    it, so a lookup is one walk down the query's characters and costs the
+    same however many skills share the prefix. Each word of a name is also
+    indexed, so "learn" finds "Machine Learning".
+    """
+
+    def __init__(self, skills, limit=MAX_SUGGESTIONS):
+        """``skills`` is ``[(name, popularity, {lang: label}, [aliases])]``."""
+        self.root = _Node()
+        # Inserting the most popular first keeps every node's list in order.
+        self.skills = sorted(skills, key=lambda skill: (-skill[1], skill[0]))
+        for skill_id, (name, _, labels, aliases) in enumerate(self.skills):
+            keys = set()
+            for text in (name, *labels.values(), *aliases):
+                words = normalize(text).split(' ')
+                keys.update(' '.join(words[i:]) for i in range(len(words)))
+            for key in keys:
+                self._insert(key, skill_id, limit)
+
+    def _insert(self, key, skill_id, limit):
+        node = self.root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+            if len(node.top) < limit and skill_id not in node.top:
+                node.top.append(skill_id)
+
+    def __len__(self):
+        return len(self.skills)
+
+    def suggest(self, query, lang=i18n.DEFAULT_LANGUAGE, limit=MAX_SUGGESTIONS):
+        """``[{'name', 'label', 'popularity'}, ...]`` for skills matching the prefix ``query``."""
+        node = self.root
+        for char in normalize(query):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        if node is self.root:
+            return []
+        return [
+            {'name': name, 'label': labels.get(lang, name), 'popularity': popularity}
+            for name, popularity, labels, _ in (self.skills[i] for i in node.top[:limit])
+        ]
+
+    @classmethod
+    def from_database(cls):
+        """Index learner skills and career skills, ranked by how often each is used."""
+        names, popularity = {}, {}
+        learner_counts = Skill.objects.annotate(count=Count('learner_links')).values_list(
+            'normalized', 'name', 'count'
+        )
+        for key, name, count in learner_counts:
+            names[key] = name
+            popularity[key] = count
+        career_counts = CareerSkill.objects.values_list('name').annotate(count=Count('id')).order_by()
+        for name, count in career_counts:
+            key = normalize(name)
+            # Career spellings are curated, so they replace a learner's.
+            names[key] = name
+            popularity[key] = popularity.get(key, 0) + count
+
+        labels, aliases = {}, {}
+        for name, translated in translated_names().items():
+            key = normalize(name)
+            names.setdefault(key, name)
+            popularity.setdefault(key, 0)
+            labels[key] = translated
+        for alias, name in ALIASES.items():
+            key = normalize(name)
+            names.setdefault(key, name)
+            popularity.setdefault(key, 0)
+            aliases.setdefault(key, []).append(alias)
+
+        return cls([
+            (names[key], popularity[key], labels.get(key, {}), aliases.get(key, []))
+            for key in names
+        ])
+
+
+class SuggestionStore:
+    """The process's SkillIndex, rebuilt SKILL_SUGGEST_TTL seconds after it was built."""
+
+    def __init__(self):
+        self._index = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def _fresh(self):
+        ttl = getattr(settings, 'SKILL_SUGGEST_TTL', 3600)
+        return self._index is not None and time.monotonic() - self._built_at < ttl
+
+    def get(self):
+        if self._fresh():
+            return self._index
+        with self._lock:
+            if not self._fresh():
+                self._index = SkillIndex.from_database()
+                self._built_at = time.monotonic()
+        return self._index
+
+    def clear(self):
+        with self._lock:
+            self._index = None
+
+
+suggestions = SuggestionStore()
+
+
+def suggest(query, lang=i18n.DEFAULT_LANGUAGE, limit=MAX_SUGGESTIONS):
+    return suggestions.get().suggest(query, lang, limit)
@@ -1,3 +1,562 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.loader import MigrationLoader
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+
+from . import bm25, chat_index, chatbot, i18n, profiles, recommendations, skills
+from .models import (
+    Career, CareerDataset, CareerSkill, LearnerProfile, Recommendation, RecommendationRun, User,
+)
+
+
+def write_jsonl(rows):
+    """Write ``rows`` to a temporary JSONL file and return its path."""
+    fd, path = tempfile.mkstemp(suffix='.jsonl')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + '\n')
+    return path
+
+
+class ChatbotSearchTests(TestCase):
+    def test_post_body_must_be_an_object(self):
+        for body in ([{"messages": ["hi"]}], "hi", 3, None):
+            response = self.client.post(
+                reverse('chatbot_search'), json.dumps(body), content_type='application/json'
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json(), {'status': 'error', 'message': 'Invalid data format'})
+
+
+class NormalizeTests(TestCase):
+    def test_technical_names_keep_their_symbols(self):
+        self.assertEqual(chatbot.normalize("What is C#?"), "what is c#")
+        self.assertEqual(chatbot.normalize("What is .NET?"), "what is .net")
+        self.assertEqual(chatbot.normalize("what is c++"), "what is c++")
+        self.assertEqual(chatbot.normalize("Node.js, really!"), "node.js really")
+        self.assertEqual(chatbot.normalize("क्या है।"), "क्या है")
+
+    def test_c_sharp_and_c_get_their_own_answers(self):
+        corpus = chatbot.Corpus(
+            None, ("what is c?", "what is c#?"), ("C is a systems language.", "C# is a .NET language.")
+        )
+        self.assertEqual(corpus.exact_match("What is C#?"), "C# is a .NET language.")
+        self.assertEqual(corpus.exact_match("what is c"), "C is a systems language.")
+
+
+class DatabaseCorpusTests(TestCase):
+    def test_reload_changes_version(self):
+        def load(answer):
+            CareerDataset.objects.filter(language='en').delete()
+            CareerDataset.objects.create(
+                language='en', input_text='what is c?', output_text=answer,
+                question_hash=chatbot.question_hash('what is c?'),
+            )
+
+        with mock.patch.object(chatbot, 'DATABASE_VERSION_TTL', 0):
+            load('old')
+            before = chatbot.DatabaseCorpus('en')
+            cache = chatbot.answer_cache.for_corpus('en', before)
+            cache.put(('difflib', 'what is c'), before.exact_match('what is c?'))
+            load('new')
+            after = chatbot.DatabaseCorpus('en')
+            self.assertNotEqual(before.version, after.version)
+            self.assertIsNone(chatbot.answer_cache.for_corpus('en', after).get(('difflib', 'what is c')))
+            self.assertEqual(after.exact_match('What is C?'), 'new')
+
+
+class LanguageBundleTests(TestCase):
+    def test_current_version_is_cacheable_and_revalidates(self):
+        url = i18n.bundle_url('hi')
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(json.loads(gzip.decompress(response.content)), i18n.language_bundles['hi'].strings)
+
+        again = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b'')
+        # The identity representation has a different ETag.
+        plain = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(plain.status_code, 200)
+        self.assertEqual(json.loads(plain.content), i18n.language_bundles['hi'].strings)
+
+    def test_stale_version_redirects_to_the_current_one(self):
+        response = self.client.get(reverse('i18n_bundle', args=['ta', 'stale']))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], i18n.bundle_url('ta'))
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+
+    def test_unknown_language(self):
+        response = self.client.get(reverse('i18n_bundle', args=['xx', i18n.VERSION]))
+        self.assertEqual(response.status_code, 404)
+
+
+class ChatIndexTests(SimpleTestCase):
+    ROWS = [
+        {'user': 'What is C#?', 'assistant': 'C# is a .NET language.'},
+        {'user': 'How do I become a welder?', 'assistant': 'Take an ITI welding course.'},
+        {'user': 'Which jobs use SQL?', 'assistant': 'Data analysts and developers.'},
+        {'user': 'What does a welder earn?', 'assistant': 'Take an ITI welding course.'},
+    ]
+
+    def setUp(self):
+        self.path = write_jsonl(self.ROWS)
+        self.addCleanup(os.remove, self.path)
+        self.index = chat_index.index_path(self.path)
+        self.addCleanup(lambda: os.path.exists(self.index) and os.remove(self.index))
+
+    def compile(self):
+        chat_index.write(chatbot.Corpus.from_jsonl(self.path), self.index, os.stat(self.path))
+
+    def test_round_trip(self):
+        parsed = chatbot.Corpus.from_jsonl(self.path)
+        self.compile()
+        loaded = chat_index.load(self.path)
+        self.assertIsInstance(loaded.exact, chat_index.SortedLookup)
+        self.assertEqual(list(loaded.questions), list(parsed.questions))
+        self.assertEqual(list(loaded.answers), list(parsed.answers))
+        for message in ('what is c#', 'WHICH jobs use sql', 'how to become welder', 'sql jobs'):
+            self.assertEqual(loaded.match(message), parsed.match(message), message)
+            self.assertEqual(loaded.search([message], k=2), parsed.search([message], k=2), message)
+
+    def test_stale_index_is_ignored(self):
+        self.compile()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'user': 'What is Rust?', 'assistant': 'A systems language.'}) + '\n')
+        loaded = chat_index.load(self.path)
+        self.assertNotIsInstance(loaded.exact, chat_index.SortedLookup)
+        self.assertEqual(loaded.exact_match('what is rust'), 'A systems language.')
+
+    def test_unreadable_index_is_ignored(self):
+        with open(self.index, 'wb') as f:
+            f.write(b'not an index')
+        loaded = chat_index.load(self.path)
+        self.assertEqual(len(loaded), len(self.ROWS))
+        self.assertEqual(loaded.exact_match('what is c#'), 'C# is a .NET language.')
+
+
+class ChatbotStreamTests(TestCase):
+    def test_events_are_sent_as_they_are_produced(self):
+        ranked = mock.Mock(return_value="ranked answer")
+        with mock.patch.object(chatbot, 'quick_answer', return_value=None), \
+                mock.patch.object(chatbot, 'ranked_answer', ranked):
+            response = self.client.get(reverse('chatbot_stream'), {'message': 'hello', 'lang': 'en'})
+            self.assertFalse(response.is_async)
+            chunks = iter(response.streaming_content)
+            self.assertIn(b'event: status', next(chunks))
+            # The status event went out before matching started.
+            ranked.assert_not_called()
+            self.assertIn(b'"ranked answer"', next(chunks))
+            ranked.assert_called_once_with('hello', 'en')
+            self.assertIn(b'event: done', next(chunks))
+
+
+class LoadCareersTests(TestCase):
+    rows = [
+        {'kind': 'job', 'title': 'Welder', 'level': 4, 'sector': 'Manufacturing', 'skills': ['Welding', 'Safety']},
+        {'kind': 'job', 'title': 'Welder', 'level': 5, 'sector': 'Manufacturing', 'skills': ['Welding']},
+        {'kind': 'course', 'title': 'Basic Python', 'level': 3, 'sector': 'IT', 'skills': 'Python, SQL'},
+    ]
+
+    def load(self, *args):
+        path = write_jsonl(self.rows)
+        self.addCleanup(os.unlink, path)
+        call_command('load_careers', path, *args, stdout=mock.Mock(), stderr=mock.Mock())
+
+    def skills_by_career(self):
+        return {
+            (career.title, career.level): sorted(career.skill_links.values_list('name', flat=True))
+            for career in Career.objects.filter(title__in=['Welder', 'Basic Python'])
+        }
+
+    def test_links_skills_when_bulk_insert_returns_no_ids(self):
+        with mock.patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False):
+            self.load('--batch-size', '2')
+        self.assertEqual(self.skills_by_career(), {
+            ('Welder', 4): ['Safety', 'Welding'],
+            ('Welder', 5): ['Welding'],
+            ('Basic Python', 3): ['Python', 'SQL'],
+        })
+
+    def test_replace_swaps_the_catalogue(self):
+        self.load('--replace')
+        self.assertEqual(Career.objects.count(), 3)
+        self.assertEqual(CareerSkill.objects.count(), 5)
+
+    def test_failed_replace_keeps_the_catalogue(self):
+        before = Career.objects.count()
+        with mock.patch.object(Career.objects, 'bulk_create', side_effect=OSError('disk full')):
+            with self.assertRaises(Exception):
+                self.load('--replace')
+        self.assertEqual(Career.objects.count(), before)
+
+
+@override_settings(RECOMMENDER_MODEL_PATH='/nonexistent/recommender.npz')
+class CareerSearchTests(TestCase):
+    def get(self, **params):
+        response = self.client.get(reverse('careers_api'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_keyset_pages_do_not_overlap(self):
+        seen = []
+        first = self.get(limit=5)
+        self.assertEqual(first['total'], Career.objects.count())
+        # Deleting a row already shown must not shift the next page, as an
+        # OFFSET would.
+        Career.objects.filter(id=first['results'][0]['id']).delete()
+        data, cursor = first, first['next_cursor']
+        seen.extend(row['id'] for row in data['results'])
+        while cursor is not None:
+            data = self.get(limit=5, cursor=cursor)
+            self.assertNotIn('facets', data)
+            seen.extend(row['id'] for row in data['results'])
+            cursor = data['next_cursor']
+        self.assertEqual(seen, sorted(set(seen)))
+        self.assertEqual(
+            set(seen), set(Career.objects.values_list('id', flat=True)) | {first['results'][0]['id']}
+        )
+
+    def test_facets_leave_out_their_own_filter(self):
+        data = self.get(level=5, kind='job')
+        jobs = Career.objects.filter(kind='job')
+        level_5 = Career.objects.filter(level=5)
+        self.assertEqual(data['total'], jobs.filter(level=5).count())
+        self.assertEqual(
+            data['facets']['level'],
+            {str(level): jobs.filter(level=level).count() for level in jobs.values_list('level', flat=True)},
+        )
+        self.assertEqual(
+            data['facets']['kind'],
+            {kind: level_5.filter(kind=kind).count() for kind in level_5.values_list('kind', flat=True)},
+        )
+        skill = CareerSkill.objects.filter(career__kind='job', career__level=5).values_list('name', flat=True)[0]
+        self.assertEqual(
+            data['facets']['skill'][skill],
+            CareerSkill.objects.filter(name=skill, career__kind='job', career__level=5).count(),
+        )
+
+    def test_facet_counts_follow_catalogue_changes(self):
+        before = self.get(sector='IT')['facets']['kind'].get('job', 0)
+        Career.objects.create(kind='job', title='Network Engineer', level=6, sector='IT')
+        self.assertEqual(self.get(sector='IT')['facets']['kind']['job'], before + 1)
+
+
+class RecommendationModelTests(TestCase):
+    def setUp(self):
+        recommendations.models.clear()
+        self.addCleanup(recommendations.models.clear)
+
+    def test_database_model_sees_careers_added_elsewhere(self):
+        with mock.patch.object(recommendations, 'CATALOGUE_CHECK_INTERVAL', 0):
+            before = recommendations.models.get()
+            # bulk_create sends no signals, so this process's cached catalogue
+            # version stays put, as it does when another process loads careers.
+            career, = Career.objects.bulk_create(
+                [Career(kind='job', title='Beekeeper', level=3, sector='Agriculture')]
+            )
+            CareerSkill.objects.bulk_create([CareerSkill(career=career, name='Apiculture')])
+            after = recommendations.models.get()
+        self.assertNotEqual(before.version, after.version)
+        self.assertEqual(after.top(['apiculture'])[0][0], career.id)
+
+
+@override_settings(RECOMMENDER_MODEL_PATH='/nonexistent/recommender.npz')
+class PrecomputeRecommendationsTests(TestCase):
+    def setUp(self):
+        recommendations.models.clear()
+        self.addCleanup(recommendations.models.clear)
+        self.profiles = {}
+        for name, names in [('asha', ['Python', 'Statistics']), ('ravi', ['SEO', 'Social Media'])]:
+            user = User.objects.create(name=name, email=f'{name}@example.com', password='x')
+            profile = LearnerProfile.objects.create(user=user, skills=names)
+            skills.link(profile.id, names)
+            self.profiles[name] = profile
+
+    def precompute(self, *args):
+        out = io.StringIO()
+        call_command('precompute_recommendations', *args, stdout=out)
+        return out.getvalue()
+
+    def stored(self, profile):
+        return list(
+            Recommendation.objects.filter(user_id=profile.user_id).order_by('rank')
+            .values_list('career_id', flat=True)
+        )
+
+    def test_stores_what_recommend_ranks(self):
+        self.assertIn('Scored 2 profiles', self.precompute())
+        model = recommendations.models.get()
+        for profile in self.profiles.values():
+            expected = [career_id for career_id, _ in model.top(recommendations.skill_set(profile.skills))]
+            self.assertEqual(self.stored(profile), expected)
+            self.assertEqual(
+                [career_id for career_id, _ in recommendations.ranked(profile.user_id, profile.skills)],
+                expected,
+            )
+
+    def test_rescores_only_profiles_saved_since_the_last_run(self):
+        self.precompute()
+        last = RecommendationRun.objects.get()
+        LearnerProfile.objects.update(updated_at=last.finished_at - timedelta(hours=1))
+        self.profiles['asha'].save()
+        self.assertIn('Scored 1 profiles', self.precompute('--overlap', '0'))
+        self.assertIn('Scored 0 profiles', self.precompute('--overlap', '0'))
+
+    def test_overlap_rescores_profiles_saved_just_before_the_last_run_finished(self):
+        self.precompute()
+        last = RecommendationRun.objects.get()
+        LearnerProfile.objects.update(updated_at=last.finished_at - timedelta(seconds=60))
+        self.assertIn('Scored 0 profiles', self.precompute('--overlap', '0'))
+        RecommendationRun.objects.exclude(pk=last.pk).delete()
+        self.assertIn('Scored 2 profiles', self.precompute('--overlap', '300'))
+
+    def test_scores_in_process_without_fork(self):
+        with mock.patch(
+            'de.management.commands.precompute_recommendations.fork_available', return_value=False
+        ):
+            output = self.precompute('--workers', '2')
+        self.assertIn('scoring in this process', output)
+        self.assertIn('Scored 2 profiles', output)
+
+
+class SessionLanguageTests(TestCase):
+    def setUp(self):
+        user = User.objects.create(name='Asha', email='asha@example.com', password='x', role='learner')
+        session = self.client.session
+        session.update({'user_id': user.id, 'user_name': user.name, 'user_role': 'learner'})
+        session.save()
+
+    def post(self, name, language):
+        return self.client.post(
+            reverse(name), json.dumps({'language': language}), content_type='application/json'
+        )
+
+    def test_latest_choice_wins_on_every_page(self):
+        self.post('set_language', 'ta')
+        self.post('change_language', 'hi')
+        response = self.client.get(reverse('profile_builder'))
+        self.assertEqual(response.wsgi_request.LANGUAGE_CODE, 'hi')
+        self.assertEqual(response.context['user_language'], 'hi')
+        self.assertEqual(self.client.get(reverse('load_profile')).json()['language'], 'hi')
+
+        self.post('set_language', 'bn')
+        response = self.client.get(reverse('learner_dashboard'))
+        self.assertEqual(response.wsgi_request.LANGUAGE_CODE, 'bn')
+
+
+class ProfileSaveTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(name='Asha', email='asha@example.com', password='x', role='learner')
+
+    def test_saving_again_updates_the_one_row(self):
+        profiles.save(self.user, {'location': 'Pune', 'skills': ['Python', 'SQL']})
+        first = LearnerProfile.objects.get(user=self.user)
+        profiles.save(self.user, {'location': 'Surat', 'skills': ['Python', 'Excel']})
+
+        profile = LearnerProfile.objects.get(user=self.user)
+        self.assertEqual(profile.pk, first.pk)
+        self.assertEqual(profile.location, 'Surat')
+        self.assertGreaterEqual(profile.updated_at, first.updated_at)
+        self.assertEqual(
+            sorted(profile.canonical_skills.values_list('normalized', flat=True)), ['excel', 'python']
+        )
+
+    def test_view_keeps_one_profile_per_user(self):
+        session = self.client.session
+        session.update({'user_id': self.user.id, 'user_role': 'learner'})
+        session.save()
+        for location in ('Pune', 'Surat'):
+            response = self.client.post(
+                reverse('save_profile'),
+                json.dumps({'firstName': 'Asha', 'location': location, 'skills': ['Python']}),
+                content_type='application/json',
+            )
+            self.assertEqual(response.json()['status'], 'success')
+        self.assertEqual(LearnerProfile.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(profiles.get(self.user.id)['location'], 'Surat')
+
+
+class DuplicateProfileMigrationTests(TransactionTestCase):
+    serialized_rollback = True
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate([('de', target)])
+        return executor.loader.project_state([('de', target)]).apps
+
+    def test_keeps_each_users_newest_profile(self):
+        apps = self.migrate('0006_careerdataset')
+        self.addCleanup(self.migrate, MigrationLoader(connection).graph.leaf_nodes('de')[0][1])
+        User = apps.get_model('de', 'User')
+        LearnerProfile = apps.get_model('de', 'LearnerProfile')
+        asha = User.objects.create(name='Asha', email='asha@example.com', password='x')
+        ravi = User.objects.create(name='Ravi', email='ravi@example.com', password='x')
+        LearnerProfile.objects.create(user=asha, location='Pune')
+        newest = LearnerProfile.objects.create(user=asha, location='Surat')
+        only = LearnerProfile.objects.create(user=ravi, location='Delhi')
+
+        apps = self.migrate('0007_learnerprofile_one_per_user')
+        LearnerProfile = apps.get_model('de', 'LearnerProfile')
+        self.assertEqual(
+            sorted(LearnerProfile.objects.values_list('id', 'location')),
+            [(newest.id, 'Surat'), (only.id, 'Delhi')],
+        )
+
+
+class SkillSuggestTests(SimpleTestCase):
+    SKILLS = [
+        ('Python', 40, {'hi': 'पायथन'}, []),
+        ('PHP', 12, {}, []),
+        ('Photography', 12, {}, []),
+        ('Machine Learning', 30, {}, ['ml']),
+        ('Public Speaking', 5, {}, []),
+        ('Data Analysis', 25, {}, []),
+    ]
+
+    def names(self, index, query, **kwargs):
+        return [s['name'] for s in index.suggest(query, **kwargs)]
+
+    def test_most_popular_first_then_by_name(self):
+        index = skills.SkillIndex(self.SKILLS)
+        self.assertEqual(self.names(index, 'p'), ['Python', 'PHP', 'Photography', 'Public Speaking'])
+        self.assertEqual(self.names(index, 'PH'), ['PHP', 'Photography'])
+        self.assertEqual(self.names(index, 'pho'), ['Photography'])
+        self.assertEqual(self.names(index, 'px'), [])
+        self.assertEqual(self.names(index, '   '), [])
+
+    def test_words_labels_and_aliases(self):
+        index = skills.SkillIndex(self.SKILLS)
+        self.assertEqual(self.names(index, 'learn'), ['Machine Learning'])
+        self.assertEqual(self.names(index, 'ML'), ['Machine Learning'])
+        self.assertEqual(self.names(index, 'पाय'), ['Python'])
+        self.assertEqual(index.suggest('pyt', lang='hi')[0]['label'], 'पायथन')
+        self.assertEqual(index.suggest('pyt', lang='ta')[0]['label'], 'Python')
+
+    def test_limits_match_a_full_scan(self):
+        many = [(f'Skill {n:03}', n % 17, {}, []) for n in range(200)]
+        index = skills.SkillIndex(many, limit=5)
+        for query in ('s', 'skill 0', 'skill 1', 'skill 19', '19'):
+            matches = sorted(
+                (skill for skill in many
+                 if any(word.startswith(query) for word in (skill[0].lower(), skill[0].lower().split()[1]))),
+                key=lambda skill: (-skill[1], skill[0]),
+            )
+            self.assertEqual(self.names(index, query), [name for name, *_ in matches[:5]], query)
+            self.assertEqual(self.names(index, query, limit=2), [name for name, *_ in matches[:2]], query)
+
+
+class SkillSuggestViewTests(TestCase):
+    def setUp(self):
+        skills.suggestions.clear()
+        self.addCleanup(skills.suggestions.clear)
+
+    def test_ranks_by_learner_and_career_use(self):
+        for n, names in enumerate([['Kotlin', 'Kubernetes'], ['kotlin']]):
+            user = User.objects.create(name=f'u{n}', email=f'u{n}@example.com', password='x')
+            skills.link(LearnerProfile.objects.create(user=user).id, names)
+        response = self.client.get(reverse('skill_suggest'), {'q': 'k', 'limit': 50})
+        names = [s['name'] for s in response.json()['suggestions']]
+        self.assertEqual(names[:2], ['Kotlin', 'Kubernetes'])
+        self.assertLessEqual(len(names), skills.MAX_SUGGESTIONS)
+        self.assertEqual(self.client.get(reverse('skill_suggest'), {'limit': 'x'}).status_code, 400)
+
+
+class BenchChatbotTests(SimpleTestCase):
+    def test_runs_through_the_request_path(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with open(os.path.join(directory, chatbot.DATASET_FILES['en']), 'w', encoding='utf-8') as f:
+            for question, answer in [
+                ("What is C#?", "C# is a .NET language."),
+                ("How do I become a welder?", "Take an ITI welding course."),
+                ("Which jobs use SQL?", "Data analysts and developers."),
+            ]:
+                f.write(json.dumps({'user': question, 'assistant': answer}) + '\n')
+
+        out = io.StringIO()
+        with mock.patch.object(chatbot, 'DATA_DIR', directory):
+            call_command(
+                'bench_chatbot', 'en', '--queries', '6', '--baseline-queries', '3',
+                '--matchers', 'difflib', 'bm25', '--index', stdout=out,
+            )
+        output = out.getvalue()
+        self.assertIn('[en] 3 rows', output)
+        self.assertEqual(output.count('corpus from index'), 2)
+        self.assertEqual(output.count('cache hit:'), 2)
+        self.assertIn('agreement with the full difflib scan', output)
+
+
+class ChatbotMatcherTests(TestCase):
+    def corpus(self):
+        return chatbot.Corpus(
+            None,
+            ("how do i become a welder?", "which jobs use sql?", "what is c#?"),
+            ("Take an ITI welding course.", "Data analysts.", "A .NET language."),
+        )
+
+    def test_batches_are_scored_with_bm25(self):
+        results = self.corpus().search(["welder course", "jobs with sql"], k=2, matcher="difflib")
+        self.assertEqual([rows[0][0] for rows in results], [0, 1])
+        self.assertTrue(all(method == "bm25" for rows in results for _, _, method in rows))
+
+    def test_single_message_uses_the_configured_matcher(self):
+        rows, = self.corpus().search(["how do i become a weldr"], k=1, matcher="difflib")
+        self.assertEqual(rows[0][0], 0)
+        self.assertEqual(rows[0][2], "difflib")
+
+    @override_settings(CHATBOT_BACKEND='database', CHATBOT_MATCHERS={'default': 'bm25'})
+    def test_database_backend_rejects_bm25(self):
+        with self.assertRaises(ImproperlyConfigured):
+            chatbot.quick_answer("what is c#?", "en")
+        self.assertEqual([error.id for error in chatbot.check_matchers()], ['de.E001'])
+
+
+class Bm25WarmupTests(SimpleTestCase):
+    def test_index_is_built_once_under_concurrency(self):
+        corpus = chatbot.Corpus(None, ("what is c#?", "which jobs use sql?"), ("C#.", "SQL."))
+        built = []
+        real = bm25.BM25Index
+
+        def build(*args):
+            built.append(args)
+            time.sleep(0.05)
+            return real(*args)
+
+        with mock.patch.object(bm25, 'BM25Index', side_effect=build):
+            threads = [threading.Thread(target=lambda: corpus.bm25) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(built), 1)
+
+    @override_settings(CHATBOT_MATCHERS={'default': 'difflib', 'hi': 'bm25'})
+    def test_store_builds_bm25_with_the_corpus(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for lang in ('en', 'hi'):
+            with open(os.path.join(directory, chatbot.DATASET_FILES[lang]), 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'user': 'what is c#?', 'assistant': 'C#.'}) + '\n')
+        store = chatbot.CorpusStore()
+        with mock.patch.object(chatbot, 'DATA_DIR', directory):
+            store.preload(['en', 'hi'])
+            self.assertIsNone(store.get('en')._bm25)
+            self.assertIsNotNone(store.get('hi')._bm25)
@@ -8,11 +8,19 @@ urlpatterns = [
     path('learner-dashboard/', views.learner_dashboard, name='learner_dashboard'),
     path('learner-dashboard/profile-builder/', views.profile_builder, name='profile_builder'),
     path('recommendation-viewer/', views.recommendation_viewer, name='recommendation_viewer'),
+    path('api/recommendations/', views.recommendations_api, name='recommendations_api'),
     path('career-explorer/', views.career_explorer, name='career_explorer'),
+    path('api/careers/', views.careers_api, name='careers_api'),
     path('admin-dashboard/', views.admin_dashboard, name='admin_dashboard'),
+    path('api/admin/skills/', views.skill_stats, name='skill_stats'),
+    path('api/skills/suggest/', views.skill_suggest, name='skill_suggest'),
     path("chatbot-response/", views.chatbot_response, name="chatbot_response"),
+    path("chatbot-stream/", views.chatbot_stream, name="chatbot_stream"),
+    path("api/chatbot/search/", views.chatbot_search, name="chatbot_search"),
+    path("api/chatbot-stats/", views.chatbot_stats, name="chatbot_stats"),
     path("api/save-profile/", views.save_profile, name="save_profile"),
     path("api/load_profile/", views.load_profile, name="load_profile"),
     path('api/set-language/', views.set_language, name='set_language'),
     path('change-language/', views.change_language, name='change_language'),
+    path('api/i18n/<str:lang>/<str:version>/', views.i18n_bundle, name='i18n_bundle'),
 ]
@@ -1,142 +1,15 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
 from django.contrib.auth.hashers import check_password
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from django.utils.http import parse_etags
+from django.conf import settings
 from .models import User, LearnerProfile
 from .forms import SignupForm, LoginForm
-import os, json, difflib
-language_data = {
-    'en': {
-        "pageTitle": "Career Navigator - Login & Signup",
-        "navBrand": "Dream Engine",
-        "loginTitle": "Welcome Back",
-        "signupTitle": "Create Account",
-        "loginSubtitle": "Sign in to your account to continue",
-        "signupSubtitle": "Join us and start your career journey",
-        "email": "Email Address",
-        "password": "Password",
-        "confirmPassword": "Confirm Password",
-        "fullName": "Full Name",
-        "role": "Select Role",
-        "learner": "Learner",
-        "admin": "Admin",
-        "loginBtn": "Login",
-        "signupBtn": "Sign Up",
-        "switchToSignup": "Don't have an account? Sign up",
-        "switchToLogin": "Already have an account? Login",
-        "forgotPassword": "Forgot Password?",
-        "rememberMe": "Remember Me",
-        "loading": "Loading...",
-        "successTitle": "Success!",
-        "successMessage": "Redirecting...",
-        "passwordMismatch": "Passwords do not match",
-        "errorOccurred": "An error occurred"
-    },
-    'hi': {
-        "pageTitle": "करियर नेविगेटर - लॉगिन और साइनअप",
-        "navBrand": "ड्रीम इंजन",
-        "loginTitle": "वापस स्वागत है",
-        "signupTitle": "खाता बनाएं",
-        "loginSubtitle": "जारी रखने के लिए अपने खाते में साइन इन करें",
-        "signupSubtitle": "हमसे जुड़ें और अपनी करियर यात्रा शुरू करें",
-        "email": "ईमेल पता",
-        "password": "पासवर्ड",
-        "confirmPassword": "पासवर्ड की पुष्टि करें",
-        "fullName": "पूरा नाम",
-        "role": "भूमिका चुनें",
-        "learner": "सीखने वाला",
-        "admin": "प्रशासक",
-        "loginBtn": "लॉगिन",
-        "signupBtn": "साइन अप",
-        "switchToSignup": "खाता नहीं है? साइन अप करें",
-        "switchToLogin": "पहले से खाता है? लॉगिन करें",
-        "forgotPassword": "पासवर्ड भूल गए?",
-        "rememberMe": "मुझे याद रखें",
-        "loading": "लोड हो रहा है...",
-        "successTitle": "सफलता!",
-        "successMessage": "पुनर्निर्देशित हो रहा है...",
-        "passwordMismatch": "पासवर्ड मेल नहीं खाते",
-        "errorOccurred": "एक त्रुटि हुई"
-    },
-    'ta': {
-        "pageTitle": "தொழில் வழிகாட்டி - உள்நுழைவு மற்றும் பதிவு",
-        "navBrand": "கனவு இயந்திரம்",
-        "loginTitle": "மீண்டும் வரவேற்கிறோம்",
-        "signupTitle": "கணக்கை உருவாக்கவும்",
-        "loginSubtitle": "தொடர்ந்து உங்கள் கணக்கில் உள்நுழையவும்",
-        "signupSubtitle": "எங்களுடன் சேர்ந்து உங்கள் தொழில் பயணத்தைத் தொடங்கவும்",
-        "email": "மின்னஞ்சல் முகவரி",
-        "password": "கடவுச்சொல்",
-        "confirmPassword": "கடவுச்சொல்லை உறுதிப்படுத்தவும்",
-        "fullName": "முழு பெயர்",
-        "role": "பாத்திரத்தைத் தேர்ந்தெடுக்கவும்",
-        "learner": "கற்றவர்",
-        "admin": "நிர்வாகி",
-        "loginBtn": "உள்நுழைவு",
-        "signupBtn": "பதிவு செய்க",
-        "switchToSignup": "கணக்கு இல்லையா? பதிவு செய்க",
-        "switchToLogin": "ஏற்கனவே கணக்கு உள்ளதா? உள்நுழையவும்",
-        "forgotPassword": "கடவுச்சொல் மறந்துவிட்டதா?",
-        "rememberMe": "என்னை நினைவில் வைத்திருங்கள்",
-        "loading": "ஏற்றுகிறது...",
-        "successTitle": "வெற்றி!",
-        "successMessage": "திருப்பி அனுப்புகிறது...",
-        "passwordMismatch": "கடவுச்சொற்கள் பொருந்தவில்லை",
-        "errorOccurred": "பிழை ஏற்பட்டது"
-    },
-    'bn': {
-        "pageTitle": "ক্যারিয়ার নেভিগেটর - লগইন এবং সাইন আপ",
-        "navBrand": "স্বপ্ন ইঞ্জিন",
-        "loginTitle": "ফিরে স্বাগতম",
-        "signupTitle": "অ্যাকাউন্ট তৈরি করুন",
-        "loginSubtitle": "চালিয়ে যেতে আপনার অ্যাকাউন্টে সাইন ইন করুন",
-        "signupSubtitle": "আমাদের সাথে যোগ দিন এবং আপনার ক্যারিয়ার যাত্রা শুরু করুন",
-        "email": "ইমেইল ঠিকানা",
-        "password": "পাসওয়ার্ড",
-        "confirmPassword": "পাসওয়ার্ড নিশ্চিত করুন",
-        "fullName": "পুরো নাম",
-        "role": "ভূমিকা নির্বাচন করুন",
-        "learner": "শিক্ষার্থী",
-        "admin": "অ্যাডমিন",
-        "loginBtn": "লগইন",
-        "signupBtn": "সাইন আপ",
-        "switchToSignup": "অ্যাকাউন্ট নেই? সাইন আপ করুন",
-        "switchToLogin": "ইতিমধ্যে অ্যাকাউন্ট আছে? লগইন করুন",
-        "forgotPassword": "পাসওয়ার্ড ভুলে গেছেন?",
-        "rememberMe": "আমাকে মনে রাখুন",
-        "loading": "লোড হচ্ছে...",
-        "successTitle": "সফল!",
-        "successMessage": "পুনঃনির্দেশিত হচ্ছে...",
-        "passwordMismatch": "পাসওয়ার্ড মিলছে না",
-        "errorOccurred": "একটি ত্রুটি ঘটেছে"
-    },
-    'gu': {
-        "pageTitle": "કારિયર નેવિગેટર - લોગિન અને સાઇનઅપ",
-        "navBrand": "ડ્રીમ એન્જિન",
-        "loginTitle": "પાછા સ્વાગત છે",
-        "signupTitle": "એકાઉન્ટ બનાવો",
-        "loginSubtitle": "ચાલુ રાખવા માટે તમારા એકાઉન્ટમાં સાઇન ઇન કરો",
-        "signupSubtitle": "અમારી સાથે જોડાઓ અને તમારી કારિયર યાત્રા શરૂ કરો",
-        "email": "ઇમેઇલ સરનામું",
-        "password": "પાસવર્ડ",
-        "confirmPassword": "પાસવર્ડની પુષ્ટિ કરો",
-        "fullName": "પૂરું નામ",
-        "role": "ભૂમિકા પસંદ કરો",
-        "learner": "શીખનાર",
-        "admin": "એડમિન",
-        "loginBtn": "લોગિન",
-        "signupBtn": "સાઇન અપ",
-        "switchToSignup": "એકાઉન્ટ નથી? સાઇન અપ કરો",
-        "switchToLogin": "પહેલેથી એકાઉન્ટ છે? લોગિન કરો",
-        "forgotPassword": "પાસવર્ડ ભૂલી ગયા?",
-        "rememberMe": "મને યાદ રાખો",
-        "loading": "લોડ થઈ રહ્યું છે...",
-        "successTitle": "સફળતા!",
-        "successMessage": "રીડાયરેક્ટ થઈ રહ્યું છે...",
-        "passwordMismatch": "પાસવર્ડ મેળ ખાતા નથી",
-        "errorOccurred": "એક ભૂલ આવી"
-    }
-}
+from . import careers, chatbot, i18n, profiles, recommendations
+from .skills import MAX_SUGGESTIONS, learners_with, popularity, suggest
+import json
 
 
 def login_user(request, user):
@@ -164,7 +37,7 @@ def auth(request):
                 login_user(request, user)
                 return JsonResponse({
                     'status': 'success',
-                    'message': language_data.get(user_language, language_data['en']).get('successMessage', 'Signup successful'),
+                    'message': i18n.strings('auth', user_language).get('successMessage', 'Signup successful'),
                     'role': user.role
                 })
             
@@ -172,7 +45,7 @@ def auth(request):
             errors = form.errors.as_json()
             return JsonResponse({
                 'status': 'error',
-                'message': language_data.get(user_language, language_data['en']).get('errorOccurred', 'An error occurred'),
+                'message': i18n.strings('auth', user_language).get('errorOccurred', 'An error occurred'),
                 'errors': errors
             }, status=400)
 
@@ -185,25 +58,25 @@ def auth(request):
                         login_user(request, user)
                         return JsonResponse({
                             'status': 'success',
-                            'message': language_data.get(user_language, language_data['en']).get('successMessage', 'Login successful'),
+                            'message': i18n.strings('auth', user_language).get('successMessage', 'Login successful'),
                             'role': user.role
                         })
                     
                     # Invalid password
                     return JsonResponse({
                         'status': 'error',
-                        'message': 'Invalid password'  # You can add this to language_data for translation
+                        'message': 'Invalid password'  # You can add this to i18n.AUTH_STRINGS for translation
                     }, status=400)
                     
                 except User.DoesNotExist:
                     return JsonResponse({
                         'status': 'error',
-                        'message': 'User not found'  # You can add this to language_data for translation
+                        'message': 'User not found'  # You can add this to i18n.AUTH_STRINGS for translation
                     }, status=404)
                     
             return JsonResponse({
                 'status': 'error',
-                'message': language_data.get(user_language, language_data['en']).get('errorOccurred', 'An error occurred'),
+                'message': i18n.strings('auth', user_language).get('errorOccurred', 'An error occurred'),
                 'errors': form.errors.as_json()
             }, status=400)
 
@@ -216,7 +89,7 @@ def auth(request):
     return render(request, "de/auth.html", {
         'signup_form': SignupForm(),
         'login_form': LoginForm(),
-        'language_data': language_data,
+        'i18n': i18n.bundle('auth', request.session.get('language', 'en')),
     })
 
 def home(request):
@@ -228,206 +101,26 @@ def learner_dashboard(request):
 
     user_name = request.session.get('user_name', '')
     selected_language = request.session.get('language', 'en')
-    translations = {
-        'en': {
-            'pageTitle': 'Career Navigator - Learner Dashboard',
-            'pageDescription': 'Your personalized learning dashboard for career development',
-            'navBrand': 'CareerNav',
-            'selectLanguage': 'Select language',
-            'welcome': 'Welcome back',
-            'welcomeSubtitle': 'Ready to continue your learning journey?',
-            'profileCard': 'Profile Card',
-            'learningProgress': 'Learning Progress',
-            'quickActions': 'Quick Actions',
-            'motivationalQuote': 'Motivational Quote',
-            'currentLevel': 'Current Level',
-            'skillsLearned': 'Skills Learned',
-            'coursesCompleted': 'Courses Completed',
-            'hoursSpent': 'Hours Spent',
-            'achievements': 'Achievements',
-            'profileBuilder': 'Profile Builder',
-            'buildProfile': 'Build Your Profile',
-            'careerExplorer': 'Career Explorer',
-            'exploreCareers': 'Explore Careers',
-            'recommendationViewer': 'Recommendation Viewer',
-            'viewRecommendations': 'View Recommendations',
-            'logout': 'Logout',
-            'settings': 'Settings',
-            'notifications': 'Notifications',
-            'nextMilestone': 'Next Milestone',
-            'quote1': 'Success is not final, failure is not fatal: it is the courage to continue that counts.',
-            'quote2': 'The future belongs to those who believe in the beauty of their dreams.',
-            'quote3': 'Education is the most powerful weapon which you can use to change the world.',
-            'quote4': 'The only way to do great work is to love what you do.',
-            'quote5': 'Innovation distinguishes between a leader and a follower.',
-            'aiAssistant': 'AI Career Assistant',
-            'typePlaceholder': 'Type your message here...',
-            'aiWelcome': "Hello! I'm your AI Career Assistant. How can I help you today?",
-        },
-        'hi': {
-            'pageTitle': 'करियर नेविगेटर - लर्नर डैशबोर्ड',
-            'pageDescription': 'करियर विकास के लिए आपका व्यक्तिगत शिक्षण डैशबोर्ड',
-            'navBrand': 'करियरनव',
-            'selectLanguage': 'भाषा चुनें',
-            'welcome': 'वापस स्वागत है',
-            'welcomeSubtitle': 'अपनी सीखने की यात्रा जारी रखने के लिए तैयार हैं?',
-            'profileCard': 'प्रोफाइल कार्ड',
-            'learningProgress': 'सीखने की प्रगति',
-            'quickActions': 'त्वरित कार्य',
-            'motivationalQuote': 'प्रेरणादायक उद्धरण',
-            'currentLevel': 'वर्तमान स्तर',
-            'skillsLearned': 'सीखे गए कौशल',
-            'coursesCompleted': 'पूर्ण किए गए पाठ्यक्रम',
-            'hoursSpent': 'बिताए गए घंटे',
-            'achievements': 'उपलब्धियां',
-            'profileBuilder': 'प्रोफाइल बिल्डर',
-            'buildProfile': 'अपना प्रोफाइल बनाएं',
-            'careerExplorer': 'करियर एक्सप्लोरर',
-            'exploreCareers': 'करियर का अन्वेषण करें',
-            'recommendationViewer': 'सिफारिश व्यूअर',
-            'viewRecommendations': 'सिफारिशें देखें',
-            'logout': 'लॉगआउट',
-            'settings': 'सेटिंग्स',
-            'notifications': 'सूचनाएं',
-            'nextMilestone': 'अगला माइलस्टोन',
-            'quote1': 'सफलता अंतिम नहीं है, असफलता घातक नहीं है: जारी रखने का साहस ही मायने रखता है।',
-            'quote2': 'भविष्य उनका है जो अपने सपनों की सुंदरता में विश्वास करते हैं।',
-            'quote3': 'शिक्षा सबसे शक्तिशाली हथियार है जिसका उपयोग आप दुनिया को बदलने के लिए कर सकते हैं।',
-            'quote4': 'महान काम करने का एकमात्र तरीका यह है कि आप जो करते हैं उससे प्यार करें।',
-            'quote5': 'नवाचार एक नेता और अनुयायी के बीच अंतर करता है।',
-            'aiAssistant': 'एआई करियर सहायक',
-            'typePlaceholder': 'अपना संदेश यहां लिखें...',
-            'aiWelcome': 'नमस्ते! मैं आपका एआई करियर सहायक हूं। आज मैं आपकी कैसे मदद कर सकता हूं?',
-        },
-        'ta': {
-            'pageTitle': 'தொழில் வழிகாட்டி - கற்றவர் டாஷ்போர்டு',
-            'pageDescription': 'தொழில் வளர்ச்சிக்கான உங்கள் தனிப்பட்ட கற்றல் டாஷ்போர்டு',
-            'navBrand': 'தொழில்வழி',
-            'selectLanguage': 'மொழியைத் தேர்ந்தெடுக்கவும்',
-            'welcome': 'மீண்டும் வரவேற்கிறோம்',
-            'welcomeSubtitle': 'உங்கள் கற்றல் பயணத்தைத் தொடர தயாரா?',
-            'profileCard': 'சுயவிவர அட்டை',
-            'learningProgress': 'கற்றல் முன்னேற்றம்',
-            'quickActions': 'விரைவு செயல்கள்',
-            'motivationalQuote': 'உத்வேகமளிக்கும் மேற்கோள்',
-            'currentLevel': 'தற்போதைய நிலை',
-            'skillsLearned': 'கற்ற திறன்கள்',
-            'coursesCompleted': 'முடிக்கப்பட்ட படிப்புகள்',
-            'hoursSpent': 'செலவழித்த மணிநேரங்கள்',
-            'achievements': 'சாதனைகள்',
-            'profileBuilder': 'சுயவிவர கட்டுநர்',
-            'buildProfile': 'உங்கள் சுயவிவரத்தை உருவாக்குங்கள்',
-            'careerExplorer': 'தொழில் ஆராய்ச்சியாளர்',
-            'exploreCareers': 'தொழில்களை ஆராயுங்கள்',
-            'recommendationViewer': 'பரிந்துரை காட்சியாளர்',
-            'viewRecommendations': 'பரிந்துரைகளைப் பாருங்கள்',
-            'logout': 'வெளியேறு',
-            'settings': 'அமைப்புகள்',
-            'notifications': 'அறிவிப்புகள்',
-            'nextMilestone': 'அடுத்த மைல்கல்',
-            'quote1': 'வெற்றி இறுதியானது அல்ல, தோல்வி மரணமானது அல்ல: தொடர்ந்து செல்லும் தைரியம்தான் முக்கியம்.',
-            'quote2': 'எதிர்காலம் தங்கள் கனவுகளின் அழகில் நம்பிக்கை வைத்தவர்களுக்கு சொந்தமானது.',
-            'quote3': 'கல்வி என்பது உலகை மாற்ற நீங்கள் பயன்படுத்தக்கூடிய மிகவும் சக்திவாய்ந்த ஆயுதம்.',
-            'quote4': 'சிறந்த வேலை செய்ய ஒரே வழி, நீங்கள் செய்வதை நேசிப்பதுதான்.',
-            'quote5': 'புதுமை ஒரு தலைவர் மற்றும் பின்பற்றுபவருக்கு இடையே வேறுபாட்டை ஏற்படுத்துகிறது.',
-            'aiAssistant': 'AI தொழில் உதவியாளர்',
-            'typePlaceholder': 'உங்கள் செய்தியை இங்கே தட்டச்சு செய்யவும்...',
-            'aiWelcome': 'வணக்கம்! நான் உங்கள் AI தொழில் உதவியாளர். இன்று நான் உங்களுக்கு எப்படி உதவ முடியும்?',
-        },
-        'bn': {
-            'pageTitle': 'ক্যারিয়ার নেভিগেটর - লার্নার ড্যাশবোর্ড',
-            'pageDescription': 'ক্যারিয়ার উন্নয়নের জন্য আপনার ব্যক্তিগত শিক্ষার ড্যাশবোর্ড',
-            'navBrand': 'ক্যারিয়ারনেভ',
-            'selectLanguage': 'ভাষা নির্বাচন করুন',
-            'welcome': 'ফিরে স্বাগতম',
-            'welcomeSubtitle': 'আপনার শেখার যাত্রা চালিয়ে যেতে প্রস্তুত?',
-            'profileCard': 'প্রোফাইল কার্ড',
-            'learningProgress': 'শেখার অগ্রগতি',
-            'quickActions': 'দ্রুত কর্ম',
-            'motivationalQuote': 'প্রেরণাদায়ক উক্তি',
-            'currentLevel': 'বর্তমান স্তর',
-            'skillsLearned': 'শেখা দক্ষতা',
-            'coursesCompleted': 'সম্পূর্ণ কোর্স',
-            'hoursSpent': 'ব্যয়িত ঘন্টা',
-            'achievements': 'অর্জন',
-            'profileBuilder': 'প্রোফাইল বিল্ডার',
-            'buildProfile': 'আপনার প্রোফাইল তৈরি করুন',
-            'careerExplorer': 'ক্যারিয়ার এক্সপ্লোরার',
-            'exploreCareers': 'ক্যারিয়ার অন্বেষণ করুন',
-            'recommendationViewer': 'সুপারিশ দর্শক',
-            'viewRecommendations': 'সুপারিশ দেখুন',
-            'logout': 'লগআউট',
-            'settings': 'সেটিংস',
-            'notifications': 'বিজ্ঞপ্তি',
-            'nextMilestone': 'পরবর্তী মাইলফলক',
-            'quote1': 'সাফল্য চূড়ান্ত নয়, ব্যর্থতা মারাত্মক নয়: এগিয়ে যাওয়ার সাহসই গুরুত্বপূর্ণ।',
-            'quote2': 'ভবিষ্যত তাদের যারা তাদের স্বপ্নের সৌন্দর্যে বিশ্বাস করে।',
-            'quote3': 'শিক্ষা সবচেয়ে শক্তিশালী অস্ত্র যা আপনি বিশ্বকে পরিবর্তন করতে ব্যবহার করতে পারেন।',
-            'quote4': 'মহান কাজ করার একমাত্র উপায় হল আপনি যা করেন তা ভালবাসা।',
-            'quote5': 'নবাচার একজন নেতা এবং অনুসরণকারীর মধ্যে পার্থক্য করে।',
-            'aiAssistant': 'AI ক্যারিয়ার সহায়ক',
-            'typePlaceholder': 'এখানে আপনার বার্তা টাইপ করুন...',
-            'aiWelcome': 'হ্যালো! আমি আপনার AI ক্যারিয়ার সহায়ক। আজ আমি আপনাকে কীভাবে সাহায্য করতে পারি?',
-        },
-        'gu': {
-            'pageTitle': 'કારિયર નેવિગેટર - લર્નર ડેશબોર્ડ',
-            'pageDescription': 'કારિયર વિકાસ માટે તમારું વ્યક્તિગત શિક્ષણ ડેશબોર્ડ',
-            'navBrand': 'કારિયરનવ',
-            'selectLanguage': 'ભાષા પસંદ કરો',
-            'welcome': 'પાછા સ્વાગત છે',
-            'welcomeSubtitle': 'તમારી શિક્ષણ યાત્રા ચાલુ રાખવા તૈયાર છો?',
-            'profileCard': 'પ્રોફાઇલ કાર્ડ',
-            'learningProgress': 'શીખવાની પ્રગતિ',
-            'quickActions': 'ઝડપી ક્રિયાઓ',
-            'motivationalQuote': 'પ્રેરણાદાયક ઉદ્ધરણ',
-            'currentLevel': 'વર્તમાન સ્તર',
-            'skillsLearned': 'શીખેલ કૌશલ્યો',
-            'coursesCompleted': 'પૂર્ણ કરેલા અભ્યાસક્રમો',
-            'hoursSpent': 'ખર્ચાયેલા કલાકો',
-            'achievements': 'પ્રાપ્તિઓ',
-            'profileBuilder': 'પ્રોફાઇલ બિલ્ડર',
-            'buildProfile': 'તમારું પ્રોફાઇલ બનાવો',
-            'careerExplorer': 'કારિયર એક્સપ્લોરર',
-            'exploreCareers': 'કારિયરનું અન્વેષણ કરો',
-            'recommendationViewer': 'ભલામણ દર્શક',
-            'viewRecommendations': 'ભલામણો જુઓ',
-            'logout': 'લોગઆઉટ',
-            'settings': 'સેટિંગ્સ',
-            'notifications': 'સૂચનાઓ',
-            'nextMilestone': 'આગળનું માઇલસ્ટોન',
-            'quote1': 'સફળતા અંતિમ નથી, નિષ્ફળતા ઘાતક નથી: ચાલુ રાખવાની હિંમત જ મહત્વની છે।',
-            'quote2': 'ભવિષ્ય તેમનું છે જે પોતાના સપનાઓની સુંદરતામાં વિશ્વાસ રાખે છે।',
-            'quote3': 'શિક્ષણ સૌથી શક્તિશાળી શસ્ત્ર છે જેનો ઉપયોગ તમે વિશ્વને બદલવા માટે કરી શકો છો।',
-            'quote4': 'મહાન કામ કરવાનો એકમાત્ર રસ્તો એ છે કે તમે જે કરો છો તેને પ્રેમ કરો।',
-            'quote5': 'નવીનતા એક નેતા અને અનુયાયી વચ્ચે તફાવત કરે છે।',
-            'aiAssistant': 'AI કારકિર્દી સહાયક',
-            'typePlaceholder': 'તમારો સંદેશ અહીં લખો...',
-            'aiWelcome': 'નમસ્તે! હું તમારો AI કારકિર્દી સહાયક છું. આજે હું તમને કેવી રીતે મદદ કરી શકું?',
-        }
-    }
     
-    profile_data = {}
-
-    try:
-        from .models import LearnerProfile
-        profile = LearnerProfile.objects.get(user__id=request.session['user_id'])
+    profile = profiles.get(request.session['user_id']) if 'user_id' in request.session else None
+    if profile is not None:
+        name_parts = profile["name"].split(" ")
         profile_data = {
-            "full_name": profile.user.name,
-            "first_name": profile.user.name.split(" ")[0] if profile.user.name else "",
-            "last_name": profile.user.name.split(" ")[1] if len(profile.user.name.split(" ")) > 1 else "",
-            "email": profile.user.email,
-            "phone": profile.phone or "",
-            "location": profile.location or "",
-            "education": profile.education or "",
-            "skills": profile.skills or [],
-            "experience": profile.experience or "",
-            "courses_completed": getattr(profile, 'courses_completed', 0),
-            "hours_spent": getattr(profile, 'hours_spent', 0),
-            "achievements": getattr(profile, 'achievements', 0),
-            "current_level": getattr(profile, 'current_level', 'Beginner'),
+            "full_name": profile["name"],
+            "first_name": name_parts[0] if profile["name"] else "",
+            "last_name": name_parts[1] if len(name_parts) > 1 else "",
+            "email": profile["email"],
+            "phone": profile["phone"],
+            "location": profile["location"],
+            "education": profile["education"],
+            "skills": profile["skills"],
+            "experience": profile["experience"],
+            "courses_completed": profile.get('courses_completed', 0),
+            "hours_spent": profile.get('hours_spent', 0),
+            "achievements": profile.get('achievements', 0),
+            "current_level": profile.get('current_level', 'Beginner'),
         }
-    except Exception as e:
-        print(f"Profile fetch error: {e}")
+    else:
         profile_data = {
             "full_name": user_name,
             "first_name": user_name.split(" ")[0] if user_name else "L",
@@ -444,15 +137,15 @@ def learner_dashboard(request):
             "current_level": "Beginner",
         }
 
-    # CRITICAL: Ensure all_translations is properly JSON encoded
-    # Using json.dumps with ensure_ascii=False to handle unicode characters
-    all_translations_json = json.dumps(translations, ensure_ascii=False)
-    
+    # Only the active language is embedded; the page fetches the others from
+    # i18n_bundle when the user switches.
+    bundle = i18n.bundle('dashboard', selected_language)
+
     context = {
         'user_name': user_name,
         'profile': profile_data,
-        'translations': translations.get(selected_language, translations['en']),
-        'all_translations': all_translations_json,
+        'translations': bundle.strings,
+        'i18n': bundle,
         'current_language': selected_language,
     }
     
@@ -477,6 +170,7 @@ def change_language(request):
             return JsonResponse({
                 'status': 'success',
                 'language': language,
+                'bundle_url': i18n.bundle_url(language),
                 'message': 'Language updated successfully'
             })
         except Exception as e:
@@ -485,69 +179,265 @@ def change_language(request):
     return JsonResponse({'status': 'error', 'message': 'Method not allowed'}, status=405)
 
 
+
+@require_GET
+def i18n_bundle(request, lang, version):
+    """Serve every page's strings in ``lang``, pre-compressed.
+
+    The URL carries the strings' version, so a response for the current
+    version never changes and is cached for a year. Stale versions redirect
+    to the current URL.
+    """
+    bundle = i18n.language_bundles.get(lang)
+    if bundle is None:
+        return JsonResponse({'status': 'error', 'message': 'Invalid language'}, status=404)
+    if version != i18n.VERSION:
+        response = redirect(i18n.bundle_url(lang))
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+    encoding, body, etag = bundle.negotiate(request.headers.get('Accept-Encoding'))
+    if etag in parse_etags(request.headers.get('If-None-Match', '')):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/json; charset=utf-8')
+        if encoding:
+            response['Content-Encoding'] = encoding
+        response['Content-Language'] = lang
+    response['ETag'] = etag
+    response['Vary'] = 'Accept-Encoding'
+    response['Cache-Control'] = f"public, max-age={getattr(settings, 'I18N_BUNDLE_MAX_AGE', 31536000)}, immutable"
+    return response
+
+
 def career_explorer(request):
     if request.session.get('user_role') != 'learner':
         return redirect('auth')
-    return render(request, 'de/career-explorer.html', {'user_name': request.session.get('user_name')})
+    # The first page ships with the HTML; the script fetches the rest from
+    # careers_api as the learner filters or scrolls.
+    return render(request, 'de/career-explorer.html', {
+        'user_name': request.session.get('user_name'),
+        'i18n': i18n.bundle('career_explorer', request.session.get('language', 'en')),
+        'careers': careers.search(careers.no_filters()),
+    })
+
+
+@require_GET
+def careers_api(request):
+    """One page of the career catalogue, filtered by q, kind, level, sector and skill.
+
+    Pass the returned next_cursor as ``cursor`` for the following page. Facet
+    counts and the total are only included on the first page.
+    """
+    try:
+        filters = careers.parse_filters(request.GET)
+        cursor = int(request.GET.get('cursor') or 0)
+        limit = int(request.GET.get('limit') or careers.DEFAULT_PAGE_SIZE)
+    except ValueError as e:
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=400)
+    limit = max(1, min(limit, careers.MAX_PAGE_SIZE))
+    return JsonResponse({
+        'status': 'success',
+        **careers.search(filters, cursor, limit, with_facets=not cursor),
+    }, json_dumps_params={'ensure_ascii': False})
+
+
+def learner_recommendations(user_id, limit=recommendations.DEFAULT_LIMIT):
+    profile = profiles.get(user_id)
+    return recommendations.recommend(user_id, profile['skills'] if profile else [], limit)
 
 
 def recommendation_viewer(request):
     if request.session.get('user_role') != 'learner':
         return redirect('auth')
-    return render(request, 'de/recommendation-viewer.html', {'user_name': request.session.get('user_name')})
+    return render(request, 'de/recommendation-viewer.html', {
+        'user_name': request.session.get('user_name'),
+        'i18n': i18n.bundle('recommendation_viewer', request.session.get('language', 'en')),
+        'recommendations': learner_recommendations(request.session['user_id']),
+    })
+
+
+@require_GET
+def recommendations_api(request):
+    """The logged-in learner's top careers, scored against their profile skills."""
+    if request.session.get('user_role') != 'learner':
+        return JsonResponse({'status': 'error', 'message': _('Not logged in')}, status=401)
+    try:
+        limit = int(request.GET.get('limit') or recommendations.DEFAULT_LIMIT)
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'limit must be a number'}, status=400)
+    limit = max(1, min(limit, careers.MAX_PAGE_SIZE))
+    return JsonResponse({
+        'status': 'success',
+        'recommendations': learner_recommendations(request.session['user_id'], limit),
+    }, json_dumps_params={'ensure_ascii': False})
 
 
 def admin_dashboard(request):
     if request.session.get('user_role') != 'admin':
         return redirect('auth')
-    return render(request, 'de/admin-panel.html', {'user_name': request.session.get('user_name')})
+    return render(request, 'de/admin-panel.html', {
+        'user_name': request.session.get('user_name'),
+        'top_skills': popularity(5),
+    })
+
+
+@require_GET
+def skill_suggest(request):
+    """Autocomplete for the profile builder: known skills starting with ``q``.
+
+    Each suggestion has the canonical ``name`` to store and a ``label`` in
+    ``lang`` (default: the session language) to show.
+    """
+    try:
+        limit = max(1, min(int(request.GET.get('limit') or MAX_SUGGESTIONS), MAX_SUGGESTIONS))
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'limit must be a number'}, status=400)
+    lang = request.GET.get('lang') or request.session.get('language', 'en')
+    return JsonResponse({
+        'status': 'success',
+        'suggestions': suggest(request.GET.get('q', ''), lang, limit),
+    }, json_dumps_params={'ensure_ascii': False})
+
+
+@require_GET
+def skill_stats(request):
+    """Most common learner skills, or with ``skill`` the learners who list it (admins only)."""
+    if request.session.get('user_role') != 'admin':
+        return JsonResponse({'status': 'error', 'message': 'Not authorized'}, status=403)
+    try:
+        limit = max(1, min(int(request.GET.get('limit') or 10), careers.MAX_PAGE_SIZE))
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'limit must be a number'}, status=400)
+    skill = request.GET.get('skill', '').strip()
+    if not skill:
+        return JsonResponse({'status': 'success', 'skills': popularity(limit)})
+    learners = learners_with(skill)
+    return JsonResponse({
+        'status': 'success',
+        'skill': skill,
+        'total': learners.count(),
+        'learners': list(
+            learners.order_by('pk').values('user_id', 'user__name', 'user__email')[:limit]
+        ),
+    }, json_dumps_params={'ensure_ascii': False})
 
 
 def forgot_password(request):
     return render(request, 'de/forgot_password.html')
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, 'de', 'data')
+async def chatbot_response(request):
+    user_message = request.GET.get("message", "")
+    lang = request.GET.get("lang", "en")
 
-def chatbot_response(request):
-    user_message = request.GET.get("message", "").lower().strip()
+    try:
+        response = await chatbot.pool.answer(user_message, lang)
+        return JsonResponse({"response": response})
+    except chatbot.Busy:
+        return JsonResponse({"error": "The assistant is busy, please try again."}, status=503)
+    except Exception as e:
+        return JsonResponse({"error": str(e)})
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def chatbot_stream(request):
+    """Server-Sent Events variant of chatbot_response.
+
+    The cached or exact-match answer is sent as soon as it is known; otherwise
+    a ``status`` event goes out first and the ranked answer follows once
+    matching finishes. Every stream ends with a ``done`` event.
+
+    The view and its event generator are synchronous: the app is served over
+    WSGI, where Django reads an async iterator to the end before sending any
+    of it, so only a sync generator actually streams. Matching still runs on
+    the bounded chatbot pool.
+    """
+    user_message = request.GET.get("message", "")
     lang = request.GET.get("lang", "en")
 
-    dataset_map = {
-        "en": "english_dataset.jsonl",
-        "hi": "hindi_dataset.jsonl",
-        "gu": "gujarati_dataset.jsonl",
-        "ta": "tamil_dataset.jsonl",
-        "bn": "bengali_dataset.jsonl"
-    }
-    dataset_file = dataset_map.get(lang, "english_dataset.jsonl")
-    file_path = os.path.join(DATA_DIR, dataset_file)
+    def events():
+        try:
+            response = chatbot.pool.call(chatbot.quick_answer, user_message, lang)
+            if response is not None:
+                yield _sse("answer", {"response": response, "stage": "exact"})
+            else:
+                yield _sse("status", {"stage": "matching"})
+                response = chatbot.pool.call(chatbot.ranked_answer, user_message, lang)
+                yield _sse("answer", {"response": response, "stage": "ranked"})
+        except chatbot.Busy:
+            yield _sse("failure", {"error": "The assistant is busy, please try again."})
+        except Exception as e:
+            yield _sse("failure", {"error": str(e)})
+        yield _sse("done", {})
 
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = [json.loads(line.strip()) for line in f if line.strip()]
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx from buffering the stream until it ends.
+    response["X-Accel-Buffering"] = "no"
+    return response
 
-        response = "⚠️ Sorry, I don’t have an answer for that yet."
 
-       
-        for entry in data:
-            if user_message == entry["user"].lower().strip():
-                response = entry["assistant"]
-                break
-        if response.startswith("⚠️"):
-            best_match = max(data, key=lambda e: difflib.SequenceMatcher(None, user_message, e["user"].lower()).ratio(), default=None)
-            if best_match and difflib.SequenceMatcher(None, user_message, best_match["user"].lower()).ratio() > 0.5:
-                response = best_match["assistant"]
+@csrf_exempt
+async def chatbot_search(request):
+    """Top-k chatbot answers with similarity scores.
 
-        return JsonResponse({"response": response})
+    GET ``?message=...&lang=en&k=5`` scores one message. POST a JSON body
+    ``{"messages": [...], "lang": "en", "k": 5}`` to score a batch in one
+    pass over the index; results come back in the same order.
+    """
+    try:
+        if request.method == "POST":
+            data = json.loads(request.body)
+            if not isinstance(data, dict):
+                raise ValueError("body must be a JSON object")
+            messages = data.get("messages")
+            lang = data.get("lang", "en")
+            k = int(data.get("k", 5))
+        else:
+            messages = [request.GET.get("message", "")]
+            lang = request.GET.get("lang", "en")
+            k = int(request.GET.get("k", 5))
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return JsonResponse({'status': 'error', 'message': 'Invalid data format'}, status=400)
+
+    if not isinstance(messages, list) or not all(isinstance(m, str) for m in messages):
+        return JsonResponse({'status': 'error', 'message': 'messages must be a list of strings'}, status=400)
+    if len(messages) > settings.CHATBOT_SEARCH_MAX_BATCH:
+        return JsonResponse({
+            'status': 'error',
+            'message': f'At most {settings.CHATBOT_SEARCH_MAX_BATCH} messages per request'
+        }, status=400)
+    k = min(max(k, 1), 50)
+
+    try:
+        results = await chatbot.pool.run(chatbot.search, messages, lang, k)
+    except chatbot.Busy:
+        return JsonResponse({"error": "The assistant is busy, please try again."}, status=503)
     except Exception as e:
         return JsonResponse({"error": str(e)})
 
+    if request.method == "POST":
+        return JsonResponse({"results": results})
+    return JsonResponse({"results": results[0]})
+
+
+def chatbot_stats(request):
+    """Answer cache and match pool metrics for tuning the chatbot (admins only)."""
+    if request.session.get('user_role') != 'admin':
+        return JsonResponse({'status': 'error', 'message': 'Not authorized'}, status=403)
+    return JsonResponse({
+        'cache': chatbot.answer_cache.stats(),
+        'pool': chatbot.pool.stats(),
+    })
+
 from django.shortcuts import render, redirect
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.translation import gettext as _
-from django.utils.translation import activate, get_language
+from django.db import transaction
 import json
 from .models import User, LearnerProfile
 
@@ -557,12 +447,12 @@ def profile_builder(request):
         return redirect('auth')
     
     # Get user's preferred language from session or default to 'en'
-    user_language = request.session.get('user_language', 'en')
-    activate(user_language)
+    user_language = request.session.get('language', 'en')
     
     context = {
         'user_name': request.session.get('user_name'),
-        'user_language': user_language
+        'user_language': user_language,
+        'i18n': i18n.bundle('profile_builder', user_language),
     }
     return render(request, 'de/profile-builder.html', context)
 
@@ -572,28 +462,19 @@ def save_profile(request):
     """Save or update learner profile with multilingual support"""
     if request.method == "POST":
         if 'user_id' not in request.session:
-            user_language = request.session.get('user_language', 'en')
-            activate(user_language)
             return JsonResponse({
                 'status': 'error',
                 'message': _('Not logged in')
             }, status=401)
         
         try:
-            user = User.objects.get(id=request.session['user_id'])
+            user = User.objects.only('name').get(id=request.session['user_id'])
             data = json.loads(request.body)
             
             # Get language preference if provided
-            user_language = data.get('language', request.session.get('user_language', 'en'))
-            request.session['user_language'] = user_language
-            activate(user_language)
-            
-            # Update user's name from firstName and lastName
-            first_name = data.get("firstName", "").strip()
-            last_name = data.get("lastName", "").strip()
-            if first_name or last_name:
-                user.name = f"{first_name} {last_name}".strip()
-                user.save()
+            user_language = data.get('language', request.session.get('language', 'en'))
+            request.session['language'] = user_language
+            i18n.activate(user_language)
             
             # Ensure skills is always a list
             skills = data.get("skills", [])
@@ -603,18 +484,29 @@ def save_profile(request):
                 except json.JSONDecodeError:
                     skills = [s.strip() for s in skills.split(',') if s.strip()]
             
-            # Create or update profile
-            LearnerProfile.objects.update_or_create(
-                user=user,
-                defaults={
+            with transaction.atomic():
+                # Update user's name from firstName and lastName, if it changed
+                first_name = data.get("firstName", "").strip()
+                last_name = data.get("lastName", "").strip()
+                name = f"{first_name} {last_name}".strip()
+                if name and name != user.name:
+                    user.name = name
+                    user.save(update_fields=['name'])
+                
+                # Create or update profile
+                profiles.save(user, {
                     "phone": data.get("phone", ""),
                     "location": data.get("location", ""),
                     "education": data.get("education", ""),
                     "skills": skills,
                     "experience": data.get("experience", ""),
                     "preferences": data.get("preferences", ""),
-                }
-            )
+                })
+                # Rescore once the save commits; a no-op if the skills did not change.
+                transaction.on_commit(
+                    lambda: recommendations.refresh(user.id, profiles.normalize_skills(skills)),
+                    robust=True,
+                )
             
             return JsonResponse({
                 "status": "success",
@@ -622,19 +514,16 @@ def save_profile(request):
             })
             
         except User.DoesNotExist:
-            activate(request.session.get('user_language', 'en'))
             return JsonResponse({
                 'status': 'error',
                 'message': _('User not found')
             }, status=404)
         except json.JSONDecodeError:
-            activate(request.session.get('user_language', 'en'))
             return JsonResponse({
                 'status': 'error',
                 'message': _('Invalid data format')
             }, status=400)
         except Exception as e:
-            activate(request.session.get('user_language', 'en'))
             return JsonResponse({
                 'status': 'error',
                 'message': _('An error occurred while saving profile')
@@ -649,54 +538,40 @@ def save_profile(request):
 def load_profile(request):
     """Load learner profile with multilingual support"""
     if 'user_id' not in request.session:
-        user_language = request.session.get('user_language', 'en')
-        activate(user_language)
         return JsonResponse({
             'status': 'error',
             'message': _('Not logged in')
         }, status=401)
     
-    # Activate user's preferred language
-    user_language = request.session.get('user_language', 'en')
-    activate(user_language)
+    user_language = request.session.get('language', 'en')
     
     try:
-        profile = LearnerProfile.objects.get(user__id=request.session['user_id'])
-        user_name = profile.user.name or ""
-        name_parts = user_name.split(" ", 1)
+        profile = profiles.get(request.session['user_id'])
+        if profile is None:
+            return JsonResponse({
+                "status": "empty",
+                "message": _("Profile not created yet"),
+                "language": user_language
+            })
+        
+        name_parts = profile["name"].split(" ", 1)
         first_name = name_parts[0] if len(name_parts) > 0 else ""
         last_name = name_parts[1] if len(name_parts) > 1 else ""
         
-        # Ensure skills is a list
-        skills = profile.skills
-        if isinstance(skills, str):
-            try:
-                skills = json.loads(skills)
-            except json.JSONDecodeError:
-                skills = [s.strip() for s in skills.split(',') if s.strip()]
-        elif not isinstance(skills, list):
-            skills = []
-        
         return JsonResponse({
             "status": "success",
             "firstName": first_name,
             "lastName": last_name,
-            "email": profile.user.email,
-            "phone": profile.phone or "",
-            "location": profile.location or "",
-            "education": profile.education or "",
-            "skills": skills,
-            "experience": profile.experience or "",
-            "preferences": profile.preferences or "",
+            "email": profile["email"],
+            "phone": profile["phone"],
+            "location": profile["location"],
+            "education": profile["education"],
+            "skills": profile["skills"],
+            "experience": profile["experience"],
+            "preferences": profile["preferences"],
             "language": user_language
         })
         
-    except LearnerProfile.DoesNotExist:
-        return JsonResponse({
-            "status": "empty",
-            "message": _("Profile not created yet"),
-            "language": user_language
-        })
     except Exception as e:
         return JsonResponse({
             'status': 'error',
@@ -716,8 +591,8 @@ def set_language(request):
             if language not in supported_languages:
                 language = 'en'
         
-            request.session['user_language'] = language
-            activate(language)
+            request.session['language'] = language
+            i18n.activate(language)
             if 'user_id' in request.session:
                 try:
                     user = User.objects.get(id=request.session['user_id'])
@@ -727,7 +602,8 @@ def set_language(request):
             return JsonResponse({
                 'status': 'success',
                 'message': _('Language updated successfully'),
-                'language': language
+                'language': language,
+                'bundle_url': i18n.bundle_url(language),
             })
             
         except json.JSONDecodeError:
@@ -300,11 +300,15 @@ class AdminPanel {
 
         const ctx = canvas.getContext('2d');
         
-        // Sample data for skill demand
+        // Most common learner skills, embedded by the server
+        const element = document.getElementById('top-skills-data');
+        const topSkills = element ? JSON.parse(element.textContent) : [];
+        // The pie chart takes percentages; show each skill's share of the top ones
+        const total = topSkills.reduce((sum, skill) => sum + skill.learners, 0);
         const data = {
-            labels: ['JavaScript', 'Python', 'React', 'Node.js', 'Data Science'],
+            labels: topSkills.map(skill => skill.name),
             datasets: [{
-                data: [35, 28, 22, 18, 15],
+                data: topSkills.map(skill => 100 * skill.learners / total),
                 backgroundColor: [
                     '#00d4ff',
                     '#00ff88',
@@ -1,9 +1,11 @@
 class CareerNavigatorAuth {
     constructor() {
         // Use in-memory storage instead of localStorage (not supported in artifacts)
-        this.currentLanguage = 'en';
-        this.allLanguageData = JSON.parse(document.getElementById('language-data').textContent);
-        this.currentLanguageData = this.allLanguageData[this.currentLanguage];
+        // Only the active language is embedded in the page; the others are
+        // fetched (and cached) by I18nStrings the first time they are picked.
+        this.i18n = new I18nStrings();
+        this.currentLanguage = this.i18n.language;
+        this.currentLanguageData = this.i18n.current();
         this.isFlipped = false;
         this.dropdownOpen = false;
     }
@@ -63,19 +65,23 @@ class CareerNavigatorAuth {
         // Set button type explicitly
         option.type = "button";
         
-        option.addEventListener("mousedown", (e) => {
+        option.addEventListener("mousedown", async (e) => {
             e.preventDefault();
             e.stopPropagation();
 
-            this.currentLanguage = option.dataset.lang;
-            this.currentLanguageData = this.allLanguageData[this.currentLanguage];
-            currentLang.textContent = option.textContent;
-
             // Close dropdown
             this.dropdownOpen = false;
             languageDropdown.classList.remove("show");
             languageBtn.setAttribute("aria-expanded", "false");
 
+            const data = await this.i18n.load(option.dataset.lang);
+            if (!data) {
+                return;
+            }
+            this.currentLanguage = option.dataset.lang;
+            this.currentLanguageData = data;
+            currentLang.textContent = option.textContent;
+
             // Update all text content
             this.updateTextContent();
 
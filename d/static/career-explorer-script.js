@@ -1,6 +1,7 @@
 // Career Explorer - Interactive JavaScript
 class CareerExplorer {
     constructor() {
+        this.i18n = new I18nStrings();
         this.currentLanguage = 'en';
         this.currentLanguageData = null;
         this.allItems = [];
@@ -10,6 +11,12 @@ class CareerExplorer {
             levels: [],
             sectors: []
         };
+        this.searchQuery = '';
+        this.nextCursor = null;
+        this.total = 0;
+        this.facets = {};
+        // Incremented per request so a slow response cannot overwrite a newer one
+        this.requestId = 0;
         
         this.init();
     }
@@ -22,8 +29,8 @@ class CareerExplorer {
         this.setupAccessibility();
         this.setupHeaderActions();
         this.loadLanguageData();
-        this.generateSampleData();
-        this.displayItems();
+        this.setupLoadMore();
+        this.loadInitialPage();
     }
 
     // Language Management
@@ -40,13 +47,15 @@ class CareerExplorer {
 
         // Handle language selection
         langOptions.forEach(option => {
-            option.addEventListener('click', (e) => {
+            option.addEventListener('click', async (e) => {
                 e.preventDefault();
                 const selectedLang = option.dataset.lang;
-                const textData = JSON.parse(option.dataset.text);
-                
-                this.changeLanguage(selectedLang, textData);
                 this.closeDropdown(languageDropdown, languageBtn);
+                
+                const textData = await this.i18n.load(selectedLang);
+                if (textData) {
+                    this.changeLanguage(selectedLang, textData);
+                }
             });
         });
 
@@ -141,7 +150,8 @@ class CareerExplorer {
             resultsTitle: document.getElementById('resultsTitle'),
             loadingText: document.getElementById('loadingText'),
             noResultsTitle: document.getElementById('noResultsTitle'),
-            noResultsMessage: document.getElementById('noResultsMessage')
+            noResultsMessage: document.getElementById('noResultsMessage'),
+            loadMoreBtn: document.getElementById('loadMoreBtn')
         };
 
         // Add fade out effect
@@ -206,6 +216,7 @@ class CareerExplorer {
             if (elements.loadingText) elements.loadingText.textContent = textData.loading;
             if (elements.noResultsTitle) elements.noResultsTitle.textContent = textData.noResults;
             if (elements.noResultsMessage) elements.noResultsMessage.textContent = textData.tryDifferentSearch;
+            if (elements.loadMoreBtn) elements.loadMoreBtn.textContent = textData.loadMore;
 
             // Fade in effect
             Object.values(elements).forEach(element => {
@@ -237,12 +248,13 @@ class CareerExplorer {
     }
 
     handleSearch(query) {
+        this.searchQuery = query.trim();
         this.showLoading();
         
-        setTimeout(() => {
-            this.filterItems(query);
-            this.displayItems();
-        }, 500);
+        clearTimeout(this.searchTimer);
+        this.searchTimer = setTimeout(() => {
+            this.fetchPage();
+        }, 300);
     }
 
     // Filter Functionality
@@ -314,41 +326,105 @@ class CareerExplorer {
 
     applyFilters() {
         this.showLoading();
-        
-        setTimeout(() => {
-            this.filterItems();
-            this.displayItems();
-        }, 300);
+        this.fetchPage();
     }
 
-    filterItems(searchQuery = '') {
-        this.filteredItems = this.allItems.filter(item => {
-            // Search filter
-            if (searchQuery) {
-                const query = searchQuery.toLowerCase();
-                const matchesSearch = item.title.toLowerCase().includes(query) ||
-                                    item.description.toLowerCase().includes(query) ||
-                                    item.skills.some(skill => skill.toLowerCase().includes(query));
-                if (!matchesSearch) return false;
-            }
+    // Results come from /de/api/careers/, a page at a time
+    buildQuery(cursor = null) {
+        const params = new URLSearchParams();
+        if (this.searchQuery) {
+            params.set('q', this.searchQuery);
+        }
+        if (this.currentFilters.type === 'courses') {
+            params.append('kind', 'course');
+        } else if (this.currentFilters.type === 'jobs') {
+            params.append('kind', 'job');
+        }
+        this.currentFilters.levels.forEach(level => params.append('level', level));
+        this.currentFilters.sectors.forEach(sector => params.append('sector', sector));
+        if (cursor !== null) {
+            params.set('cursor', cursor);
+        }
+        return params;
+    }
 
-            // Type filter
-            if (this.currentFilters.type !== 'all') {
-                if (this.currentFilters.type === 'courses' && item.type !== 'course') return false;
-                if (this.currentFilters.type === 'jobs' && item.type !== 'job') return false;
+    async fetchPage(append = false) {
+        const requestId = ++this.requestId;
+        const params = this.buildQuery(append ? this.nextCursor : null);
+        try {
+            const response = await fetch(`/de/api/careers/?${params}`);
+            const data = await response.json();
+            if (requestId !== this.requestId) {
+                return;
             }
-
-            // Level filter
-            if (this.currentFilters.levels.length > 0) {
-                if (!this.currentFilters.levels.includes(item.level.toString())) return false;
+            if (!response.ok || data.status !== 'success') {
+                throw new Error(data.message || `HTTP ${response.status}`);
             }
-
-            // Sector filter
-            if (this.currentFilters.sectors.length > 0) {
-                if (!this.currentFilters.sectors.includes(item.sector)) return false;
+            this.applyPage(data, append);
+        } catch (error) {
+            if (requestId !== this.requestId) {
+                return;
             }
+            console.error('Failed to load careers:', error);
+            this.showNotification('Could not load careers. Please try again.', 'info');
+            this.displayItems();
+        }
+    }
 
-            return true;
+    applyPage(data, append = false) {
+        const items = data.results.map(item => ({ ...item, type: item.kind }));
+        if (append) {
+            this.allItems = this.allItems.concat(items);
+        } else {
+            this.allItems = items;
+            this.total = data.total;
+            this.facets = data.facets || {};
+            this.updateFacetCounts();
+        }
+        this.filteredItems = this.allItems;
+        this.nextCursor = data.next_cursor;
+        this.displayItems(append ? items : null);
+    }
+
+    loadInitialPage() {
+        const element = document.getElementById('careers-data');
+        if (element) {
+            this.applyPage(JSON.parse(element.textContent));
+        } else {
+            this.fetchPage();
+        }
+    }
+
+    setupLoadMore() {
+        const loadMoreBtn = document.getElementById('loadMoreBtn');
+        if (!loadMoreBtn) return;
+        loadMoreBtn.addEventListener('click', async () => {
+            if (this.nextCursor === null) return;
+            loadMoreBtn.disabled = true;
+            await this.fetchPage(true);
+            loadMoreBtn.disabled = false;
+        });
+    }
+
+    // Show how many results each level and sector option would give
+    updateFacetCounts() {
+        const facetInputs = {
+            level: document.querySelectorAll('input[id^="level"]'),
+            sector: document.querySelectorAll('input[id^="sector"]')
+        };
+        Object.entries(facetInputs).forEach(([facet, inputs]) => {
+            const counts = this.facets[facet] || {};
+            inputs.forEach(input => {
+                const label = input.closest('label');
+                if (!label) return;
+                let badge = label.querySelector('.facet-count');
+                if (!badge) {
+                    badge = document.createElement('span');
+                    badge.className = 'facet-count';
+                    label.appendChild(badge);
+                }
+                badge.textContent = ` (${counts[input.value] || 0})`;
+            });
         });
     }
 
@@ -376,167 +452,19 @@ class CareerExplorer {
         }, 600);
     }
 
-    // Data Generation
-    generateSampleData() {
-        this.allItems = [
-            {
-                id: 1,
-                type: 'course',
-                title: 'Software Development',
-                description: 'Learn modern software development practices',
-                level: 4,
-                sector: 'IT',
-                duration: '6 months',
-                skills: ['Programming', 'Web Development', 'Database'],
-                certification: 'NSQF Level 4',
-                icon: '💻'
-            },
-            {
-                id: 2,
-                type: 'job',
-                title: 'Software Engineer',
-                description: 'Develop and maintain software applications',
-                level: 5,
-                sector: 'IT',
-                salary: '₹5-8 LPA',
-                requirements: 'Bachelor degree',
-                skills: ['Programming', 'Problem Solving', 'Teamwork'],
-                icon: '👨‍💻'
-            },
-            {
-                id: 3,
-                type: 'course',
-                title: 'Data Analytics',
-                description: 'Master data analysis and visualization',
-                level: 5,
-                sector: 'IT',
-                duration: '1 year',
-                skills: ['Data Analysis', 'Statistics', 'Visualization'],
-                certification: 'NSQF Level 5',
-                icon: '📊'
-            },
-            {
-                id: 4,
-                type: 'job',
-                title: 'Data Scientist',
-                description: 'Analyze complex data to drive business decisions',
-                level: 6,
-                sector: 'IT',
-                salary: '₹8-12 LPA',
-                requirements: 'Master degree',
-                skills: ['Machine Learning', 'Statistics', 'Python'],
-                icon: '🔬'
-            },
-            {
-                id: 5,
-                type: 'course',
-                title: 'Digital Marketing',
-                description: 'Learn digital marketing strategies and tools',
-                level: 3,
-                sector: 'IT',
-                duration: '3 months',
-                skills: ['SEO', 'Social Media', 'Content Marketing'],
-                certification: 'NSQF Level 3',
-                icon: '📱'
-            },
-            {
-                id: 6,
-                type: 'job',
-                title: 'Digital Marketer',
-                description: 'Create and execute digital marketing campaigns',
-                level: 4,
-                sector: 'IT',
-                salary: '₹3-5 LPA',
-                requirements: 'High school diploma',
-                skills: ['Marketing', 'Analytics', 'Creativity'],
-                icon: '📈'
-            },
-            {
-                id: 7,
-                type: 'course',
-                title: 'Cybersecurity',
-                description: 'Protect systems and networks from cyber threats',
-                level: 6,
-                sector: 'IT',
-                duration: '1 year',
-                skills: ['Security', 'Networking', 'Ethical Hacking'],
-                certification: 'NSQF Level 6',
-                icon: '🔒'
-            },
-            {
-                id: 8,
-                type: 'job',
-                title: 'Cybersecurity Analyst',
-                description: 'Monitor and protect against security threats',
-                level: 7,
-                sector: 'IT',
-                salary: '₹12-20 LPA',
-                requirements: 'Professional experience',
-                skills: ['Security Analysis', 'Risk Assessment', 'Incident Response'],
-                icon: '🛡️'
-            },
-            {
-                id: 9,
-                type: 'course',
-                title: 'Cloud Computing',
-                description: 'Master cloud platforms and services',
-                level: 5,
-                sector: 'IT',
-                duration: '6 months',
-                skills: ['AWS', 'Azure', 'DevOps'],
-                certification: 'NSQF Level 5',
-                icon: '☁️'
-            },
-            {
-                id: 10,
-                type: 'job',
-                title: 'Cloud Architect',
-                description: 'Design and implement cloud solutions',
-                level: 8,
-                sector: 'IT',
-                salary: '₹20+ LPA',
-                requirements: 'Master degree',
-                skills: ['Cloud Architecture', 'System Design', 'Leadership'],
-                icon: '🏗️'
-            },
-            {
-                id: 11,
-                type: 'course',
-                title: 'AI & Machine Learning',
-                description: 'Build intelligent systems and algorithms',
-                level: 7,
-                sector: 'IT',
-                duration: '2 years',
-                skills: ['Machine Learning', 'Deep Learning', 'Python'],
-                certification: 'NSQF Level 7',
-                icon: '🤖'
-            },
-            {
-                id: 12,
-                type: 'job',
-                title: 'AI Engineer',
-                description: 'Develop AI solutions and machine learning models',
-                level: 9,
-                sector: 'IT',
-                salary: '₹20+ LPA',
-                requirements: 'PhD preferred',
-                skills: ['AI Research', 'Model Development', 'Algorithm Design'],
-                icon: '🧠'
-            }
-        ];
-
-        this.filteredItems = [...this.allItems];
-    }
-
     // Display Items
-    displayItems() {
+    displayItems(appended = null) {
         const cardsGrid = document.getElementById('cardsGrid');
         const loadingIndicator = document.getElementById('loadingIndicator');
         const noResults = document.getElementById('noResults');
         const resultsCount = document.getElementById('resultsCount');
+        const loadMoreContainer = document.getElementById('loadMoreContainer');
 
         // Hide loading
         loadingIndicator.classList.remove('show');
+        if (loadMoreContainer) {
+            loadMoreContainer.hidden = this.nextCursor === null;
+        }
 
         if (this.filteredItems.length === 0) {
             cardsGrid.classList.remove('show');
@@ -544,11 +472,13 @@ class CareerExplorer {
             resultsCount.textContent = '0 results';
         } else {
             noResults.classList.remove('show');
-            resultsCount.textContent = `${this.filteredItems.length} results`;
+            resultsCount.textContent = `${this.total} results`;
             
-            // Generate cards
-            cardsGrid.innerHTML = '';
-            this.filteredItems.forEach(item => {
+            // Generate cards; a "load more" page only adds its own
+            if (!appended) {
+                cardsGrid.innerHTML = '';
+            }
+            (appended || this.filteredItems).forEach(item => {
                 const card = this.createCard(item);
                 cardsGrid.appendChild(card);
             });
@@ -883,12 +813,15 @@ class CareerExplorer {
 
     // Utility Functions
     loadLanguageData() {
-        // Initialize with English language data
-        const englishOption = document.querySelector('.lang-option[data-lang="en"]');
-        if (englishOption) {
-            this.currentLanguageData = JSON.parse(englishOption.dataset.text);
-            // Initialize the page with English text
-            this.updateTextContent(this.currentLanguageData);
+        // Initialize with the language the page was rendered in
+        const textData = this.i18n.current();
+        if (textData) {
+            if (this.i18n.language === 'en') {
+                this.currentLanguageData = textData;
+                this.updateTextContent(this.currentLanguageData);
+            } else {
+                this.changeLanguage(this.i18n.language, textData);
+            }
         }
         console.log('Language data loaded');
     }
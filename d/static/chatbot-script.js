@@ -368,13 +368,9 @@ if (currentLang) {
     }
 
     simulateBotResponse(userMessage) {
-        // Show typing indicator
+        // The typing indicator stays up until the server's answer arrives
         this.showTypingIndicator();
-        
-        setTimeout(() => {
-            this.hideTypingIndicator();
-            this.generateBotResponse(userMessage);
-        }, 1500 + Math.random() * 1000);
+        this.generateBotResponse(userMessage);
     }
 
     showTypingIndicator() {
@@ -405,24 +401,58 @@ if (currentLang) {
         }
         this.isTyping = false;
     }
-generateBotResponse(userMessage) {
-    fetch("/de/chatbot-response/?message=" + 
-          encodeURIComponent(userMessage) + 
-          "&lang=" + encodeURIComponent(this.currentLanguage))
-        .then(response => {
-            if (!response.ok) {
-                throw new Error(`HTTP error! Status: ${response.status}`);
-            }
-            return response.json();
-        })
-        .then(data => {
+    generateBotResponse(userMessage) {
+        const query = "?message=" + encodeURIComponent(userMessage) +
+                      "&lang=" + encodeURIComponent(this.currentLanguage);
+
+        if (!window.EventSource) {
+            this.fetchBotResponse(query);
+            return;
+        }
+
+        // Stream the reply so an exact hit shows up without waiting for fuzzy matching
+        const source = new EventSource("/de/chatbot-stream/" + query);
+        let answered = false;
+
+        source.addEventListener("answer", (e) => {
+            const data = JSON.parse(e.data);
+            answered = true;
+            this.hideTypingIndicator();
             this.addBotMessage(data.response || "⚠️ No response found.");
-        })
-        .catch(err => {
+        });
+        source.addEventListener("failure", (e) => {
+            answered = true;
+            this.hideTypingIndicator();
             this.addBotMessage("❌ Server error, please try again later.");
-            console.error("Chatbot error:", err);
+            console.error("Chatbot error:", JSON.parse(e.data).error);
         });
-}
+        source.addEventListener("done", () => source.close());
+        source.onerror = () => {
+            source.close();
+            if (!answered) {
+                this.fetchBotResponse(query);
+            }
+        };
+    }
+
+    fetchBotResponse(query) {
+        fetch("/de/chatbot-response/" + query)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`HTTP error! Status: ${response.status}`);
+                }
+                return response.json();
+            })
+            .then(data => {
+                this.hideTypingIndicator();
+                this.addBotMessage(data.response || "⚠️ No response found.");
+            })
+            .catch(err => {
+                this.hideTypingIndicator();
+                this.addBotMessage("❌ Server error, please try again later.");
+                console.error("Chatbot error:", err);
+            });
+    }
 
     createRippleEffect(e, element) {
         const ripple = document.createElement('span');
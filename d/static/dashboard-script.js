@@ -22,25 +22,13 @@ class LearnerDashboard {
         this.applyLanguage(this.currentLanguage);
     }
 loadTranslationsFromDOM() {
-        // Load translations from a script tag in the template
-        const translationsElement = document.getElementById('translations-data');
-        if (translationsElement && translationsElement.textContent.trim()) {
-            const content = translationsElement.textContent.trim();
-            
-            // Check if content is "undefined" string or empty
-            if (content === 'undefined' || content === '') {
-                console.log('Translation data is undefined, using fallback');
-                return this.getFallbackTranslations();
-            }
-            
-            try {
-                const parsed = JSON.parse(content);
-                console.log('Translations loaded from backend:', Object.keys(parsed));
-                return parsed;
-            } catch (e) {
-                console.warn('Failed to parse translations from backend:', e);
-                console.log('Content was:', content);
-            }
+        // The backend embeds only the active language; the others are
+        // fetched by loadLanguage() when the user switches.
+        this.i18n = new I18nStrings();
+        const current = this.i18n.current();
+        if (current) {
+            console.log('Translations loaded from backend:', this.i18n.language);
+            return { [this.i18n.language]: current };
         }
         
         console.log('Using fallback translations');
@@ -172,7 +160,17 @@ loadTranslationsFromDOM() {
         button.setAttribute('aria-expanded', 'false');
     }
 
+    async loadLanguage(lang) {
+        if (!this.allTranslations[lang]) {
+            const loaded = await this.i18n.load(lang);
+            const fallback = loaded ? null : this.getFallbackTranslations();
+            this.allTranslations[lang] = loaded || fallback[lang] || fallback['en'];
+        }
+        return this.allTranslations[lang];
+    }
+
     async changeLanguage(lang) {
+        const translationsLoaded = this.loadLanguage(lang);
         try {
             // Send language change to backend
             const response = await fetch('/de/change-language/', {
@@ -188,7 +186,7 @@ loadTranslationsFromDOM() {
             
             if (data.status === 'success') {
                 this.currentLanguage = lang;
-                this.currentLanguageData = this.allTranslations[lang] || this.allTranslations['en'];
+                this.currentLanguageData = await translationsLoaded;
                 
                 this.applyLanguage(lang);
                 this.announceToScreenReader(`Language changed to ${this.getLangName(lang)}`);
@@ -200,13 +198,13 @@ loadTranslationsFromDOM() {
             console.error('Language change error:', error);
             // Still apply frontend changes even if backend fails
             this.currentLanguage = lang;
-            this.currentLanguageData = this.allTranslations[lang] || this.allTranslations['en'];
+            this.currentLanguageData = await translationsLoaded;
             this.applyLanguage(lang);
         }
     }
 
     applyLanguage(lang) {
-        const textData = this.allTranslations[lang] || this.allTranslations['en'];
+        const textData = this.allTranslations[lang] || this.currentLanguageData;
         
         // Update current language display
         const currentLangElement = document.querySelector('.current-lang');
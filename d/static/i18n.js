@@ -0,0 +1,60 @@
+// UI strings for the current page.
+//
+// The page embeds its strings in the active language as
+//   <script id="i18n-data" type="application/json" data-page data-lang data-version>
+// Other languages come from /de/api/i18n/<lang>/<version>/, which holds every
+// page's strings for that language. The version changes whenever a string
+// does, so the browser caches each of those responses for good and a
+// language switch costs at most one fetch.
+class I18nStrings {
+    constructor(elementId = 'i18n-data') {
+        const element = document.getElementById(elementId);
+        this.page = element ? element.dataset.page : null;
+        this.version = element ? element.dataset.version : null;
+        this.language = element ? element.dataset.lang : 'en';
+        this.strings = {};
+        this.pending = {};
+        if (element && element.textContent.trim()) {
+            this.strings[this.language] = JSON.parse(element.textContent);
+        }
+    }
+
+    current() {
+        return this.strings[this.language];
+    }
+
+    url(lang) {
+        return `/de/api/i18n/${encodeURIComponent(lang)}/${this.version}/`;
+    }
+
+    // Resolves to the page's strings in `lang`, or null if they could not be loaded.
+    async load(lang) {
+        if (this.strings[lang]) {
+            return this.strings[lang];
+        }
+        if (!this.version) {
+            return null;
+        }
+        if (!this.pending[lang]) {
+            this.pending[lang] = fetch(this.url(lang))
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP ${response.status}`);
+                    }
+                    return response.json();
+                })
+                .then(bundle => {
+                    this.strings[lang] = bundle[this.page] || null;
+                    return this.strings[lang];
+                })
+                .catch(error => {
+                    console.error(`Failed to load ${lang} strings:`, error);
+                    return null;
+                })
+                .finally(() => {
+                    delete this.pending[lang];
+                });
+        }
+        return this.pending[lang];
+    }
+}
@@ -1,6 +1,7 @@
 // Profile Builder - Interactive JavaScript
 class ProfileBuilder {
     constructor() {
+        this.i18n = new I18nStrings();
         this.currentLanguage = 'en';
         this.currentLanguageData = null;
         this.currentStep = 1;
@@ -17,6 +18,9 @@ class ProfileBuilder {
             preferences: ''
         };
         this.autoSaveTimeout = null;
+        // Lowercased suggestion labels and names -> canonical skill name
+        this.knownSkills = new Map();
+        this.suggestTimeout = null;
         
         this.init();
     }
@@ -96,13 +100,15 @@ saveLanguagePreference(lang) {
 
         // Handle language selection
         langOptions.forEach(option => {
-            option.addEventListener('click', (e) => {
+            option.addEventListener('click', async (e) => {
                 e.preventDefault();
                 const selectedLang = option.dataset.lang;
-                const textData = JSON.parse(option.dataset.text);
-                
-                this.changeLanguage(selectedLang, textData);
                 this.closeDropdown(languageDropdown, languageBtn);
+                
+                const textData = await this.i18n.load(selectedLang);
+                if (textData) {
+                    this.changeLanguage(selectedLang, textData);
+                }
             });
         });
 
@@ -555,15 +561,80 @@ saveLanguagePreference(lang) {
                 this.addSkill();
             }
         });
+
+        skillInput.addEventListener('input', () => {
+            clearTimeout(this.suggestTimeout);
+            this.suggestTimeout = setTimeout(() => {
+                this.loadSkillSuggestions(skillInput.value);
+            }, 150);
+        });
+    }
+
+    // Suggest known skills for the last comma-separated part of the input
+    async loadSkillSuggestions(value) {
+        const query = value.split(',').pop().trim();
+        if (!query) {
+            this.showSkillSuggestions([]);
+            return;
+        }
+        try {
+            const params = new URLSearchParams({ q: query, lang: this.currentLanguage });
+            const response = await fetch(`/de/api/skills/suggest/?${params}`);
+            const data = await response.json();
+            if (data.status === 'success') {
+                data.suggestions.forEach(suggestion => {
+                    this.knownSkills.set(suggestion.name.toLowerCase(), suggestion.name);
+                    this.knownSkills.set(suggestion.label.toLowerCase(), suggestion.name);
+                });
+                this.showSkillSuggestions(data.suggestions);
+            }
+        } catch (error) {
+            console.error('Failed to load skill suggestions:', error);
+        }
+    }
+
+    showSkillSuggestions(suggestions) {
+        const datalist = document.getElementById('skillSuggestions');
+        if (!datalist) return;
+
+        datalist.innerHTML = '';
+        suggestions.forEach(suggestion => {
+            const option = document.createElement('option');
+            option.value = suggestion.label;
+            if (suggestion.label !== suggestion.name) {
+                option.label = suggestion.name;
+            }
+            datalist.appendChild(option);
+        });
+    }
+
+    // The canonical name of a suggested skill typed in any language or case
+    canonicalSkill(skill) {
+        return this.knownSkills.get(skill.toLowerCase()) || skill;
     }
 
     addSkill() {
         const skillInput = document.getElementById('skillInput');
-        const skill = skillInput.value.trim();
+        const skills = skillInput.value
+            .split(',')
+            .map(skill => skill.trim())
+            .filter(skill => skill)
+            .map(skill => this.canonicalSkill(skill));
         
-        if (skill && !this.formData.skills.includes(skill)) {
-            this.formData.skills.push(skill);
+        let added = false;
+        skills.forEach(skill => {
+            const known = this.formData.skills.some(s => s.toLowerCase() === skill.toLowerCase());
+            if (!known) {
+                this.formData.skills.push(skill);
+                added = true;
+            }
+        });
+
+        if (skills.length) {
             skillInput.value = '';
+            this.showSkillSuggestions([]);
+        }
+        if (added) {
             this.updateSkillsDisplay();
             this.triggerAutoSave();
         }
@@ -744,11 +815,9 @@ async loadProfile() {
         console.error('Error loading profile:', error);
     }
 }
-setLanguageFromBackend(lang) {
-    // Find the language option element
-    const langOption = document.querySelector(`.lang-option[data-lang="${lang}"]`);
-    if (langOption) {
-        const textData = JSON.parse(langOption.dataset.text);
+async setLanguageFromBackend(lang) {
+    const textData = await this.i18n.load(lang);
+    if (textData) {
         this.changeLanguage(lang, textData);
     }
 }
@@ -976,12 +1045,15 @@ showErrorModal(message) {
 
     // Utility Functions
     loadLanguageData() {
-        // Initialize with English language data
-        const englishOption = document.querySelector('.lang-option[data-lang="en"]');
-        if (englishOption) {
-            this.currentLanguageData = JSON.parse(englishOption.dataset.text);
-            // Initialize the page with English text
-            this.updateTextContent(this.currentLanguageData);
+        // Initialize with the language the page was rendered in
+        const textData = this.i18n.current();
+        if (textData) {
+            if (this.i18n.language === 'en') {
+                this.currentLanguageData = textData;
+                this.updateTextContent(this.currentLanguageData);
+            } else {
+                this.changeLanguage(this.i18n.language, textData);
+            }
         }
         console.log('Language data loaded');
     }
@@ -1,6 +1,7 @@
 // Recommendation Viewer - Interactive JavaScript
 class RecommendationViewer {
     constructor() {
+        this.i18n = new I18nStrings();
         this.currentLanguage = 'en';
         this.currentLanguageData = null;
         this.skills = [];
@@ -17,7 +18,7 @@ class RecommendationViewer {
         this.setupAccessibility();
         this.setupHeaderActions();
         this.loadLanguageData();
-        this.generateSampleData();
+        this.loadRecommendations();
         this.renderAll();
     }
 
@@ -35,13 +36,15 @@ class RecommendationViewer {
 
         // Handle language selection
         langOptions.forEach(option => {
-            option.addEventListener('click', (e) => {
+            option.addEventListener('click', async (e) => {
                 e.preventDefault();
                 const selectedLang = option.dataset.lang;
-                const textData = JSON.parse(option.dataset.text);
-                
-                this.changeLanguage(selectedLang, textData);
                 this.closeDropdown(languageDropdown, languageBtn);
+                
+                const textData = await this.i18n.load(selectedLang);
+                if (textData) {
+                    this.changeLanguage(selectedLang, textData);
+                }
             });
         });
 
@@ -233,215 +236,81 @@ class RecommendationViewer {
     }
 
     // Data Generation
-    generateSampleData() {
-        this.skills = [
-            {
-                id: 1,
-                title: 'Programming Fundamentals',
-                icon: '💻',
-                level: 'Beginner',
-                time: '2 weeks',
-                prerequisites: 'Basic computer knowledge',
-                resources: 'Online tutorials',
-                progress: 100,
-                completed: true,
-                current: false
-            },
-            {
-                id: 2,
-                title: 'Data Structures & Algorithms',
-                icon: '📊',
-                level: 'Intermediate',
-                time: '1 month',
-                prerequisites: 'Programming fundamentals',
-                resources: 'Coding bootcamp',
-                progress: 80,
-                completed: false,
-                current: true
-            },
-            {
-                id: 3,
-                title: 'Web Development',
-                icon: '🌐',
-                level: 'Intermediate',
-                time: '2 months',
-                prerequisites: 'Web development basics',
-                resources: 'Project practice',
-                progress: 60,
-                completed: false,
-                current: false
-            },
-            {
-                id: 4,
-                title: 'Database Management',
-                icon: '🗄️',
-                level: 'Intermediate',
-                time: '1 month',
-                prerequisites: 'Database concepts',
-                resources: 'Database courses',
-                progress: 40,
-                completed: false,
-                current: false
-            },
-            {
-                id: 5,
-                title: 'API Development',
-                icon: '🔌',
-                level: 'Advanced',
-                time: '2 months',
-                prerequisites: 'API understanding',
-                resources: 'API documentation',
-                progress: 20,
-                completed: false,
-                current: false
-            },
-            {
-                id: 6,
-                title: 'Cloud Computing',
-                icon: '☁️',
-                level: 'Advanced',
-                time: '3 months',
-                prerequisites: 'Cloud basics',
-                resources: 'Cloud platforms',
-                progress: 0,
-                completed: false,
-                current: false
-            },
-            {
-                id: 7,
-                title: 'DevOps',
-                icon: '⚙️',
-                level: 'Expert',
-                time: '3 months',
-                prerequisites: 'System administration',
-                resources: 'DevOps tools',
-                progress: 0,
-                completed: false,
-                current: false
-            },
-            {
-                id: 8,
-                title: 'Machine Learning',
-                icon: '🤖',
-                level: 'Expert',
-                time: '6 months',
-                prerequisites: 'Statistics knowledge',
-                resources: 'ML frameworks',
-                progress: 0,
-                completed: false,
-                current: false
-            }
-        ];
+    // Recommendations are scored on the server from the learner's profile
+    // skills and embedded in the page as #recommendations-data.
+    loadRecommendations() {
+        const element = document.getElementById('recommendations-data');
+        const recommendations = element ? JSON.parse(element.textContent) : [];
+
+        if (recommendations.length === 0) {
+            this.skills = [];
+            this.milestones = [];
+            this.nextSteps = [{
+                id: 'profile',
+                title: 'Add your skills',
+                icon: '📝',
+                description: 'Add skills to your profile to get career recommendations',
+                action: 'Continue Learning',
+                url: '/de/learner-dashboard/profile-builder/'
+            }];
+            return;
+        }
 
-        this.milestones = [
-            {
-                id: 1,
-                title: 'Complete Basic Programming',
-                icon: '🎯',
-                description: 'Master fundamental programming concepts',
-                progress: 100,
-                completed: true,
-                current: false
-            },
-            {
-                id: 2,
-                title: 'Build First Web App',
-                icon: '🚀',
-                description: 'Create a complete web application',
-                progress: 60,
-                completed: false,
-                current: true
-            },
-            {
-                id: 3,
-                title: 'Deploy to Cloud',
-                icon: '☁️',
-                description: 'Deploy applications to cloud platforms',
-                progress: 20,
-                completed: false,
-                current: false
-            },
-            {
-                id: 4,
-                title: 'Master Full Stack',
-                icon: '🏗️',
-                description: 'Become proficient in full-stack development',
-                progress: 0,
-                completed: false,
-                current: false
-            },
-            {
-                id: 5,
-                title: 'Become Senior Developer',
-                icon: '👑',
-                description: 'Lead development teams and projects',
-                progress: 0,
-                completed: false,
-                current: false
-            }
+        // Roadmap: the best match's skills, the ones the learner has first
+        const best = recommendations[0];
+        const roadmap = [
+            ...best.matched_skills.map(title => ({ title, completed: true })),
+            ...best.missing_skills.map(title => ({ title, completed: false }))
         ];
+        const firstMissing = roadmap.findIndex(skill => !skill.completed);
+        this.skills = roadmap.map((skill, index) => ({
+            id: index + 1,
+            title: skill.title,
+            icon: best.icon,
+            level: this.levelName(best.level),
+            time: best.duration,
+            prerequisites: index > 0 ? roadmap[index - 1].title : 'Basic computer knowledge',
+            resources: best.title,
+            progress: skill.completed ? 100 : 0,
+            completed: skill.completed,
+            current: index === firstMissing
+        }));
+
+        // Milestones: each recommended career, by how many of its skills the learner has
+        let currentSet = false;
+        this.milestones = recommendations.slice(0, 5).map(item => {
+            const total = item.matched_skills.length + item.missing_skills.length;
+            const progress = total ? Math.round(100 * item.matched_skills.length / total) : 0;
+            const completed = progress === 100;
+            const current = !completed && !currentSet;
+            currentSet = currentSet || current;
+            return {
+                id: item.id,
+                title: item.title,
+                icon: item.icon,
+                description: item.description,
+                progress,
+                completed,
+                current
+            };
+        });
 
-        this.achievements = [
-            {
-                id: 1,
-                title: 'Code Warrior',
-                icon: '⚔️',
-                description: 'Complete 100 coding challenges',
-                unlocked: true
-            },
-            {
-                id: 2,
-                title: 'Web Wizard',
-                icon: '🧙‍♂️',
-                description: 'Build 5 web applications',
-                unlocked: true
-            },
-            {
-                id: 3,
-                title: 'Cloud Master',
-                icon: '☁️',
-                description: 'Deploy 3 applications to cloud',
-                unlocked: false
-            },
-            {
-                id: 4,
-                title: 'Full Stack Hero',
-                icon: '🦸‍♂️',
-                description: 'Master both frontend and backend',
-                unlocked: false
-            },
-            {
-                id: 5,
-                title: 'Tech Leader',
-                icon: '👑',
-                description: 'Lead a development team',
-                unlocked: false
-            }
-        ];
+        this.nextSteps = recommendations.slice(0, 3).map(item => ({
+            id: item.id,
+            title: item.title,
+            icon: item.icon,
+            description: item.missing_skills.length
+                ? `Learn ${item.missing_skills.join(', ')}`
+                : item.description,
+            action: item.kind === 'course' ? 'Continue Learning' : 'Join Now'
+        }));
+    }
 
-        this.nextSteps = [
-            {
-                id: 1,
-                title: 'Complete Data Structures Course',
-                icon: '📚',
-                description: 'Finish the current data structures and algorithms course',
-                action: 'Continue Learning'
-            },
-            {
-                id: 2,
-                title: 'Build Portfolio Project',
-                icon: '💼',
-                description: 'Create a comprehensive portfolio project',
-                action: 'Start Project'
-            },
-            {
-                id: 3,
-                title: 'Join Developer Community',
-                icon: '👥',
-                description: 'Connect with other developers and mentors',
-                action: 'Join Now'
-            }
-        ];
+    levelName(level) {
+        if (level <= 3) return 'Beginner';
+        if (level <= 5) return 'Intermediate';
+        if (level <= 7) return 'Advanced';
+        return 'Expert';
     }
 
     // Rendering Functions
@@ -651,7 +520,9 @@ class RecommendationViewer {
 
     handleStepAction(stepId) {
         const step = this.nextSteps.find(s => s.id == stepId);
-        if (step) {
+        if (step && step.url) {
+            window.location.href = step.url;
+        } else if (step) {
             this.showNotification(step.action, 'info');
         }
     }
@@ -962,12 +833,15 @@ class RecommendationViewer {
 
     // Utility Functions
     loadLanguageData() {
-        // Initialize with English language data
-        const englishOption = document.querySelector('.lang-option[data-lang="en"]');
-        if (englishOption) {
-            this.currentLanguageData = JSON.parse(englishOption.dataset.text);
-            // Initialize the page with English text
-            this.updateTextContent(this.currentLanguageData);
+        // Initialize with the language the page was rendered in
+        const textData = this.i18n.current();
+        if (textData) {
+            if (this.i18n.language === 'en') {
+                this.currentLanguageData = textData;
+                this.updateTextContent(this.currentLanguageData);
+            } else {
+                this.changeLanguage(this.i18n.language, textData);
+            }
         }
         console.log('Language data loaded');
     }